@@ -0,0 +1 @@
+"""Benchmarks for the Textporter pipeline; see benchmarks.run."""
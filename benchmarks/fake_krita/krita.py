@@ -0,0 +1,257 @@
+"""
+Stand-in for Krita's `krita` module, so the docker code can run outside
+Krita. Only the calls Textporter makes are provided. Every call is counted
+in CALLS, and the SVG handed to addShapesFromSvg is totalled in SVG_BYTES,
+so a benchmark can report how much work it asked of Krita.
+
+Saved documents are text files listing their top-level layers, enough for
+openDocument to read them back.
+
+Put this folder first on sys.path (see benchmarks.run.install_fake_krita).
+"""
+import re
+import uuid
+from collections import Counter
+
+from PyQt5.QtCore import QPointF
+from PyQt5.QtWidgets import QDockWidget
+
+
+CALLS = Counter()
+SVG_BYTES = Counter()
+
+
+def reset_calls():
+    CALLS.clear()
+    SVG_BYTES.clear()
+
+
+class Shape:
+    def __init__(self, name, layer, position=None):
+        self._name = name
+        self.layer = layer
+        self._position = position or QPointF()
+
+    def name(self):
+        return self._name
+
+    def position(self):
+        return self._position
+
+    def setPosition(self, position):
+        self._position = position
+
+    def remove(self):
+        CALLS["Shape.remove"] += 1
+        self.layer.shape_list.remove(self)
+        return True
+
+
+class Node:
+    def __init__(self, name, node_type):
+        self._name = name
+        self._type = node_type
+        self.children = []
+        self.shape_list = []
+        self.parent = None
+        self.unique_id = uuid.uuid4()
+
+    def uniqueId(self):
+        return self.unique_id
+
+    def name(self):
+        return self._name
+
+    def setName(self, name):
+        self._name = name
+
+    def type(self):
+        return self._type
+
+    def childNodes(self):
+        return list(self.children)
+
+    def parentNode(self):
+        return self.parent
+
+    def addChildNode(self, child, above):
+        CALLS["addChildNode"] += 1
+        if above is None:
+            self.children.insert(0, child)
+        else:
+            self.children.insert(self.children.index(above) + 1, child)
+        child.parent = self
+        return True
+
+    def remove(self):
+        CALLS["remove"] += 1
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+        return True
+
+    def addShapesFromSvg(self, svg):
+        CALLS["addShapesFromSvg"] += 1
+        SVG_BYTES["addShapesFromSvg"] += len(svg)
+        # One shape per text element, named by its id and placed at its x and y as Krita does
+        shapes = [Shape(name, self, QPointF(float(x), float(y)))
+                  for name, x, y in re.findall(r'<text(?: id="([^"]*)")? x="([^"]*)" y="([^"]*)"', svg)]
+        self.shape_list.extend(shapes)
+        return shapes
+
+    def shapes(self):
+        return list(self.shape_list)
+
+
+class Document:
+    def __init__(self, width=2480, height=3508, name="Untitled", file_name=""):
+        self._width = width
+        self._height = height
+        self._name = name
+        self._file_name = file_name
+        self._batchmode = False
+        self.root = Node("root", "grouplayer")
+        self.active_node = None
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def name(self):
+        return self._name
+
+    def rootNode(self):
+        return self.root
+
+    def nodeByUniqueID(self, unique_id):
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            if node.unique_id == unique_id:
+                return node
+            nodes.extend(node.children)
+        return None
+
+    def createVectorLayer(self, name):
+        CALLS["createVectorLayer"] += 1
+        return Node(name, "vectorlayer")
+
+    def createGroupLayer(self, name):
+        CALLS["createGroupLayer"] += 1
+        return Node(name, "grouplayer")
+
+    def setActiveNode(self, node):
+        CALLS["setActiveNode"] += 1
+        self.active_node = node
+
+    def activeNode(self):
+        return self.active_node
+
+    def refreshProjection(self):
+        CALLS["refreshProjection"] += 1
+
+    def fileName(self):
+        return self._file_name
+
+    def batchmode(self):
+        return self._batchmode
+
+    def setBatchmode(self, value):
+        CALLS["setBatchmode"] += 1
+        self._batchmode = value
+
+    def waitForDone(self):
+        CALLS["waitForDone"] += 1
+
+    def save(self):
+        CALLS["save"] += 1
+        return self.write(self._file_name)
+
+    def saveAs(self, file_name):
+        CALLS["saveAs"] += 1
+        self._file_name = file_name
+        return self.write(file_name)
+
+    def write(self, file_name):
+        with open(file_name, "w", encoding="utf-8") as file:
+            file.write(f"{self._width} {self._height}\n")
+            for node in self.root.children:
+                file.write(f"{node.type()}\t{node.name()}\n")
+        return True
+
+    def close(self):
+        CALLS["close"] += 1
+        krita = Krita.instance()
+        if self in krita._documents:
+            krita._documents.remove(self)
+        if krita.active_document is self:
+            krita.active_document = None
+        return True
+
+
+class Krita:
+    _instance = None
+
+    def __init__(self):
+        self._documents = []
+        self.active_document = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def activeDocument(self):
+        return self.active_document
+
+    def documents(self):
+        return list(self._documents)
+
+    def setActiveDocument(self, document):
+        if document not in self._documents:
+            self._documents.append(document)
+        self.active_document = document
+
+    def createDocument(self, width, height, name, color_model, color_depth, profile, resolution):
+        CALLS["createDocument"] += 1
+        document = Document(width, height, name)
+        self._documents.append(document)
+        return document
+
+    def openDocument(self, file_name):
+        CALLS["openDocument"] += 1
+        try:
+            with open(file_name, encoding="utf-8") as file:
+                width, height = map(int, file.readline().split())
+                layers = [line.rstrip("\n").split("\t", 1) for line in file]
+        except (OSError, ValueError):
+            return None
+        document = Document(width, height, file_name, file_name)
+        for node_type, name in layers:
+            node = Node(name, node_type)
+            document.root.children.append(node)
+            node.parent = document.root
+        self._documents.append(document)
+        return document
+
+    def addDockWidgetFactory(self, factory):
+        pass
+
+
+class DockWidget(QDockWidget):
+    def canvasChanged(self, canvas):
+        pass
+
+
+class DockWidgetFactoryBase:
+    DockRight = 1
+
+
+class DockWidgetFactory:
+    def __init__(self, docker_id, position, docker_class):
+        self.docker_id = docker_id
+        self.position = position
+        self.docker_class = docker_class
@@ -0,0 +1,229 @@
+"""
+Benchmarks for the Textporter import pipeline, runnable without Krita.
+
+    python -m benchmarks --pages 200 --lines 40 --cast 30 [--profile screenplay] [-j 4] [--json out.json]
+
+A synthetic script is generated (see benchmarks.synthetic_script), then
+each stage is timed on it: text extraction, speaker parsing, style
+resolution, SVG building, and layer insertion through the docker's
+PluginUIWidget against the stub krita module in benchmarks/fake_krita.
+Each stage reports its best time over --repeat runs, its throughput and
+the peak Python memory it allocated (from one extra run under tracemalloc).
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+FAKE_KRITA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_krita")
+
+
+def install_fake_krita():
+    """Make `import krita` load the stub. Must run before textporter is imported."""
+    if FAKE_KRITA_DIR not in sys.path:
+        sys.path.insert(0, FAKE_KRITA_DIR)
+    import krita
+    return krita
+
+
+def measure(run, repeat):
+    """
+    Time run() `repeat` times, then once more under tracemalloc.
+
+    :param run: Callable returning the number of items it processed
+    :return: (items, best seconds, peak bytes)
+    """
+    best = None
+    items = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return items, best, peak
+
+
+class Pipeline:
+    """The state shared by the stages: one script, loaded once per stage as needed."""
+
+    def __init__(self, pdf_file, profile, workers):
+        import textporter
+        from textporter.pdf_session import PdfSession
+        from textporter.styles import load_styles
+        self.pdf_file = pdf_file
+        self.profile = profile
+        self.workers = workers
+        self.styles = load_styles(os.path.join(os.path.dirname(textporter.__file__), "settings.ini"))
+        # A loaded session, for the stages after extraction
+        self.session = PdfSession(pdf_file, profile=profile)
+        self.session.prefetch(workers=workers)
+        self.page_list = list(range(1, self.session.page_count + 1))
+        self.dialogues_by_page = None
+
+    def extract(self):
+        from textporter.pdf_session import PdfSession
+        with PdfSession(self.pdf_file, profile=self.profile) as session:
+            session.prefetch(workers=self.workers)
+            return session.page_count
+
+    def extract_layout(self):
+        """Read and parse every page with its layout in one pass, as "Place at script positions" does."""
+        from textporter.pdf_session import PdfSession
+        from textporter.script_parser import build_dialogue_index
+        with PdfSession(self.pdf_file, profile=self.profile) as session:
+            index = build_dialogue_index(session, self.page_list, layout=True)
+            return sum(len(dialogues) for dialogues in index.values())
+
+    def parse(self):
+        from textporter.revisions import build_revision
+        self.session.page_records.clear()
+        revision = build_revision(self.session)
+        return len(revision.store)
+
+    def resolve_styles(self):
+        from textporter.script_parser import build_dialogue_index
+        if self.dialogues_by_page is None:
+            self.dialogues_by_page = build_dialogue_index(self.session, self.page_list)
+            # Give half the cast a style of their own; the rest fall back to default
+            for name in sorted({d.name for ds in self.dialogues_by_page.values() for d in ds})[::2]:
+                self.styles.setdefault(name, dict(self.styles["default"], size=24))
+        from textporter.style_templates import StyleTemplates
+        # As at the start of an insertion: every speaker resolved once, then reused per line
+        self.templates = StyleTemplates(self.styles)
+        lines = 0
+        for dialogues in self.dialogues_by_page.values():
+            for dialogue in dialogues:
+                self.templates.resolve(dialogue.name)
+                lines += 1
+        return lines
+
+    def build_svg(self):
+        from textporter.svg_builder import build_page_svg
+        self.resolve_styles()
+        self.svg_bytes = 0
+        for dialogues in self.dialogues_by_page.values():
+            self.svg_bytes += len(build_page_svg(dialogues, self.styles, 2480, 3508, templates=self.templates).to_svg())
+        return len(self.dialogues_by_page)
+
+    def build_wrapped_svg(self):
+        """build_svg with every line wrapped to a 400 px balloon. Needs the QApplication of DockerBench."""
+        from textporter.svg_builder import build_page_svg
+        from textporter.text_wrap import TextWrapper
+        self.resolve_styles()
+        wrapper = TextWrapper()
+        for dialogues in self.dialogues_by_page.values():
+            build_page_svg(dialogues, self.styles, 2480, 3508, wrapper=wrapper, wrap_width=400,
+                           templates=self.templates).to_svg()
+        return len(self.dialogues_by_page)
+
+
+class DockerBench:
+    """Drives PluginUIWidget.insert_dialogue_layers against a fake document."""
+
+    def __init__(self, pipeline):
+        from PyQt5.QtCore import QStandardPaths
+        from PyQt5.QtWidgets import QApplication
+        from textporter.importer import load_script
+        from textporter import textporter
+        # Keep the extraction cache and other app data out of the real user folders
+        QStandardPaths.setTestModeEnabled(True)
+        self.app = QApplication.instance() or QApplication(["textporter-benchmarks"])
+        ui_file = os.path.join(os.path.dirname(textporter.__file__), "Textporter.ui")
+        self.widget = textporter.PluginUIWidget(ui_file)
+        self.widget.extraction_cache = None
+        self.widget.apply_loaded_script(load_script(pipeline.pdf_file, profile=pipeline.profile))
+        self.widget.lineEdit.setText(f"1-{pipeline.session.page_count}")
+        pipeline.resolve_styles()
+        self.dialogues_by_page = pipeline.dialogues_by_page
+
+    def insert(self):
+        import krita
+        from PyQt5.QtCore import QEventLoop
+        document = krita.Document(name="benchmark")
+        self.widget.insert_dialogue_layers(document, False, self.dialogues_by_page)
+        loop = QEventLoop()
+        self.widget.scheduler.finished.connect(loop.quit)
+        loop.exec_()
+        return len(self.dialogues_by_page)
+
+    def close(self):
+        self.widget.close_session()
+
+
+def run_benchmarks(pages=100, lines_per_page=40, cast_size=12, profile_name="colon", workers=1, repeat=3,
+                   out=print):
+    """
+    Generate a script and time every stage on it.
+
+    :return: A list of result dicts, one per stage
+    """
+    krita = install_fake_krita()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from textporter.speaker_parser import get_profile
+    from .synthetic_script import generate_script
+
+    results = []
+
+    def record(stage, unit, run):
+        items, seconds, peak = measure(run, repeat)
+        result = dict(stage=stage, items=items, unit=unit, seconds=seconds,
+                      per_second=items / seconds if seconds else float("inf"), peak_bytes=peak)
+        results.append(result)
+        out(f"{stage:<16}{items:>9} {unit:<7}{seconds * 1000:>10.1f} ms{result['per_second']:>12.0f} {unit}/s"
+            f"{peak / 2 ** 20:>9.1f} MiB peak")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_file = os.path.join(tmp, "synthetic.pdf")
+        generate_script(pdf_file, pages, lines_per_page, cast_size, profile_name)
+        out(f"{pages} pages x {lines_per_page} lines, cast of {cast_size}, {profile_name} profile, "
+            f"{workers} worker(s), best of {repeat}")
+        pipeline = Pipeline(pdf_file, get_profile(profile_name), workers)
+        record("extract", "pages", pipeline.extract)
+        record("parse", "lines", pipeline.parse)
+        record("extract_layout", "lines", pipeline.extract_layout)
+        record("resolve_styles", "lines", pipeline.resolve_styles)
+        record("build_svg", "pages", pipeline.build_svg)
+        results[-1]["svg_bytes"] = pipeline.svg_bytes
+        docker = DockerBench(pipeline)
+        record("wrap_svg", "pages", pipeline.build_wrapped_svg)
+        krita.reset_calls()
+        record("insert_layers", "layers", docker.insert)
+        runs = repeat + 1
+        results[-1]["krita_calls"] = {name: count // runs for name, count in krita.CALLS.items()}
+        results[-1]["svg_bytes"] = krita.SVG_BYTES["addShapesFromSvg"] // runs
+        out("krita calls per run: " + ", ".join(f"{name} {count}" for name, count in
+                                                 sorted(results[-1]["krita_calls"].items())))
+        docker.close()
+        pipeline.session.close()
+    try:
+        import resource
+        out(f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    except ImportError:
+        pass  # Not available on Windows
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the Textporter pipeline.")
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=40, help="Text lines per page (default: %(default)s)")
+    parser.add_argument("--cast", type=int, default=12, help="Number of speakers (default: %(default)s)")
+    parser.add_argument("--profile", choices=("colon", "screenplay"), default="colon")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="Extraction processes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (default: %(default)s)")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+    results = run_benchmarks(args.pages, args.lines, args.cast, args.profile, args.workers, args.repeat)
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump({"arguments": vars(args), "results": results}, json_file, indent=4)
+    return 0
@@ -0,0 +1,107 @@
+"""
+Synthetic script PDFs for the benchmarks, written with PyMuPDF.
+
+    python -m benchmarks.synthetic_script out.pdf --pages 200 --lines 40 --cast 30
+"""
+import argparse
+import random
+
+from textporter.pdf_session import load_fitz
+
+
+WORDS = ("the", "door", "was", "never", "locked", "we", "should", "go", "now", "before", "they",
+         "find", "out", "what", "happened", "last", "night", "I", "told", "you", "so", "listen",
+         "to", "me", "just", "once", "ship", "is", "leaving", "without", "us", "where", "did",
+         "it", "all", "go", "wrong", "keep", "moving", "don't", "look", "back")
+
+SCENE_HEADINGS = ("INT. SPACESHIP BRIDGE - NIGHT", "EXT. HARBOUR - DAY", "INT. KITCHEN - MORNING",
+                  "EXT. ROOFTOP - DUSK")
+
+# US Letter, in points
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 36
+
+
+def cast_names(cast_size):
+    """Return cast_size distinct upper-case speaker names."""
+    base = ("ALICE", "BOB", "CAROL", "DAVE", "ERIN", "FRANK", "GRACE", "HEIDI", "IVAN", "JUDY")
+    return [base[i % len(base)] + (str(i // len(base)) if i >= len(base) else "") for i in range(cast_size)]
+
+
+def speech(rng, min_words=4, max_words=14):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + rng.choice((".", "!", "?", "..."))
+
+
+def page_lines(rng, cast, lines_per_page, profile):
+    """
+    Return the text lines of one page in the given script format: "NAME: text"
+    lines for the colon profile, or cue/dialogue blocks with the occasional
+    scene heading and parenthetical for the screenplay profile.
+    """
+    lines = []
+    if profile == "colon":
+        while len(lines) < lines_per_page:
+            if rng.random() < 0.1:
+                lines.append(speech(rng))  # Action line, not dialogue
+            else:
+                lines.append(f"{rng.choice(cast)}: {speech(rng)}")
+        return lines
+    while len(lines) < lines_per_page:
+        roll = rng.random()
+        if roll < 0.05:
+            lines += [rng.choice(SCENE_HEADINGS), ""]
+        elif roll < 0.15:
+            lines += [speech(rng), ""]
+        else:
+            lines.append(rng.choice(cast) + (" (V.O.)" if roll > 0.95 else ""))
+            if roll > 0.9:
+                lines.append("(quietly)")
+            lines += [speech(rng), speech(rng, 2, 8), ""]
+    return lines[:lines_per_page]
+
+
+def generate_script(pdf_file, pages=100, lines_per_page=40, cast_size=12, profile="colon", seed=0):
+    """
+    Write a script PDF of the given size. The font size shrinks as
+    lines_per_page grows so every line fits on its page.
+
+    :return: The number of text lines written
+    """
+    fitz = load_fitz()
+    rng = random.Random(seed)
+    cast = cast_names(cast_size)
+    line_height = (PAGE_HEIGHT - 2 * MARGIN) / lines_per_page
+    font_size = min(11, line_height / 1.2)
+    written = 0
+    with fitz.open() as document:
+        for _ in range(pages):
+            page = document.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            lines = page_lines(rng, cast, lines_per_page, profile)
+            writer = fitz.TextWriter(page.rect)
+            for i, line in enumerate(lines):
+                if line:
+                    writer.append((MARGIN, MARGIN + (i + 1) * line_height), line, fontsize=font_size)
+            writer.write_text(page)
+            written += len(lines)
+        document.save(pdf_file, garbage=3, deflate=True)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.synthetic_script",
+                                     description="Write a synthetic script PDF.")
+    parser.add_argument("pdf_file")
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=40, help="Text lines per page (default: %(default)s)")
+    parser.add_argument("--cast", type=int, default=12, help="Number of speakers (default: %(default)s)")
+    parser.add_argument("--profile", choices=("colon", "screenplay"), default="colon")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    lines = generate_script(args.pdf_file, args.pages, args.lines, args.cast, args.profile, args.seed)
+    print(f"{args.pdf_file}: {args.pages} pages, {lines} lines")
+
+
+if __name__ == "__main__":
+    main()
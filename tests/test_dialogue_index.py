@@ -0,0 +1,46 @@
+from textporter.dialogue_index import DialogueIndex, tokenize
+from textporter.dialogue_store import DialogueStore
+
+
+def index_of(lines):
+    store = DialogueStore()
+    for name, text, page in lines:
+        store.add(name, text, page)
+    return DialogueIndex.from_store(store)
+
+
+INDEX_LINES = [
+    ("ALICE", "Where is the pizza?", 0),
+    ("BOB", "I ate the pizza.", 0),
+    ("ALICE", "Don't tell me that.", 1),
+    ("BOB", "Pizzeria's closed.", 2),
+]
+
+
+def test_tokenize_keeps_apostrophes_inside_words():
+    assert tokenize("Don't  tell ME!") == ["don't", "tell", "me"]
+
+
+def test_last_word_matches_as_a_prefix():
+    index = index_of(INDEX_LINES)
+    assert index.search("pizz") == [0, 1, 3]
+    assert index.search("do") == [2]
+
+
+def test_finished_word_matches_whole():
+    index = index_of(INDEX_LINES)
+    assert index.search("pizza ") == [0, 1]
+
+
+def test_every_word_must_match():
+    index = index_of(INDEX_LINES)
+    assert index.search("bob pizz") == [1, 3]
+    assert index.search("alice pizza bob") == []
+    assert index.search("nothing pizza") == []
+
+
+def test_results_and_limit():
+    index = index_of(INDEX_LINES)
+    assert index.search("pizz", limit=2) == [0, 1]
+    assert index.results("closed") == [(3, "BOB", "Pizzeria's closed.", 2)]
+    assert index.search("  ") == []
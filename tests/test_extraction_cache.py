@@ -0,0 +1,63 @@
+import itertools
+
+import pytest
+
+from textporter import extraction_cache
+from textporter.extraction_cache import ExtractionCache
+from textporter.script_parser import PARSER_VERSION, parser_cache_version
+from textporter.speaker_parser import get_profile
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Make every cache call a distinct moment, so least recently used is well defined."""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(extraction_cache.time, "time", lambda: float(next(ticks)))
+
+
+def store_script(cache, digest, text="x" * 100):
+    cache.store(digest, 2, {0: text, 1: text}, {0: [["ALICE", "Hi."]], 1: []}, {0: (612, 792), 1: (612, 792)})
+
+
+def test_round_trip(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite"), "3:colon")
+    store_script(cache, "abc")
+    page_count, page_text, page_records, page_sizes = cache.load("abc")
+    assert page_count == 2
+    assert page_text == {0: "x" * 100, 1: "x" * 100}
+    assert page_records == {0: [["ALICE", "Hi."]], 1: []}
+    assert page_sizes == {0: (612, 792), 1: (612, 792)}
+    assert cache.load("def") is None
+
+
+def test_parser_version_is_part_of_the_key(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite"), "3:colon")
+    store_script(cache, "abc")
+    other = cache.with_parser_version("3:screenplay")
+    assert other.load("abc") is None
+    assert cache.with_parser_version("3:colon").load("abc") is not None
+
+
+def test_cache_version_names_the_parser_and_profile():
+    assert parser_cache_version(get_profile("colon")) == f"{PARSER_VERSION}:colon"
+    assert parser_cache_version(get_profile("screenplay")) != parser_cache_version(get_profile("colon"))
+
+
+def test_least_recently_used_script_is_evicted(tmp_path):
+    # Each script holds about 230 bytes of text and records
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite"), "3:colon", max_bytes=500)
+    store_script(cache, "first")
+    store_script(cache, "second")
+    cache.load("first")  # Now the second script is the least recently used
+    store_script(cache, "third")
+    assert cache.load("second") is None
+    assert cache.load("first") is not None
+    assert cache.load("third") is not None
+
+
+def test_eviction_drops_page_sizes_of_evicted_scripts(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite"), "3:colon", max_bytes=300)
+    store_script(cache, "first")
+    store_script(cache, "second")
+    cache.store("first", 2, {0: "", 1: ""}, {})  # Stored again without sizes
+    assert cache.load("first")[3] == {}
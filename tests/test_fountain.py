@@ -0,0 +1,41 @@
+from textporter.speaker_parser import get_profile
+from textporter.text_session import FORM_FEED, iter_fountain_lines, iter_text_pages
+
+
+def fountain_lines(text):
+    return list(iter_fountain_lines(line + "\n" for line in text.split("\n")))
+
+
+def test_title_page_is_dropped():
+    text = "Title: Die Hard\nAuthor: Someone\n\nINT. TOWER - NIGHT\n\nALICE\nHi."
+    assert fountain_lines(text) == ["INT. TOWER - NIGHT", "", "ALICE", "Hi."]
+
+
+def test_script_without_title_page_keeps_its_first_line():
+    assert fountain_lines("\n\nALICE\nHi.") == ["ALICE", "Hi."]
+
+
+def test_boneyard_is_dropped_across_lines():
+    text = "ALICE\nHi /* cut\nthis */ there.\n/* whole line */\nBOB"
+    assert fountain_lines(text) == ["ALICE", "Hi ", " there.", "BOB"]
+
+
+def test_notes_are_dropped():
+    text = "ALICE\nHi [[check this]] there.\n[[a note\nover two lines]]\nBOB"
+    assert fountain_lines(text) == ["ALICE", "Hi  there.", "BOB"]
+
+
+def test_sections_and_synopses_are_dropped():
+    assert fountain_lines("# Act One\n= The heist begins\nALICE") == ["ALICE"]
+
+
+def test_page_breaks_split_pages():
+    text = "ALICE\nOne.\n===\nBOB\nTwo."
+    assert fountain_lines(text) == ["ALICE", "One.", FORM_FEED, "BOB", "Two."]
+    assert list(iter_text_pages(fountain_lines(text))) == ["ALICE\nOne.\n", "\nBOB\nTwo."]
+
+
+def test_forced_cue():
+    lines = [(0, line) for line in fountain_lines("INT. TOWER - NIGHT\n\n@McCLANE (V.O.)\nYippee.\n\n@Hans\nNo.")]
+    records = [(name, text) for _, name, text in get_profile("screenplay").iter_speaker_lines(lines)]
+    assert records == [("McCLANE", "Yippee."), ("Hans", "No.")]
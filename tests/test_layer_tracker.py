@@ -0,0 +1,19 @@
+from textporter.layer_tracker import matching_lines
+
+
+def test_lines_pair_up_across_an_insertion():
+    old = [("ALICE", "One"), ("BOB", "Two"), ("ALICE", "Three")]
+    new = [("BOB", "New first line"), ("ALICE", "One"), ("BOB", "Two"), ("ALICE", "Three")]
+    assert list(matching_lines(old, new)) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_lines_pair_up_across_a_deletion():
+    old = [("ALICE", "One"), ("BOB", "Two"), ("ALICE", "Three")]
+    new = [("ALICE", "One"), ("ALICE", "Three")]
+    assert list(matching_lines(old, new)) == [(0, 0), (2, 1)]
+
+
+def test_rewritten_line_keeps_its_pairing():
+    old = [("ALICE", "One"), ("BOB", "Two"), ("ALICE", "Three")]
+    new = [("ALICE", "One"), ("BOB", "Two, revised"), ("ALICE", "Three")]
+    assert list(matching_lines(old, new)) == [(0, 0), (1, 1), (2, 2)]
@@ -0,0 +1,47 @@
+from textporter.dialogue_store import DialogueStore
+from textporter.revisions import ScriptRevision, diff_revisions, page_digest
+
+
+def revision(pages):
+    """A ScriptRevision of pages given as lists of (name, text) records."""
+    store = DialogueStore()
+    for page_num, records in enumerate(pages):
+        for name, text in records:
+            store.add(name, text, page_num)
+    digests = [page_digest(repr(records)) for records in pages]
+    return ScriptRevision("script.pdf", digests, store)
+
+
+PAGES = [[("ALICE", "One.")], [("BOB", "Two.")], [("ALICE", "Three."), ("BOB", "Four.")]]
+
+
+def test_first_load_adds_every_page_with_dialogue():
+    diff = diff_revisions(None, revision(PAGES + [[]]))
+    assert (diff.added, diff.removed, diff.modified) == ([1, 2, 3], [], [])
+    assert diff.speakers == {"ALICE", "BOB"}
+
+
+def test_unchanged_script_has_no_changes():
+    diff = diff_revisions(revision(PAGES), revision(PAGES))
+    assert not diff
+    assert diff.summary() == "no dialogue changes"
+
+
+def test_modified_page():
+    pages = [PAGES[0], [("BOB", "Two, revised.")], PAGES[2]]
+    diff = diff_revisions(revision(PAGES), revision(pages))
+    assert (diff.added, diff.removed, diff.modified) == ([], [], [2])
+    assert diff.speakers == {"BOB"}
+
+
+def test_inserted_page_doesnt_modify_the_pages_after_it():
+    pages = [PAGES[0], [("CAROL", "New.")], PAGES[1], PAGES[2]]
+    diff = diff_revisions(revision(PAGES), revision(pages))
+    assert (diff.added, diff.removed, diff.modified) == ([2], [], [])
+    assert diff.summary() == "added: 2"
+
+
+def test_removed_page():
+    diff = diff_revisions(revision(PAGES), revision([PAGES[0], PAGES[2]]))
+    assert (diff.added, diff.removed, diff.modified) == ([], [2], [])
+    assert diff.speakers == {"BOB"}
@@ -0,0 +1,56 @@
+from textporter.page_layout import TextLine, iter_positioned_records, with_blank_lines
+from textporter.speaker_parser import get_profile
+
+
+def speaker_lines(profile_name, text, page_num=0):
+    lines = [(page_num, line) for line in text.split("\n")]
+    return [(name, text) for _, name, text in get_profile(profile_name).iter_speaker_lines(lines)]
+
+
+def test_colon_lines():
+    text = "ALICE: Fine.\nSome action.\nBob (V.O.):  Hello there \n: no name\nNOTE:"
+    assert speaker_lines("colon", text) == [("ALICE", "Fine."), ("Bob", "Hello there"), ("NOTE", "")]
+
+
+def test_colon_lines_keep_pages():
+    lines = [(0, "ALICE: One"), (1, "BOB: Two")]
+    assert list(get_profile("colon").iter_speaker_lines(lines)) == [(0, "ALICE", "One"), (1, "BOB", "Two")]
+
+
+def test_cue_block():
+    text = "INT. KITCHEN - DAY\n\nALICE\n(quietly)\nFine.\nReally.\n\nBOB (CONT'D)\nOK then."
+    assert speaker_lines("screenplay", text) == [("ALICE", "Fine. Really."), ("BOB", "OK then.")]
+
+
+def test_all_caps_dialogue_stays_in_speech():
+    assert speaker_lines("screenplay", "ALICE\nFine.\nOK.\nYes") == [("ALICE", "Fine. OK. Yes")]
+    assert speaker_lines("screenplay", "ALICE\nNO.\nI\nwon't.") == [("ALICE", "NO. I won't.")]
+
+
+def test_cue_after_scene_heading_or_transition():
+    text = "CUT TO:\nALICE\nHi.\nEXT. STREET - NIGHT\nBOB\nBye."
+    assert speaker_lines("screenplay", text) == [("ALICE", "Hi."), ("BOB", "Bye.")]
+
+
+def test_all_caps_action_is_not_a_cue():
+    assert speaker_lines("screenplay", "He waits.\nSILENCE\nNothing.") == []
+
+
+def test_cue_at_start_of_page():
+    lines = [(0, "ALICE"), (0, "Fine."), (1, "BOB"), (1, "Hello.")]
+    assert list(get_profile("screenplay").iter_speaker_lines(lines)) == [(0, "ALICE", "Fine."), (1, "BOB", "Hello.")]
+
+
+def test_positioned_cue_blocks():
+    texts = ["ALICE", "Fine.", "OK.", "", "BOB", "Bye."]
+    lines = [TextLine(text, (0, i * 10, 50, i * 10 + 8), (0, i * 10 + 8), "Courier", 12)
+             for i, text in enumerate(texts)]
+    records = [(name, text, [line.text for line in used])
+               for name, text, used in iter_positioned_records(lines, get_profile("screenplay"))]
+    assert records == [("ALICE", "Fine. OK.", ["Fine.", "OK."]), ("BOB", "Bye.", ["Bye."])]
+
+
+def test_blank_lines_rebuilt_from_gaps():
+    baselines = [(72, "ALICE"), (86, "Fine."), (114, "BOB"), (128, "Bye.")]
+    lines = [TextLine(text, (0, y - 10, 50, y + 2), (0, y), "Courier", 12) for y, text in baselines]
+    assert [line.text for line in with_blank_lines(lines)] == ["ALICE", "Fine.", "", "BOB", "Bye."]
@@ -1 +1,7 @@
-from .textporter import Textporter
+try:
+    import krita
+except ImportError:
+    # Imported outside Krita, e.g. by the batch command line (python -m textporter.batch)
+    pass
+else:
+    from .textporter import Textporter
@@ -0,0 +1,182 @@
+"""
+Headless batch conversion: turn a folder of scripts (PDF, Fountain or plain
+text) into per-page SVG lettering files without Krita.
+
+    python -m textporter.batch SCRIPTS_DIR STYLE_FILE [-o OUT_DIR] [--profile screenplay]
+
+For every script, OUT_DIR/<script name>/ receives page_NNN.svg, holding all
+of that page's dialogue in one SVG document, and page_NNN.json, a manifest
+of the styled lines it contains. Scripts that differ only in their
+extension, such as a.pdf and a.fountain, keep it in their folder name. Scripts are spread across a process pool.
+"""
+import argparse
+import configparser
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .pdf_session import default_worker_count
+from .script_parser import iter_dialogues, iter_lines, iter_pages, parse_page_ranges
+from .sources import is_script_file, open_script
+from .speaker_parser import DEFAULT_PROFILE, PROFILES, get_profile
+from .style_templates import StyleTemplates
+from .styles import load_styles
+from .svg_builder import build_page_svg
+
+
+def find_scripts(scripts_dir):
+    """Return the script files directly inside scripts_dir, sorted by name."""
+    return sorted(os.path.join(scripts_dir, name) for name in os.listdir(scripts_dir) if is_script_file(name))
+
+
+def output_names(scripts):
+    """
+    Return {script: name of its output folder}: the file name without its
+    extension, or with it where two scripts would otherwise share a folder.
+    """
+    stems = {}
+    for pdf_file in scripts:
+        stem = os.path.splitext(os.path.basename(pdf_file))[0]
+        stems[stem] = stems.get(stem, 0) + 1
+    names = {}
+    for pdf_file in scripts:
+        name = os.path.basename(pdf_file)
+        stem = os.path.splitext(name)[0]
+        names[pdf_file] = stem if stems[stem] == 1 else name
+    return names
+
+
+def iter_page_groups(dialogues, page_nums):
+    """Group a dialogue stream by page, yielding (page, dialogues) for every page in page_nums."""
+    pending = {}
+    dialogues = iter(dialogues)
+    for page_num in page_nums:
+        page = page_num + 1
+        group = pending.pop(page, [])
+        for dialogue in dialogues:
+            if dialogue.page != page:
+                pending.setdefault(dialogue.page, []).append(dialogue)
+                break
+            group.append(dialogue)
+        yield page, group
+
+
+def convert_script(pdf_file, styles, out_dir, profile_name=None, page_ranges=None, size=None, name=None):
+    """
+    Process pool entry point: write the SVG and manifest of every page of one script.
+
+    :param styles: Style registry, as returned by load_styles
+    :param page_ranges: Optional page selection, see parse_page_ranges
+    :param size: Optional (width, height) of the SVG; defaults to each page's size
+    :param name: Output folder under out_dir, see output_names; the file name without its extension by default
+    :return: A summary dict of what was written
+    """
+    profile = get_profile(profile_name)
+    script_dir = os.path.join(out_dir, name or os.path.splitext(os.path.basename(pdf_file))[0])
+    os.makedirs(script_dir, exist_ok=True)
+    summary = {"script": pdf_file, "output": script_dir, "pages": 0, "dialogues": 0, "svg_bytes": 0}
+    with open_script(pdf_file, profile=profile) as session:
+        if page_ranges:
+            page_nums = [page - 1 for page in parse_page_ranges(page_ranges) if 1 <= page <= session.page_count]
+        else:
+            page_nums = list(range(session.page_count))
+        # Stream the pages rather than keeping the whole script's text in memory
+        dialogues = iter_dialogues(iter_lines(iter_pages(session, page_nums, keep=False)), profile)
+        templates = StyleTemplates(styles)
+        for page, page_dialogues in iter_page_groups(dialogues, page_nums):
+            width, height = size or session.page_size(page - 1)
+            svg = build_page_svg(page_dialogues, styles, width, height, templates=templates).to_svg()
+            stem = f"page_{page:03d}"
+            with open(os.path.join(script_dir, stem + ".svg"), "w", encoding="utf-8") as svg_file:
+                svg_file.write(svg)
+            manifest = {
+                "script": os.path.basename(pdf_file),
+                "page": page,
+                "width": width,
+                "height": height,
+                "profile": profile.name,
+                "svg": stem + ".svg",
+                "dialogues": [],
+            }
+            for dialogue in page_dialogues:
+                style = templates.resolve(dialogue.name).style
+                manifest["dialogues"].append({
+                    "name": dialogue.name,
+                    "text": dialogue.text,
+                    "font": style["font"],
+                    "size": style["size"],
+                    "color": style["color"],
+                })
+            with open(os.path.join(script_dir, stem + ".json"), "w", encoding="utf-8") as json_file:
+                json.dump(manifest, json_file, indent=4)
+            summary["pages"] += 1
+            summary["dialogues"] += len(page_dialogues)
+            summary["svg_bytes"] += len(svg)
+    return summary
+
+
+def convert_folder(scripts_dir, styles, out_dir, profile_name=None, page_ranges=None, size=None,
+                   workers=None, progress=None):
+    """
+    Convert every script in scripts_dir, one script per worker process.
+
+    :param styles: Style registry, as returned by load_styles
+    :param progress: Optional callback called with each script's summary as it finishes
+    :return: The summaries, in script order; failed scripts carry an "error" key
+    """
+    scripts = find_scripts(scripts_dir)
+    names = output_names(scripts)
+    workers = min(workers or default_worker_count(), max(len(scripts), 1))
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(convert_script, pdf_file, styles, out_dir, profile_name, page_ranges, size,
+                               names[pdf_file]): pdf_file
+                   for pdf_file in scripts}
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                summary = {"script": pdf_file, "error": str(e)}
+            results[pdf_file] = summary
+            if progress:
+                progress(summary)
+    return [results[pdf_file] for pdf_file in scripts]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m textporter.batch",
+                                     description="Convert a folder of scripts to per-page SVG lettering files.")
+    parser.add_argument("scripts_dir", help="Folder containing the scripts (.pdf, .fountain, .txt)")
+    parser.add_argument("style_file", help="Character styles, as a settings .ini or a saved .json")
+    parser.add_argument("-o", "--output", default="lettering", help="Output folder (default: %(default)s)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE,
+                        help="Script format (default: %(default)s)")
+    parser.add_argument("--pages", help='Pages to convert in every script, e.g. "1-5" or "1,3,5"')
+    parser.add_argument("--size", nargs=2, type=int, metavar=("WIDTH", "HEIGHT"),
+                        help="SVG size in pixels (default: each page's size)")
+    parser.add_argument("-j", "--workers", type=int, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    try:
+        styles = load_styles(args.style_file)
+    except (OSError, ValueError, configparser.Error) as e:
+        print(f"Could not read the style file {args.style_file}: {e}", file=sys.stderr)
+        return 2
+
+    def report(summary):
+        if "error" in summary:
+            print(f"FAILED {summary['script']}: {summary['error']}", file=sys.stderr)
+        else:
+            print(f"{summary['script']}: {summary['pages']} pages, {summary['dialogues']} lines -> {summary['output']}")
+
+    summaries = convert_folder(args.scripts_dir, styles, args.output, args.profile, args.pages,
+                               args.size, args.workers, report)
+    if not summaries:
+        print(f"No scripts found in {args.scripts_dir}", file=sys.stderr)
+        return 1
+    return 1 if any("error" in summary for summary in summaries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import re
+from array import array
+from bisect import bisect_left
+
+
+WORD = re.compile(r"\w+(?:'\w+)*")
+
+
+def tokenize(text):
+    """Split text into case-folded words; apostrophes inside a word are kept, so "don't" is one word."""
+    return [word.casefold() for word in WORD.findall(text)]
+
+
+class DialogueIndex:
+    """
+    Inverted index over the lines of a DialogueStore: word -> the lines it
+    appears in, for searching a script while it's open.
+
+    A line is indexed under the words of its text and of its speaker's
+    name, so "bob pizza" finds Bob's lines about pizza. Posting lists hold
+    store line indices in ascending order, as array("I") like the store's
+    own columns; a line's page and speaker are read back from the store.
+    """
+
+    __slots__ = ("store", "postings", "_words")
+
+    def __init__(self, store):
+        self.store = store
+        self.postings = {}  # word -> line indices
+        self._words = None  # sorted words, for prefix lookups; rebuilt after adds
+
+    def add(self, index, name, text):
+        """Index store line `index`. Lines must be added in store order."""
+        for word in set(tokenize(name) + tokenize(text)):
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = array("I")
+            posting.append(index)
+        self._words = None
+
+    @classmethod
+    def from_store(cls, store):
+        index = cls(store)
+        for line_index, (name, text, page) in enumerate(store):
+            index.add(line_index, name, text)
+        return index
+
+    def __len__(self):
+        return len(self.postings)
+
+    def words_with_prefix(self, prefix):
+        if self._words is None:
+            self._words = sorted(self.postings)
+        start = bisect_left(self._words, prefix)
+        end = bisect_left(self._words, prefix + "\U0010ffff", start)
+        return self._words[start:end]
+
+    def lines_with_prefix(self, prefix):
+        """Return the sorted line indices of every word starting with prefix."""
+        words = self.words_with_prefix(prefix)
+        if len(words) == 1:
+            return self.postings[words[0]]
+        lines = set()
+        for word in words:
+            lines.update(self.postings[word])
+        return sorted(lines)
+
+    def search(self, query, limit=200):
+        """
+        Find the lines matching every word of a query. The last word matches
+        as a prefix, so results can be shown while the query is being typed.
+
+        :param limit: Maximum number of lines to return, None for all
+        :return: Store line indices, in script order
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        if query[-1:].isspace():
+            last = None  # The last word is finished, match it whole
+        else:
+            words, last = words[:-1], words[-1]
+        candidates = [self.postings.get(word, ()) for word in dict.fromkeys(words)]
+        if last is not None:
+            candidates.append(self.lines_with_prefix(last))
+        # Intersect starting from the shortest list
+        candidates.sort(key=len)
+        matches = set(candidates[0])
+        for posting in candidates[1:]:
+            if not matches:
+                break
+            matches.intersection_update(posting)
+        matches = sorted(matches)
+        return matches if limit is None else matches[:limit]
+
+    def results(self, query, limit=200):
+        """Run search() and return the matches as (line index, name, text, page) tuples."""
+        return [(index,) + self.store.record(index) for index in self.search(query, limit)]
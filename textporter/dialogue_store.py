@@ -0,0 +1,107 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class DialogueStore:
+    """
+    Compact, append-only store of parsed dialogue lines.
+
+    Lines are kept as columns instead of one object per line: a speaker id,
+    a page number and an offset into one shared text buffer. Speaker names
+    are interned once and referenced by id. Lines must be added in page
+    order, which lets a page's lines be found by bisecting the page column.
+    """
+
+    __slots__ = ("speakers", "_speaker_ids", "speaker_ids", "pages", "offsets",
+                 "line_counts", "_chunks", "_buffer", "_length")
+
+    def __init__(self):
+        self.speakers = []  # speaker id -> interned name
+        self._speaker_ids = {}  # name -> speaker id
+        self.speaker_ids = array("I")  # per line
+        self.pages = array("I")  # per line, in the numbering the caller adds with
+        self.offsets = array("Q")  # per line, start of its text in the buffer
+        self.line_counts = array("I")  # per speaker
+        self._chunks = []  # text added since the buffer was last joined
+        self._buffer = ""
+        self._length = 0
+
+    def speaker_id(self, name):
+        """Return the id of a speaker, interning the name on first sight."""
+        speaker_id = self._speaker_ids.get(name)
+        if speaker_id is None:
+            speaker_id = len(self.speakers)
+            name = sys.intern(name)
+            self.speakers.append(name)
+            self._speaker_ids[name] = speaker_id
+            self.line_counts.append(0)
+        return speaker_id
+
+    def add(self, name, text, page):
+        """Append one line. Pages must not decrease from one call to the next."""
+        if self.pages and page < self.pages[-1]:
+            raise ValueError(f"Lines must be added in page order, got page {page} after {self.pages[-1]}")
+        speaker_id = self.speaker_id(name)
+        self.speaker_ids.append(speaker_id)
+        self.pages.append(page)
+        self.offsets.append(self._length)
+        self.line_counts[speaker_id] += 1
+        self._chunks.append(text)
+        self._length += len(text)
+
+    def _text_buffer(self):
+        if self._chunks:
+            self._buffer = "".join([self._buffer] + self._chunks)
+            self._chunks = []
+        return self._buffer
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def text(self, index):
+        buffer = self._text_buffer()
+        end = self.offsets[index + 1] if index + 1 < len(self.offsets) else self._length
+        return buffer[self.offsets[index]:end]
+
+    def record(self, index):
+        """Return line `index` as a (name, text, page) tuple."""
+        return self.speakers[self.speaker_ids[index]], self.text(index), self.pages[index]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def page_records(self, page):
+        """Return the [(name, text), ...] lines of one page."""
+        start = bisect_left(self.pages, page)
+        end = bisect_right(self.pages, page, start)
+        return [(self.speakers[self.speaker_ids[i]], self.text(i)) for i in range(start, end)]
+
+    def texts_by_speaker(self):
+        """Return {name: every line of the speaker, in order}, gathered in one pass over the lines."""
+        buffer = self._text_buffer()
+        ends = self.offsets[1:].tolist() + [self._length]
+        texts = {name: [] for name in self.speakers}
+        for speaker_id, start, end in zip(self.speaker_ids, self.offsets, ends):
+            texts[self.speakers[speaker_id]].append(buffer[start:end])
+        return texts
+
+    def line_count(self, name):
+        speaker_id = self._speaker_ids.get(name)
+        return self.line_counts[speaker_id] if speaker_id is not None else 0
+
+    def names(self):
+        return list(self.speakers)
+
+    def footprint(self):
+        """
+        Return the approximate memory held by the store, in bytes, broken
+        down into the text buffer, the per-line columns and the speaker table.
+        """
+        columns = sum(column.buffer_info()[1] * column.itemsize
+                      for column in (self.speaker_ids, self.pages, self.offsets, self.line_counts))
+        speakers = sys.getsizeof(self.speakers) + sys.getsizeof(self._speaker_ids)
+        speakers += sum(sys.getsizeof(name) for name in self.speakers)
+        text = sys.getsizeof(self._text_buffer())
+        return {"text": text, "columns": columns, "speakers": speakers, "total": text + columns + speakers}
@@ -0,0 +1,220 @@
+import json
+import os
+import re
+from functools import partial
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from .import_trace import NO_TRACE
+
+
+# Resolution of documents created for pages that have no .kra yet
+NEW_DOCUMENT_RESOLUTION = 300.0
+
+PAGE_PLACEHOLDER = re.compile(r"#+")
+
+REPORT_FILE = "textporter_import_report.json"
+
+
+def document_name(pattern, page):
+    """
+    Expand a document name pattern for a 1-indexed page. A run of # is the
+    page number zero-padded to its length, so "issue12_p##.kra" gives
+    "issue12_p07.kra" for page 7; Python format fields such as {page:03d}
+    work too.
+    """
+    if "{" in pattern:
+        return pattern.format(page=page)
+    return PAGE_PLACEHOLDER.sub(lambda match: f"{page:0{len(match.group())}d}", pattern)
+
+
+def document_targets(folder, pattern, page_list):
+    """
+    Map script pages to the .kra files they go into.
+
+    :return: A list of (page, path)
+    :raises ValueError: If the pattern sends two pages to the same file
+    """
+    targets = []
+    seen = {}
+    for page in page_list:
+        path = os.path.join(folder, document_name(pattern, page))
+        if not path.lower().endswith(".kra"):
+            path += ".kra"
+        if path in seen:
+            raise ValueError(f"Pages {seen[path]} and {page} would both go into {os.path.basename(path)}; "
+                             f"put # where the page number goes")
+        seen[path] = page
+        targets.append((page, path))
+    return targets
+
+
+class DocumentResult:
+    """What happened to one page's document."""
+    __slots__ = ("page", "path", "status", "lines", "error")
+
+    def __init__(self, page, path, status, lines=0, error=None):
+        self.page = page
+        self.path = path
+        self.status = status  # "updated", "created", "skipped" or "failed"
+        self.lines = lines
+        self.error = error
+
+    def as_dict(self):
+        return {"page": self.page, "document": self.path, "status": self.status,
+                "lines": self.lines, "error": self.error}
+
+
+def summary_text(results):
+    """A few lines summing up a batch import, failures listed last."""
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    lines = sum(result.lines for result in results)
+    text = (f"{len(results)} page(s): " +
+            ", ".join(f"{counts[status]} {status}" for status in ("updated", "created", "skipped", "failed")
+                      if status in counts) +
+            f"; {lines} line(s) of dialogue")
+    failures = [f"Page {result.page} ({os.path.basename(result.path)}): {result.error}"
+                for result in results if result.status == "failed"]
+    return "\n".join([text] + failures)
+
+
+def save_report(results, report_file):
+    with open(report_file, "w", encoding="utf-8") as file:
+        json.dump({"summary": summary_text(results), "documents": [result.as_dict() for result in results]},
+                  file, indent=2)
+
+
+class DocumentBatchImport(QObject):
+    """
+    Letters one script page into each of several .kra files, one document
+    at a time: open it (or create it), add the page's layer, save, close.
+
+    Documents are handled one per timer tick, so the docker stays responsive
+    and only one document is open at any moment however long the issue is.
+    A page's layer replaces a layer of the same name left by an earlier run.
+    A document the user already has open in Krita is lettered and saved as
+    it is, and left open, rather than opened a second time.
+    """
+    progress = pyqtSignal(int, int)  # documents done, documents queued
+    finished = pyqtSignal(object)  # list of DocumentResult
+    cancelled = pyqtSignal(object)  # list of DocumentResult for the documents done
+
+    def __init__(self, app, targets, dialogues_by_page, make_svg, new_size, trace=None, parent=None):
+        """
+        :param app: Krita.instance()
+        :param targets: (page, path) pairs, see document_targets
+        :param dialogues_by_page: As returned by build_dialogue_index
+        :param make_svg: Called as make_svg(doc, page, dialogues) for the SVG text of a page's layer
+        :param new_size: Called as new_size(page) for the (width, height) of a document to create
+        :param trace: Optional ImportTrace to time the Krita calls in
+        """
+        super().__init__(parent)
+        self.app = app
+        self.queue = list(reversed(targets))  # Pop from the end while keeping the queued order
+        self.total = len(targets)
+        self.dialogues_by_page = dialogues_by_page
+        self.make_svg = make_svg
+        self.new_size = new_size
+        self.trace = trace or NO_TRACE
+        self.results = []
+        self.timer = QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.run_next)
+
+    @property
+    def is_running(self):
+        return self.timer.isActive()
+
+    def start(self):
+        if not self.queue:
+            self.finished.emit(self.results)
+            return
+        self.timer.start()
+
+    def cancel(self):
+        """Stop once the current document is saved and closed."""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.cancelled.emit(self.results)
+
+    def run_next(self):
+        if not self.queue:
+            self.timer.stop()
+            self.finished.emit(self.results)
+            return
+        page, path = self.queue.pop()
+        dialogues = self.dialogues_by_page.get(page, [])
+        if not dialogues:
+            result = DocumentResult(page, path, "skipped")
+        else:
+            try:
+                created = self.import_page(page, path, dialogues)
+                result = DocumentResult(page, path, "created" if created else "updated", len(dialogues))
+            except Exception as e:
+                result = DocumentResult(page, path, "failed", error=str(e))
+        self.results.append(result)
+        self.progress.emit(len(self.results), self.total)
+        if not self.queue:
+            self.timer.stop()
+            self.finished.emit(self.results)
+
+    def open_document(self, path):
+        """Return the document already open in Krita for path, or None."""
+        path = os.path.normcase(os.path.abspath(path))
+        for doc in self.app.documents():
+            file_name = doc.fileName()
+            if file_name and os.path.normcase(os.path.abspath(file_name)) == path:
+                return doc
+        return None
+
+    def import_page(self, page, path, dialogues):
+        """
+        :return: True if the document was created, False if an existing one was updated
+        """
+        doc = self.open_document(path)
+        if doc is not None:
+            # Saving a second copy would overwrite the file under the open one
+            # and be lost the next time the user saves it
+            self.letter_document(doc, page, dialogues, doc.save)
+            return False
+        created = not os.path.exists(path)
+        with self.trace.stage("open_document", created=int(created)):
+            if created:
+                width, height = self.new_size(page)
+                doc = self.app.createDocument(width, height, os.path.splitext(os.path.basename(path))[0],
+                                              "RGBA", "U8", "", NEW_DOCUMENT_RESOLUTION)
+            else:
+                doc = self.app.openDocument(path)
+        if doc is None:
+            raise OSError(f"Krita could not open {path}")
+        try:
+            self.letter_document(doc, page, dialogues, partial(doc.saveAs, path) if created else doc.save)
+        finally:
+            doc.close()
+        return created
+
+    def letter_document(self, doc, page, dialogues, save):
+        """Add a page's layer to a document, replacing an earlier one, and save it with save()."""
+        batchmode = doc.batchmode()
+        doc.setBatchmode(True)  # No dialogs while saving
+        try:
+            layer_name = f"Page {page}"
+            root = doc.rootNode()
+            for node in root.childNodes():
+                if node.name() == layer_name and node.type() == "vectorlayer":
+                    node.remove()
+            svg_text = self.make_svg(doc, page, dialogues)
+            layer = doc.createVectorLayer(layer_name)
+            with self.trace.stage("addShapesFromSvg", bytes=len(svg_text)):
+                layer.addShapesFromSvg(svg_text)
+            root.addChildNode(layer, None)
+            with self.trace.stage("save_document"):
+                doc.refreshProjection()
+                doc.waitForDone()
+                saved = save()
+            if not saved:
+                raise OSError(f"Krita could not save {doc.fileName() or doc.name()}")
+        finally:
+            doc.setBatchmode(batchmode)
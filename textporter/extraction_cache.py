@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+
+# Total size of cached page text and records before the least recently used scripts are evicted
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    page_count INTEGER NOT NULL,
+    byte_size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (digest, parser_version)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    digest TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    page_num INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    records TEXT,
+    PRIMARY KEY (digest, parser_version, page_num)
+);
+CREATE TABLE IF NOT EXISTS page_sizes (
+    digest TEXT NOT NULL,
+    page_num INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    PRIMARY KEY (digest, page_num)
+);
+"""
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Return the BLAKE2b hex digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    SQLite store of extracted page text and parsed speaker records, keyed by
+    the PDF's content hash plus the parser version (which also names the
+    parser profile, see parser_cache_version), so a known script can be
+    re-imported without opening it in PyMuPDF. Scripts are evicted least
+    recently used first once the cache grows past max_bytes.
+
+    Each call opens its own short-lived connection, so one cache object can
+    be shared between the GUI thread and import workers.
+    """
+
+    def __init__(self, db_path, parser_version, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.parser_version = parser_version
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self.connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def with_parser_version(self, parser_version):
+        """Return a cache on the same database for records from another parser version."""
+        return ExtractionCache(self.db_path, parser_version, self.max_bytes)
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def key_for(self, pdf_file):
+        """
+        Return the content digest of pdf_file. The file is only re-hashed when
+        its size or modification time differ from the last time it was seen.
+        """
+        path = os.path.abspath(pdf_file)
+        stat = os.stat(path)
+        with closing(self.connect()) as conn:
+            row = conn.execute(
+                "SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+            if row:
+                return row[0]
+            digest = file_digest(path)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, digest))
+            return digest
+
+    def load(self, digest):
+        """
+        Return (page_count, page_text, page_records, page_sizes) for a cached
+        script, or None on a miss. page_text, page_records and page_sizes map
+        0-indexed page numbers to the page text, to its list of [name, text]
+        speaker records and to its (width, height) in points.
+        """
+        with closing(self.connect()) as conn:
+            row = conn.execute(
+                "SELECT page_count FROM documents WHERE digest = ? AND parser_version = ?",
+                (digest, self.parser_version)).fetchone()
+            if row is None:
+                return None
+            page_text = {}
+            page_records = {}
+            for page_num, text, records in conn.execute(
+                    "SELECT page_num, text, records FROM pages WHERE digest = ? AND parser_version = ?",
+                    (digest, self.parser_version)):
+                page_text[page_num] = text
+                if records is not None:
+                    page_records[page_num] = json.loads(records)
+            page_sizes = {page_num: (width, height) for page_num, width, height in conn.execute(
+                "SELECT page_num, width, height FROM page_sizes WHERE digest = ?", (digest,))}
+            with conn:
+                conn.execute(
+                    "UPDATE documents SET last_used = ? WHERE digest = ? AND parser_version = ?",
+                    (time.time(), digest, self.parser_version))
+        return row[0], page_text, page_records, page_sizes
+
+    def store(self, digest, page_count, page_text, page_records, page_sizes=None):
+        """Replace the cached entry for a script, then evict down to max_bytes."""
+        rows = []
+        byte_size = 0
+        for page_num, text in page_text.items():
+            records = page_records.get(page_num)
+            records = json.dumps(records) if records is not None else None
+            byte_size += len(text) + (len(records) if records else 0)
+            rows.append((digest, self.parser_version, page_num, text, records))
+        with closing(self.connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM pages WHERE digest = ? AND parser_version = ?",
+                             (digest, self.parser_version))
+                conn.executemany(
+                    "INSERT INTO pages (digest, parser_version, page_num, text, records) VALUES (?, ?, ?, ?, ?)",
+                    rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (digest, parser_version, page_count, byte_size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (digest, self.parser_version, page_count, byte_size, time.time()))
+                if page_sizes:
+                    # Sizes don't depend on the parser, so every parser version shares them
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO page_sizes (digest, page_num, width, height) VALUES (?, ?, ?, ?)",
+                        [(digest, page_num, width, height) for page_num, (width, height) in page_sizes.items()])
+                self.evict(conn)
+
+    def evict(self, conn):
+        """Drop least recently used scripts until the cache fits in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(byte_size), 0) FROM documents").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for digest, parser_version, byte_size in conn.execute(
+                "SELECT digest, parser_version, byte_size FROM documents ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM pages WHERE digest = ? AND parser_version = ?", (digest, parser_version))
+            conn.execute("DELETE FROM documents WHERE digest = ? AND parser_version = ?", (digest, parser_version))
+            total -= byte_size
+            if total <= self.max_bytes:
+                break
+        conn.execute("DELETE FROM page_sizes WHERE digest NOT IN (SELECT digest FROM documents)")
+
+    def clear(self):
+        with closing(self.connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM pages")
+                conn.execute("DELETE FROM documents")
+                conn.execute("DELETE FROM page_sizes")
+                conn.execute("DELETE FROM files")
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ImportTrace:
+    """
+    Records how long each stage of an import takes, with counts of what the
+    stage handled (pages, lines, shapes, SVG bytes...).
+
+    Stages may be recorded from the worker thread and the GUI thread. The
+    spans can be summarised per stage or written as a Chrome trace file
+    (chrome://tracing, Perfetto) for a timeline view.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.spans = []  # (stage, start, duration, thread id, counts), times in seconds
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name, **counts):
+        """
+        Time a block as one span of stage `name`. The yielded dict holds the
+        span's counts; add to it inside the block.
+
+            with trace.stage("get_text", pages=len(pages)) as span:
+                ...
+                span["chars"] = chars
+        """
+        if not self.enabled:
+            yield counts
+            return
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.spans.append((name, start - self._origin, duration, threading.get_ident(), counts))
+
+    def summary(self):
+        """
+        Total the spans per stage, in the order stages first ran.
+
+        :return: Dict of stage -> {"calls", "seconds", plus each count summed}
+        """
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for name, _, duration, _, counts in spans:
+            total = totals.setdefault(name, {"calls": 0, "seconds": 0.0})
+            total["calls"] += 1
+            total["seconds"] += duration
+            for key, value in counts.items():
+                total[key] = total.get(key, 0) + value
+        return totals
+
+    def summary_text(self):
+        lines = []
+        for name, total in self.summary().items():
+            counts = ", ".join(f"{key} {value}" for key, value in total.items() if key not in ("calls", "seconds"))
+            line = f"{name}: {total['seconds'] * 1000:.1f} ms in {total['calls']} call(s)"
+            lines.append(f"{line}; {counts}" if counts else line)
+        return "\n".join(lines) if lines else "Nothing recorded yet."
+
+    def to_chrome_trace(self):
+        """Return the spans in the Chrome trace event format, as complete ("X") events in microseconds."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = [{
+            "name": name,
+            "cat": "textporter",
+            "ph": "X",
+            "ts": round(start * 1e6, 1),
+            "dur": round(duration * 1e6, 1),
+            "pid": pid,
+            "tid": thread_id,
+            "args": counts,
+        } for name, start, duration, thread_id, counts in spans]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, file_path):
+        with open(file_path, "w") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+# Used where no trace is passed in, so call sites don't need to check for None
+NO_TRACE = ImportTrace(enabled=False)
@@ -0,0 +1,61 @@
+from .revisions import build_revision, diff_revisions
+from .script_parser import parser_cache_version, positioned_page_dialogues
+from .sources import open_script
+from .speaker_parser import get_profile
+
+
+def load_script(pdf_file, progress=None, workers=1, cache=None, previous=None, profile=None, trace=None,
+                layout_pages=None):
+    """
+    Open a script (PDF, Fountain or plain text, see sources.py), read every
+    page and parse its speaker lines. Meant to run
+    off the GUI thread; the session is closed again if loading fails or is
+    cancelled.
+
+    :param workers: Processes to extract with, see PdfSession.prefetch
+    :param cache: Optional ExtractionCache to read from and fill
+    :param previous: The ScriptRevision loaded before; pages it already holds are not re-parsed
+    :param profile: ParserProfile for speaker lines, the colon profile by default
+    :param trace: Optional ImportTrace to record stage timings in; the session keeps it
+    :param layout_pages: Optional {1-indexed page: records} of pages inserted at their printed
+        positions; the pages whose records no longer match are read again with their layout,
+        into revision.layouts, so watch mode can patch them without touching the PDF
+    :return: A (session, revision, diff) tuple, see build_revision and diff_revisions
+    """
+    profile = profile or get_profile()
+    if cache is not None:
+        cache = cache.with_parser_version(parser_cache_version(profile))
+    if previous is not None and previous.profile is not profile:
+        # Records parsed with another profile can't be reused
+        previous = None
+    session = open_script(pdf_file, cache, profile, trace)
+    trace = session.trace
+    try:
+        session.prefetch(workers=workers, progress=progress)
+        if session.page_count:
+            # Known from extraction or the cache; otherwise read here rather than by the page strip
+            session.page_size(0)
+        with trace.stage("parse", pages=session.page_count) as span:
+            revision = build_revision(session, previous)
+            span["lines"] = len(revision.store)
+            span["speakers"] = len(revision.store.speakers)
+            span["words"] = len(revision.index)
+            span["store_bytes"] = revision.store.footprint()["total"]
+        if layout_pages:
+            changed = [page for page, records in layout_pages.items()
+                       if page <= session.page_count and tuple(revision.page_records(page - 1)) != records]
+            with trace.stage("layout", pages=len(changed)):
+                for page in changed:
+                    dialogues = positioned_page_dialogues(session, page)
+                    if dialogues is not None:
+                        revision.layouts[page - 1] = dialogues
+        with trace.stage("diff"):
+            diff = diff_revisions(previous, revision)
+        with trace.stage("cache_store"):
+            session.save_to_cache()
+        # The revision holds every line now; a whole script's text needn't stay in memory
+        session.release_text()
+    except BaseException:
+        session.close()
+        raise
+    return session, revision, diff
@@ -0,0 +1,92 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from .import_trace import NO_TRACE
+
+
+class LayerInsertionScheduler(QObject):
+    """
+    Inserts vector layers into a Krita document a few at a time.
+
+    Queued layers are created in batches from a QTimer, so the event loop
+    (and the canvas) gets a turn between batches instead of being blocked
+    for the whole import. All layers go under one group layer, the active
+    node is not switched per layer, and the projection is refreshed once,
+    after the last batch.
+    """
+    progress = pyqtSignal(int, int)  # layers inserted, layers queued
+    finished = pyqtSignal(int)  # layers inserted
+    cancelled = pyqtSignal(int)  # layers inserted before cancelling
+    layer_added = pyqtSignal(object, object, object)  # key given to enqueue, layer, its shapes
+
+    def __init__(self, doc, group_name, batch_size=4, interval=0, trace=None, parent=None):
+        """
+        :param doc: The Krita document to insert into
+        :param group_name: Name of the group layer holding the new layers
+        :param batch_size: Layers created per timer tick
+        :param interval: Milliseconds between ticks
+        :param trace: Optional ImportTrace to time layer creation and the refresh in
+        """
+        super().__init__(parent)
+        self.doc = doc
+        self.group_name = group_name
+        self.batch_size = batch_size
+        self.trace = trace or NO_TRACE
+        self.queue = []
+        self.group = None
+        self.inserted = 0
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.run_batch)
+
+    def enqueue(self, layer_name, make_svg, key=None):
+        """
+        Queue a layer. make_svg is called without arguments when the layer is
+        created and returns its SVG text, or "" to leave the layer empty.
+        key is passed back with layer_added once the layer is in the document.
+        """
+        self.queue.append((layer_name, make_svg, key))
+
+    @property
+    def is_running(self):
+        return self.timer.isActive()
+
+    def start(self):
+        self.group = self.doc.createGroupLayer(self.group_name)
+        self.doc.rootNode().addChildNode(self.group, None)
+        self.queue.reverse()  # Pop from the end while keeping the queued order
+        self.timer.start()
+
+    def cancel(self):
+        """Stop after the current batch. Layers already inserted are kept."""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.finish()
+            self.cancelled.emit(self.inserted)
+
+    def run_batch(self):
+        total = self.inserted + len(self.queue)
+        for _ in range(min(self.batch_size, len(self.queue))):
+            layer_name, make_svg, key = self.queue.pop()
+            svg_text = make_svg()
+            with self.trace.stage("createVectorLayer", layers=1):
+                vector_layer = self.doc.createVectorLayer(layer_name)
+            shapes = []
+            if svg_text:
+                with self.trace.stage("addShapesFromSvg", bytes=len(svg_text)) as span:
+                    shapes = vector_layer.addShapesFromSvg(svg_text)
+                    span["shapes"] = len(shapes)
+            with self.trace.stage("addChildNode"):
+                self.group.addChildNode(vector_layer, None)
+            self.layer_added.emit(key, vector_layer, shapes)
+            self.inserted += 1
+        self.progress.emit(self.inserted, total)
+        if not self.queue:
+            self.timer.stop()
+            self.finish()
+            self.finished.emit(self.inserted)
+
+    def finish(self):
+        self.queue = []
+        self.doc.setActiveNode(self.group)
+        with self.trace.stage("refreshProjection"):
+            self.doc.refreshProjection()
@@ -0,0 +1,116 @@
+from difflib import SequenceMatcher
+
+
+def shape_positions(shapes):
+    """The (name, position) of each shape, in the order of the records they were made from."""
+    return [(shape.name(), shape.position()) for shape in shapes]
+
+
+def matching_lines(old_records, new_records):
+    """
+    Pair the lines of a page before and after a revision, so a line keeps
+    its pairing when lines are inserted or deleted above it. Lines rewritten
+    in place pair up with their replacement.
+
+    :return: (old index, new index) pairs
+    """
+    matcher = SequenceMatcher(None, old_records, new_records, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag in ("equal", "replace"):
+            yield from zip(range(i1, i2), range(j1, j2))
+
+
+class TrackedPage:
+    """What the plugin put on one page's layer: the dialogue and the shapes it became."""
+    __slots__ = ("page", "layer", "layer_id", "records", "positions", "y_pos")
+
+    def __init__(self, page, layer, records, positions, y_pos):
+        self.page = page
+        self.layer = layer
+        self.layer_id = layer.uniqueId()
+        self.records = records
+        self.positions = positions  # (shape name, position the plugin gave it) per record
+        self.y_pos = y_pos  # None if the lines were placed at their script positions
+
+
+class LayerTracker:
+    """
+    Remembers the vector layers inserted into one document, per 1-indexed
+    page, so a revised script can be patched into them in place.
+
+    Layers are found again by unique id, and only the text shapes the plugin
+    created (by shape name, i.e. their SVG id) are replaced, so balloons or
+    other shapes drawn on the same layer survive an update.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.pages = {}
+
+    def track(self, key, layer, shapes):
+        """
+        Record an inserted layer. Connected to LayerInsertionScheduler.layer_added.
+
+        :param key: (page, records, y_pos) as queued by the docker
+        """
+        page, records, y_pos = key
+        self.pages[page] = TrackedPage(page, layer, records, shape_positions(shapes), y_pos)
+
+    def find_layer(self, tracked):
+        """Return the tracked page's layer, or None if it was deleted from the document."""
+        find = getattr(self.doc, "nodeByUniqueID", None)
+        if find is not None:
+            return find(tracked.layer_id)
+        return tracked.layer if tracked.layer.parentNode() is not None else None
+
+    def page_layer(self, page):
+        """Return the layer a 1-indexed page was inserted into, or None if it isn't in the document."""
+        tracked = self.pages.get(page)
+        return self.find_layer(tracked) if tracked is not None else None
+
+    def changed_pages(self, page_records):
+        """
+        Return the tracked pages whose dialogue differs from what was inserted.
+
+        :param page_records: Called as page_records(page) for the current (name, text) records of a page
+        """
+        return [page for page, tracked in self.pages.items() if tuple(page_records(page)) != tracked.records]
+
+    def positioned_pages(self):
+        """Return {page: records as inserted} of the pages placed at their script positions."""
+        return {page: tracked.records for page, tracked in self.pages.items() if tracked.y_pos is None}
+
+    def patch(self, page, records, svg_text):
+        """
+        Replace the text shapes of a page's layer. Shapes the user moved away
+        from where they were inserted keep their position on the shape of the
+        same line after the revision (see matching_lines), whatever its index
+        now; the others take the position of the new layout, which moves down
+        when a revised line above them wraps to more lines.
+
+        :return: False if the layer is gone, in which case the page is no longer tracked
+        """
+        tracked = self.pages[page]
+        layer = self.find_layer(tracked)
+        if layer is None:
+            del self.pages[page]
+            return False
+        inserted = {name: (i, position) for i, (name, position) in enumerate(tracked.positions)}
+        moved = {}  # Record index -> position the user moved the shape to
+        for shape in layer.shapes():
+            if shape.name() in inserted:
+                i, inserted_at = inserted[shape.name()]
+                position = shape.position()
+                if position != inserted_at:
+                    moved[i] = position
+                shape.remove()
+        shapes = layer.addShapesFromSvg(svg_text) if svg_text else []
+        # Remember where the new layout put each shape before restoring the moved ones,
+        # so a moved shape still counts as moved at the next patch
+        tracked.positions = shape_positions(shapes)
+        if moved:
+            for i, j in matching_lines(tracked.records, tuple(records)):
+                if i in moved and j < len(shapes):
+                    shapes[j].setPosition(moved[i])
+        tracked.records = records
+        return True
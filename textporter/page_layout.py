@@ -0,0 +1,104 @@
+"""
+Where dialogue sits on a script page, for placing it at the same spot on
+the canvas instead of stacking it down the layer.
+
+A PdfSession reads a page's lines with get_text("dict"): the text of each
+line plus its bounding box, baseline and font. The lines are parsed with the
+session's ParserProfile as they are, so the same pass gives the speaker
+records and where each of them was printed.
+"""
+
+
+class TextLine:
+    """One printed line of a page, in PDF points from the top-left corner."""
+    __slots__ = ("text", "bbox", "origin", "font", "size")
+
+    def __init__(self, text, bbox, origin, font, size):
+        self.text = text
+        self.bbox = bbox  # (x0, y0, x1, y1)
+        self.origin = origin  # (x, y) of the baseline where the line starts
+        self.font = font
+        self.size = size
+
+
+def lines_from_dict(page_dict):
+    """
+    Turn the output of page.get_text("dict") into TextLines, in reading
+    order. Image blocks are skipped. Joining the lines' text with newlines
+    gives the same text as get_text("text").
+    """
+    lines = []
+    for block in page_dict["blocks"]:
+        if block["type"] != 0:
+            continue
+        for line in block["lines"]:
+            spans = line["spans"]
+            if not spans:
+                continue
+            first = spans[0]
+            lines.append(TextLine("".join(span["text"] for span in spans), tuple(line["bbox"]),
+                                  tuple(first["origin"]), first["font"], first["size"]))
+    return lines
+
+
+def with_blank_lines(lines):
+    """
+    Put back the blank lines that separate paragraphs, which PDF text
+    extraction drops: an empty TextLine goes wherever the next baseline is
+    more than half a line further down than the page's usual line step.
+    Screenplay cue blocks are told apart by these gaps.
+    """
+    steps = [line.origin[1] - previous.origin[1] for previous, line in zip(lines, lines[1:])
+             if line.origin[1] - previous.origin[1] >= previous.size / 2]
+    if not steps:
+        return lines
+    gap = min(steps) * 1.5
+    spaced = [lines[0]]
+    for previous, line in zip(lines, lines[1:]):
+        if line.origin[1] - previous.origin[1] > gap:
+            x0, _, x1, y1 = previous.bbox
+            spaced.append(TextLine("", (x0, y1, x0, y1), (x0, y1), previous.font, previous.size))
+        spaced.append(line)
+    return spaced
+
+
+def page_text(lines):
+    """The plain text of a page's TextLines, one line each."""
+    return "".join(line.text + "\n" for line in lines)
+
+
+def union_bbox(lines):
+    return (min(line.bbox[0] for line in lines), min(line.bbox[1] for line in lines),
+            max(line.bbox[2] for line in lines), max(line.bbox[3] for line in lines))
+
+
+def iter_positioned_records(lines, profile):
+    """
+    Parse a page's TextLines with a ParserProfile.
+
+    :return: Yields (name, text, dialogue_lines) per speaker record, where
+        dialogue_lines are the TextLines its text was read from
+    """
+    numbered = ((line_num, line.text) for line_num, line in enumerate(lines))
+    for first, last, name, text in profile.iter_speaker_spans(numbered):
+        # A cue block's text starts on the line after its cue
+        start = first + 1 if last > first else first
+        yield name, text, lines[start:last + 1]
+
+
+class PageMapping:
+    """
+    Maps PDF points on a page to canvas coordinates: the page is scaled
+    uniformly to fit the canvas and centred on it.
+    """
+
+    def __init__(self, page_width, page_height, canvas_width, canvas_height):
+        self.scale = min(canvas_width / page_width, canvas_height / page_height)
+        self.x_offset = (canvas_width - page_width * self.scale) / 2
+        self.y_offset = (canvas_height - page_height * self.scale) / 2
+
+    def map_point(self, x, y):
+        return round(self.x_offset + x * self.scale, 2), round(self.y_offset + y * self.scale, 2)
+
+    def map_length(self, length):
+        return round(length * self.scale, 2)
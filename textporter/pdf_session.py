@@ -0,0 +1,202 @@
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .page_layout import lines_from_dict, page_text, with_blank_lines
+from .script_session import ScriptSession
+
+
+def load_fitz():
+    """
+    Import PyMuPDF on first use. Krita loads the plugin at every start-up,
+    so the import is deferred until a script is actually opened.
+    """
+    import fitz  # PyMuPDF for PDF handling
+    return fitz
+
+
+# PyMuPDF does not support being used from several threads at once, even on
+# separate documents, so every call into it in this process holds this lock.
+# Worker processes have their own PyMuPDF and don't need it.
+FITZ_LOCK = threading.RLock()
+
+
+# Below this many pages, starting worker processes costs more than it saves
+PARALLEL_MIN_PAGES = 64
+
+
+def default_worker_count():
+    return os.cpu_count() or 1
+
+
+def rect_size(page):
+    """The (width, height) of a PyMuPDF page in points."""
+    rect = page.rect
+    return round(rect.width), round(rect.height)
+
+
+def read_text(page, blank_lines=False):
+    """
+    Extract the plain text of a PyMuPDF page.
+
+    :param blank_lines: Rebuild the blank lines between paragraphs from the
+        layout, see with_blank_lines; slower, so only for profiles that need them
+    """
+    if blank_lines:
+        return page_text(with_blank_lines(lines_from_dict(page.get_text("dict"))))
+    return page.get_text("text")
+
+
+def extract_page_texts(pdf_file, page_nums, blank_lines=False):
+    """
+    Process pool entry point: open pdf_file in this process and extract
+    the text and size of each page in page_nums.
+
+    :return: A list of (page_num, text, size) tuples
+    """
+    results = []
+    with load_fitz().open(pdf_file) as document:
+        for page_num in page_nums:
+            page = document.load_page(page_num)
+            results.append((page_num, read_text(page, blank_lines), rect_size(page)))
+    return results
+
+
+def split_pages(page_nums, chunks):
+    """Split page_nums into at most `chunks` contiguous runs of similar length."""
+    size, extra = divmod(len(page_nums), chunks)
+    runs = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            runs.append(page_nums[start:end])
+        start = end
+    return runs
+
+
+def parallel_context():
+    """
+    Return a multiprocessing context for extraction, or None if parallel
+    extraction is unavailable. Inside Krita sys.executable is Krita itself,
+    so only "fork" can start workers, and forking a running Qt application
+    is only safe on Linux (macOS offers fork, but the children crash);
+    elsewhere extraction stays serial.
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
+
+
+class PdfSession(ScriptSession):
+    """
+    A ScriptSession over a PDF, read with PyMuPDF.
+
+    The document is opened on first use, so a script served from the
+    ExtractionCache never opens it. Long scripts can be extracted in
+    parallel, see prefetch. Calls into PyMuPDF hold FITZ_LOCK, so the
+    session can be used while thumbnails render on another thread.
+    """
+    RENDERS_PAGES = True
+    HAS_LAYOUT = True
+
+    def __init__(self, pdf_file, cache=None, profile=None, trace=None):
+        self._document = None
+        super().__init__(pdf_file, cache, profile, trace)
+
+    @property
+    def document(self):
+        """The fitz.Document, opened on first use."""
+        if self._document is None:
+            self.check_open()
+            with self.trace.stage("pdf_open"), FITZ_LOCK:
+                self._document = load_fitz().open(self.pdf_file)
+        return self._document
+
+    def read_page_count(self):
+        with FITZ_LOCK:
+            return self.document.page_count
+
+    def load_page(self, page_num):
+        """
+        Return the PyMuPDF page object for a 0-indexed page number, noting its
+        size. Hold FITZ_LOCK while using it.
+        """
+        page = self.document.load_page(page_num)
+        if page_num not in self._page_sizes:
+            self._page_sizes[page_num] = rect_size(page)
+        return page
+
+    @property
+    def blank_lines(self):
+        """Whether the profile tells speeches apart by blank lines, which PDF text lacks."""
+        return self.profile is not None and self.profile.cue_blocks
+
+    def read_page_text(self, page_num):
+        with FITZ_LOCK:
+            return read_text(self.load_page(page_num), self.blank_lines)
+
+    def page_lines(self, page_num):
+        """
+        Read a page with get_text("dict"). The page's plain text is kept
+        from the same pass, so a page read this way is not extracted again.
+        """
+        self.check_open()
+        with FITZ_LOCK:
+            lines = lines_from_dict(self.load_page(page_num).get_text("dict"))
+        if self.blank_lines:
+            lines = with_blank_lines(lines)
+        if page_num not in self._page_text:
+            self._page_text[page_num] = page_text(lines)
+            self._cache_dirty = True
+        return lines
+
+    def read_page_size(self, page_num):
+        with FITZ_LOCK:
+            return rect_size(self.load_page(page_num))
+
+    def _prefetch(self, pending, workers, progress):
+        """
+        With more than one worker and at least PARALLEL_MIN_PAGES pages to
+        read, the pages are split into contiguous runs across a process pool;
+        each worker process opens the file itself and the results are stored
+        back in page order. Otherwise the pages are read serially through
+        this session.
+        """
+        total = len(pending)
+        context = parallel_context()
+        if workers > 1 and total >= PARALLEL_MIN_PAGES and context is not None:
+            runs = split_pages(pending, min(workers, total))
+            texts = {}
+            with ProcessPoolExecutor(max_workers=len(runs), mp_context=context) as pool:
+                # The workers are forked while submitting; a thumbnail render holding
+                # PyMuPDF's state at that moment would leave it locked in the children
+                with FITZ_LOCK:
+                    futures = [pool.submit(extract_page_texts, self.pdf_file, run, self.blank_lines)
+                               for run in runs]
+                try:
+                    for future in as_completed(futures):
+                        for page_num, text, size in future.result():
+                            texts[page_num] = text
+                            self._page_sizes[page_num] = size
+                        if progress:
+                            progress(len(texts), total)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            for page_num in pending:
+                self._page_text[page_num] = texts[page_num]
+            self._cache_dirty = True
+        else:
+            super()._prefetch(pending, workers, progress)
+
+    def close(self):
+        """Close the underlying document and drop the cached text."""
+        if self._document is not None:
+            with FITZ_LOCK:
+                self._document.close()
+            self._document = None
+        super().close()
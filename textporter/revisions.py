@@ -0,0 +1,124 @@
+import hashlib
+from difflib import SequenceMatcher
+
+from .dialogue_index import DialogueIndex
+from .dialogue_store import DialogueStore
+from .script_parser import iter_pages, page_speaker_lines
+
+
+def page_digest(text):
+    """Return a short content hash of a page's extracted text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ScriptRevision:
+    """
+    Per-page text digests and speaker lines of one loaded script. The lines
+    live in a DialogueStore, searchable through a DialogueIndex; pages are
+    0-indexed, as in PdfSession.
+    """
+
+    def __init__(self, pdf_file, digests, store, profile=None, index=None):
+        self.pdf_file = pdf_file
+        self.profile = profile  # ParserProfile the lines were parsed with
+        self.digests = digests  # list of page digests, in page order
+        self.store = store
+        self.index = index if index is not None else DialogueIndex.from_store(store)
+        self.layouts = {}  # page_num -> Dialogues read with their layout, see load_script
+
+    @property
+    def page_count(self):
+        return len(self.digests)
+
+    def page_records(self, page_num):
+        return self.store.page_records(page_num)
+
+    def speakers(self):
+        return set(self.store.names())
+
+
+class RevisionDiff:
+    """
+    Pages whose dialogue changed between two revisions, as 1-indexed page
+    numbers: added and modified refer to the new revision, removed to the old.
+    """
+
+    def __init__(self, added, removed, modified, speakers):
+        self.added = added
+        self.removed = removed
+        self.modified = modified
+        self.speakers = speakers  # every speaker with a line on a changed page, old or new
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def summary(self):
+        parts = []
+        for label, pages in (("added", self.added), ("removed", self.removed), ("modified", self.modified)):
+            if pages:
+                parts.append(f"{label}: {', '.join(map(str, pages))}")
+        return "; ".join(parts) if parts else "no dialogue changes"
+
+
+def build_revision(session, previous=None):
+    """
+    Hash every page of the session and parse only pages whose text is new.
+    Pages whose digest already appears in the previous revision reuse its
+    records, even if they have moved because pages were inserted or cut.
+    Every line is added to the revision's search index as it is stored.
+
+    :param session: The PdfSession of the script being loaded
+    :param previous: The ScriptRevision loaded before, or None
+    :return: A ScriptRevision
+    """
+    known = {}
+    if previous is not None:
+        known = {digest: page_num for page_num, digest in enumerate(previous.digests)}
+    digests = []
+    store = DialogueStore()
+    index = DialogueIndex(store)
+    for page_num, text in iter_pages(session):
+        digest = page_digest(text)
+        if digest in known and page_num not in session.page_records:
+            session.set_page_records(page_num, previous.page_records(known[digest]))
+        digests.append(digest)
+        for name, dialogue_text in page_speaker_lines(session, page_num):
+            index.add(len(store), name, dialogue_text)
+            store.add(name, dialogue_text, page_num)
+    return ScriptRevision(session.pdf_file, digests, store, session.profile, index)
+
+
+def diff_revisions(previous, current):
+    """
+    Align two revisions by page digest and report which pages changed.
+    With no previous revision every page counts as added.
+    """
+    if previous is None:
+        added = sorted({page_num + 1 for page_num in current.store.pages})
+        return RevisionDiff(added, [], [], current.speakers())
+    added, removed, modified = [], [], []
+    speakers = set()
+    matcher = SequenceMatcher(None, previous.digests, current.digests, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        for offset in range(paired):
+            old_records = previous.page_records(i1 + offset)
+            new_records = current.page_records(j1 + offset)
+            # The page text changed, but only report it if its dialogue did
+            if old_records != new_records:
+                modified.append(j1 + offset + 1)
+                speakers.update(name for name, text in old_records)
+                speakers.update(name for name, text in new_records)
+        for page_num in range(j1 + paired, j2):
+            page_records = current.page_records(page_num)
+            if page_records:
+                added.append(page_num + 1)
+                speakers.update(name for name, text in page_records)
+        for page_num in range(i1 + paired, i2):
+            page_records = previous.page_records(page_num)
+            if page_records:
+                removed.append(page_num + 1)
+                speakers.update(name for name, text in page_records)
+    return RevisionDiff(added, removed, modified, speakers)
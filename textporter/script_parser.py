@@ -0,0 +1,199 @@
+
+from .page_layout import iter_positioned_records, union_bbox
+from .speaker_parser import get_profile
+
+
+# Bump whenever parsing output changes so cached records from older versions are ignored
+PARSER_VERSION = 4
+
+
+# Dialogue class to represent each dialogue entry
+class Dialogue:
+    __slots__ = ("name", "dialog_type", "text", "color", "page", "bbox", "origin", "font", "size")
+
+    def __init__(self, name, dialog_type, text, color, page=None, bbox=None, origin=None, font=None, size=None):
+        self.name = name
+        self.dialog_type = dialog_type
+        self.text = text
+        self.color = color
+        self.page = page
+        # Where the line was printed, in PDF points, when read with its layout; see page_layout.py
+        self.bbox = bbox
+        self.origin = origin
+        self.font = font
+        self.size = size
+
+
+def parse_page_ranges(page_ranges):
+    """
+    Flatten a page selection into a sorted list of unique 1-indexed pages.
+    The page_ranges parameter can be
+    A tuple: (1, 5) → [1, 2, 3, 4, 5]
+    A list: [1, 3, 5] → [1, 3, 5]
+    A single integer: 5 → [5]
+    A string range: "1-5" → [1, 2, 3, 4, 5]
+    A string list: "1,3,5" → [1, 3, 5]
+    A mixed string: "1-3,7" → [1, 2, 3, 7]
+    """
+    page_list = []
+    if isinstance(page_ranges, str):  # Handle string-based input
+        for part in page_ranges.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                if '-' in part:  # Example: "1-5"
+                    start, end = map(int, part.split('-'))
+                    page_list.extend(range(start, end + 1))
+                else:
+                    page_list.append(int(part))
+            except ValueError:
+                raise ValueError(f"Invalid string format for page_ranges: {page_ranges}")
+        if not page_list:
+            raise ValueError(f"Invalid string format for page_ranges: {page_ranges}")
+    elif isinstance(page_ranges, tuple):  # Handle tuple (start, end)
+        start, end = page_ranges
+        page_list.extend(range(start, end + 1))
+    elif isinstance(page_ranges, list):  # Handle list of individual pages
+        page_list.extend(page_ranges)
+    elif isinstance(page_ranges, int):  # Handle single page
+        page_list.append(page_ranges)
+    else:
+        raise TypeError(f"Unsupported type for page_ranges: {type(page_ranges)}")
+
+    # Ensure page_list is sorted and contains unique pages
+    return sorted(set(page_list))
+
+
+def format_page_ranges(pages):
+    """
+    The reverse of parse_page_ranges: write 1-indexed pages as a compact
+    string, e.g. [1, 2, 3, 4, 5, 8] → "1-5,8".
+    """
+    parts = []
+    run_start = run_end = None
+    for page in sorted(set(pages)):
+        if run_end is not None and page == run_end + 1:
+            run_end = page
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == run_end else f"{run_start}-{run_end}")
+        run_start = run_end = page
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == run_end else f"{run_start}-{run_end}")
+    return ",".join(parts)
+
+
+def parser_cache_version(profile):
+    """Cache version for records parsed with a profile, see ExtractionCache."""
+    return f"{PARSER_VERSION}:{profile.name}"
+
+
+# Streaming pipeline: iter_pages -> iter_lines -> iter_dialogues. Each stage
+# pulls one item at a time from the previous one, so nothing holds more than
+# the current page unless a consumer chooses to collect the results.
+
+def iter_pages(session, page_nums=None, keep=True):
+    """
+    Yield (page_num, text) for each page of a session, 0-indexed.
+
+    :param page_nums: 0-indexed page numbers, or None for every page
+    :param keep: If False, pages not already extracted are streamed without being kept in the session
+    """
+    return session.iter_page_text(page_nums, keep)
+
+
+def iter_lines(pages):
+    """Yield (page_num, line) for every line of every page from iter_pages."""
+    for page_num, text in pages:
+        for line in text.split("\n"):
+            yield page_num, line
+
+
+def iter_speaker_lines(lines, profile=None):
+    """Yield (page_num, name, text) for every speaker line from iter_lines."""
+    return (profile or get_profile()).iter_speaker_lines(lines)
+
+
+def iter_dialogues(lines, profile=None):
+    """Yield a Dialogue for every speaker line from iter_lines, with a 1-indexed page."""
+    for page_num, name, text in iter_speaker_lines(lines, profile):
+        yield Dialogue(name, "dialogue", text, None, page_num + 1)
+
+
+def page_speaker_lines(session, page_num):
+    """
+    Return the (name, text) speaker records of a page, parsing it only once
+    per session with the session's profile. Records loaded from an
+    ExtractionCache skip parsing entirely.
+
+    :param page_num: 0-indexed page number
+    """
+    records = session.page_records.get(page_num)
+    if records is None:
+        lines = iter_lines([(page_num, session.page_text(page_num))])
+        records = [(name, text) for _, name, text in iter_speaker_lines(lines, session.profile)]
+        session.set_page_records(page_num, records)
+    return records
+
+
+def iter_page_dialogues(session, page_list):
+    """
+    Lazily yield (page, dialogues) for each 1-indexed page in page_list.
+    """
+    for page in page_list:
+        # Page numbers in PyMuPDF are 0-indexed
+        yield page, [Dialogue(name, "dialogue", text, None, page)
+                     for name, text in page_speaker_lines(session, page - 1)]
+
+
+def positioned_page_dialogues(session, page):
+    """
+    Read and parse one page together with its layout, so every Dialogue
+    carries where it was printed. The page's records are stored on the
+    session as page_speaker_lines would.
+
+    :param page: 1-indexed page number
+    :return: The page's Dialogue objects, or None if the session has no layout
+    """
+    lines = session.page_lines(page - 1)
+    if lines is None:
+        return None
+    dialogues = []
+    for name, text, dialogue_lines in iter_positioned_records(lines, session.profile):
+        first = dialogue_lines[0]
+        dialogues.append(Dialogue(name, "dialogue", text, None, page, union_bbox(dialogue_lines),
+                                  first.origin, first.font, first.size))
+    if page - 1 not in session.page_records:
+        session.set_page_records(page - 1, [(dialogue.name, dialogue.text) for dialogue in dialogues])
+    return dialogues
+
+
+def build_dialogue_index(session, page_list, progress=None, workers=1, layout=False):
+    """
+    Extract dialogues for the selected pages only.
+
+    :param session: The PdfSession of the current script
+    :param page_list: 1-indexed page numbers, as returned by parse_page_ranges
+    :param progress: Optional callback called as progress(done, total) while pages are read
+    :param workers: Processes to extract with, see PdfSession.prefetch
+    :param layout: Read each page with its layout, in one pass, so the dialogues carry
+        their position on the page; ignored for sources without a layout
+    :return: A dict mapping each page number to that page's dialogues
+    """
+    if layout and session.HAS_LAYOUT:
+        index = {}
+        with session.trace.stage("layout", pages=len(page_list)) as span:
+            for done, page in enumerate(page_list, 1):
+                index[page] = positioned_page_dialogues(session, page)
+                if progress:
+                    progress(done, len(page_list))
+            span["lines"] = sum(len(dialogues) for dialogues in index.values())
+        session.save_to_cache()
+        return index
+    session.prefetch([page - 1 for page in page_list], workers, progress)
+    with session.trace.stage("parse", pages=len(page_list)) as span:
+        index = dict(iter_page_dialogues(session, page_list))
+        span["lines"] = sum(len(dialogues) for dialogues in index.values())
+    session.save_to_cache()
+    return index
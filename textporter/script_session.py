@@ -0,0 +1,177 @@
+from .import_trace import NO_TRACE
+
+
+class ScriptSession:
+    """
+    One open script for the duration of an import, whatever file it came from.
+
+    Every stage (style parsing, dialogue extraction, layer creation) reads
+    pages through the same session so the file is opened and parsed once.
+    Page text is read on first use and kept for later stages. Page numbers
+    are 0-indexed.
+
+    Subclasses read a particular kind of file; they implement
+    read_page_count and read_page_text. See sources.py for the registry of
+    input sources.
+
+    With an ExtractionCache, a script seen before is served from the cache
+    and the file is only read if a page outside the cache is requested.
+
+    An ImportTrace passed as `trace` times cache lookups and text extraction;
+    later stages that work on the session record into it too.
+    """
+
+    # Size of a page in points, for sources that don't have one of their own
+    DEFAULT_PAGE_SIZE = (612, 792)  # US Letter
+    # Whether the pages can be rendered as images, for the docker's page strip
+    RENDERS_PAGES = False
+    # Whether page_lines knows where each line was printed
+    HAS_LAYOUT = False
+
+    def __init__(self, pdf_file, cache=None, profile=None, trace=None):
+        # pdf_file is the script's path, whatever its format
+        self.pdf_file = pdf_file
+        self.cache = cache
+        self.trace = trace or NO_TRACE
+        # ParserProfile that page_records are parsed with; None means the default
+        self.profile = profile
+        self.cache_key = None
+        self.from_cache = False
+        self._closed = False
+        self._page_text = {}
+        # (width, height) in points per page, read on first use or from the cache
+        self._page_sizes = {}
+        # Parsed speaker records per page, filled in by script_parser
+        self.page_records = {}
+        self._cache_dirty = False
+        self._page_count = None
+        if cache is not None:
+            with self.trace.stage("cache_lookup") as span:
+                self.cache_key = cache.key_for(pdf_file)
+                entry = cache.load(self.cache_key)
+                span["hits"] = int(entry is not None)
+            if entry is not None:
+                self._page_count, self._page_text, self.page_records, self._page_sizes = entry
+                self.from_cache = True
+        if self._page_count is None:
+            self._page_count = self.read_page_count()
+
+    def read_page_count(self):
+        raise NotImplementedError
+
+    def read_page_text(self, page_num):
+        """Read the plain text of one page from the file."""
+        raise NotImplementedError
+
+    def check_open(self):
+        if self._closed:
+            raise ValueError(f"Session for {self.pdf_file} is closed")
+
+    @property
+    def page_count(self):
+        return self._page_count
+
+    def read_page_size(self, page_num):
+        """Read the (width, height) of one page from the file."""
+        return self.DEFAULT_PAGE_SIZE
+
+    def page_size(self, page_num):
+        """
+        Return the (width, height) of a page in points, reading it only once.
+        Sizes of pages already extracted, or served from the cache, are known
+        without touching the file.
+        """
+        size = self._page_sizes.get(page_num)
+        if size is None:
+            size = self._page_sizes[page_num] = self.read_page_size(page_num)
+            self._cache_dirty = True
+        return size
+
+    def page_lines(self, page_num):
+        """
+        Return the TextLines of a page with their positions, see page_layout.py,
+        or None for sources that have no layout.
+        """
+        return None
+
+    def page_text(self, page_num, keep=True):
+        """
+        Return the plain text of a page, reading it only once.
+
+        :param page_num: 0-indexed page number
+        :param keep: If False, a page not already read is returned without being stored
+        """
+        text = self._page_text.get(page_num)
+        if text is None:
+            text = self.read_page_text(page_num)
+            if keep:
+                self._page_text[page_num] = text
+                self._cache_dirty = True
+        return text
+
+    def set_page_records(self, page_num, records):
+        """Keep the parsed speaker records of a page so they can be cached."""
+        self.page_records[page_num] = records
+        self._cache_dirty = True
+
+    def save_to_cache(self):
+        """Write the extracted text and records back once every page has been read."""
+        if self.cache is None or not self._cache_dirty or len(self._page_text) < self.page_count:
+            return
+        self.cache.store(self.cache_key, self.page_count, self._page_text, self.page_records, self._page_sizes)
+        self._cache_dirty = False
+
+    def prefetch(self, page_nums=None, workers=1, progress=None):
+        """
+        Read the text of many pages up front. Pages already parsed are
+        skipped; their records are all later stages need.
+
+        :param page_nums: 0-indexed page numbers, or None for every page
+        :param workers: Maximum number of worker processes, for sources that can use them
+        :param progress: Optional callback called as progress(done, total)
+        """
+        if page_nums is None:
+            page_nums = range(self.page_count)
+        pending = [page_num for page_num in page_nums
+                   if page_num not in self._page_text and page_num not in self.page_records]
+        with self.trace.stage("get_text", pages=len(pending)) as span:
+            self._prefetch(pending, workers, progress)
+            span["chars"] = sum(len(self._page_text[page_num]) for page_num in pending)
+
+    def _prefetch(self, pending, workers, progress):
+        total = len(pending)
+        for done, page_num in enumerate(pending, 1):
+            self.page_text(page_num)
+            if progress:
+                progress(done, total)
+
+    def iter_page_text(self, page_nums=None, keep=True):
+        """Yield ``(page_num, text)`` for the given pages, or every page."""
+        if page_nums is None:
+            page_nums = range(self.page_count)
+        for page_num in page_nums:
+            yield page_num, self.page_text(page_num, keep)
+
+    def release_text(self):
+        """
+        Drop the text of every page once the pages are parsed and cached.
+        Later stages work from page_records; a page whose text is asked for
+        again is read from the file.
+        """
+        self._page_text.clear()
+
+    def close(self):
+        """Release the file and drop the cached text."""
+        self._closed = True
+        self._page_text.clear()
+        self.page_records.clear()
+
+    @property
+    def is_closed(self):
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,55 @@
+import os
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class ScriptWatcher(QObject):
+    """
+    Watches one script file and emits `changed` once it has settled.
+
+    PDF writers often save in several steps, or by replacing the file, which
+    drops it from QFileSystemWatcher; the path is re-added after each change
+    and `changed` is only emitted after `delay` ms without further changes.
+    """
+    changed = pyqtSignal(str)
+
+    def __init__(self, delay=750, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.file_changed)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.settled)
+
+    def watch(self, path):
+        self.stop()
+        self.path = path
+        self.watcher.addPath(path)
+
+    def stop(self):
+        self.timer.stop()
+        if self.watcher.files():
+            self.watcher.removePaths(self.watcher.files())
+        self.path = None
+
+    def retry(self):
+        """Emit `changed` again after the delay, e.g. when the change couldn't be handled yet."""
+        if self.path is not None:
+            self.timer.start()
+
+    def rewatch(self):
+        if self.path not in self.watcher.files() and os.path.exists(self.path):
+            self.watcher.addPath(self.path)
+
+    def file_changed(self, path):
+        self.rewatch()
+        self.timer.start()  # Restart the delay on every change
+
+    def settled(self):
+        if self.path is None:
+            return
+        self.rewatch()
+        if os.path.exists(self.path):
+            self.changed.emit(self.path)
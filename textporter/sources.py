@@ -0,0 +1,57 @@
+"""
+Input sources: which ScriptSession reads which kind of script file.
+
+A new source is a ScriptSession subclass plus an entry in SOURCES; the
+importer, the batch command and the docker's open dialog pick it up from here.
+"""
+import os
+
+from .pdf_session import PdfSession
+from .text_session import FountainSession, TextSession
+
+
+class ScriptSource:
+    def __init__(self, label, extensions, session_class):
+        self.label = label
+        self.extensions = extensions
+        self.session_class = session_class
+
+    def file_filter(self):
+        return f"{self.label} ({' '.join('*' + extension for extension in self.extensions)})"
+
+
+SOURCES = [
+    ScriptSource("PDF Files", (".pdf",), PdfSession),
+    ScriptSource("Fountain Scripts", (".fountain", ".spmd"), FountainSession),
+    ScriptSource("Text Files", (".txt",), TextSession),
+]
+
+
+def source_for(file_path):
+    """Return the ScriptSource that reads file_path, or None if none does."""
+    extension = os.path.splitext(file_path)[1].lower()
+    for source in SOURCES:
+        if extension in source.extensions:
+            return source
+    return None
+
+
+def is_script_file(file_path):
+    return source_for(file_path) is not None
+
+
+def open_script(file_path, cache=None, profile=None, trace=None):
+    """
+    Open a script with the session class for its extension. Unknown
+    extensions are read as PDF, as before other sources existed.
+    """
+    source = source_for(file_path)
+    session_class = source.session_class if source is not None else PdfSession
+    return session_class(file_path, cache, profile, trace)
+
+
+def open_dialog_filter():
+    """The filter string for QFileDialog: every script format first, then each one alone."""
+    extensions = " ".join("*" + extension for source in SOURCES for extension in source.extensions)
+    filters = [f"Scripts ({extensions})"] + [source.file_filter() for source in SOURCES]
+    return ";;".join(filters + ["All Files (*)"])
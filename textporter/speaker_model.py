@@ -0,0 +1,126 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+
+
+NAME_ROLE = Qt.UserRole
+LINE_COUNT_ROLE = Qt.UserRole + 1
+
+
+class SpeakerListModel(QAbstractListModel):
+    """
+    List model over a style registry such as PluginUIWidget.default_styles.
+
+    One row per speaker, in registry order; the "default" entry is not listed.
+    Edits made through the model change the registry and emit only the
+    row-level signals they need, so views keep their scroll position and
+    selection on large casts. Line counts come from the loaded script's
+    DialogueStore, which keeps them per speaker.
+
+    style_changed names every registry entry added, edited or removed
+    through the model; a new registry is announced by modelReset.
+    """
+    style_changed = pyqtSignal(str)
+
+    def __init__(self, styles=None, parent=None):
+        super().__init__(parent)
+        self.styles = {}
+        self.names = []
+        self.rows = {}  # name -> row
+        self.store = None
+        if styles is not None:
+            self.set_styles(styles)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.names):
+            return None
+        name = self.names[index.row()]
+        if role == Qt.DisplayRole:
+            count = self.line_count(name)
+            return f"{name} ({count})" if count else name
+        if role == Qt.ToolTipRole:
+            style = self.styles[name]
+            return f"{style['font']}, {style['size']} pt"
+        if role == NAME_ROLE:
+            return name
+        if role == LINE_COUNT_ROLE:
+            return self.line_count(name)
+        return None
+
+    def line_count(self, name):
+        if self.store is not None:
+            return self.store.line_count(name)
+        # Styles loaded from a saved JSON file carry their lines
+        return len(self.styles[name].get("dialogues", ()))
+
+    def set_styles(self, styles):
+        """Show a different registry. This is a full reset, used when a style file is loaded."""
+        self.beginResetModel()
+        self.styles = styles
+        self.names = [name for name in styles if name != "default"]
+        self.reindex()
+        self.endResetModel()
+
+    def set_store(self, store):
+        """Take line counts from a newly loaded script."""
+        self.store = store
+        if self.names:
+            self.dataChanged.emit(self.index(0), self.index(len(self.names) - 1),
+                                  [Qt.DisplayRole, LINE_COUNT_ROLE])
+
+    def set_style(self, name, style):
+        """Add or replace a speaker's style, inserting or updating only its row."""
+        self.styles[name] = style
+        self.style_changed.emit(name)
+        if name == "default":
+            return
+        row = self.rows.get(name)
+        if row is None:
+            row = len(self.names)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.names.append(name)
+            self.rows[name] = row
+            self.endInsertRows()
+        else:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def add_speakers(self, new_styles):
+        """Append several new speakers as one block of rows. Names already listed are skipped."""
+        names = [name for name in new_styles if name != "default" and name not in self.rows]
+        if not names:
+            return
+        first = len(self.names)
+        self.beginInsertRows(QModelIndex(), first, first + len(names) - 1)
+        for row, name in enumerate(names, first):
+            self.styles[name] = new_styles[name]
+            self.names.append(name)
+            self.rows[name] = row
+        self.endInsertRows()
+        for name in names:
+            self.style_changed.emit(name)
+
+    def remove_speaker(self, name):
+        """Remove a speaker from the registry and its row from the list."""
+        self.styles.pop(name, None)
+        self.style_changed.emit(name)
+        row = self.rows.get(name)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.names[row]
+        self.reindex()
+        self.endRemoveRows()
+
+    def reindex(self):
+        self.rows = {name: row for row, name in enumerate(self.names)}
+
+
+def make_filter_proxy(model, parent=None):
+    """Wrap a SpeakerListModel for type-to-search: case-insensitive substring match on the speaker name."""
+    proxy = QSortFilterProxyModel(parent)
+    proxy.setSourceModel(model)
+    proxy.setFilterRole(NAME_ROLE)
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    return proxy
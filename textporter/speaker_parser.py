@@ -0,0 +1,134 @@
+import re
+
+
+PARENTHETICAL = re.compile(r"\(.*?\)")
+
+# Each rule is (kind, regex). A profile joins its rules into one alternation
+# compiled once, so every line is classified by a single fullmatch; the kind
+# is read back from the outer named group that matched. Inner group names
+# must be unique across a profile's rules.
+BLANK = ("blank", r"\s*")
+COLON_SPEAKER = ("speaker", r"\s*(?P<speaker_name>[^:\s](?:[^:]*[^:\s])?)\s*:\s*(?P<speaker_text>(?:.*\S)?)\s*")
+SCENE_HEADING = ("scene", r"\s*(?:INT\./EXT|INT/EXT|I/E|INT|EXT|EST)[./\s].*")
+TRANSITION = ("transition", r"\s*[A-Z][A-Z ]*(?:TO|OUT|IN):\s*")
+PARENTHETICAL_LINE = ("parenthetical", r"\s*\(.*\)\s*")
+# A Fountain "@" forces a cue whatever its case, e.g. "@McCLANE"
+CUE = ("cue", r"\s*(?:@(?P<forced_name>[^(^]*[^\s(^])|(?P<cue_name>[A-Z](?:[A-Z0-9 .'&\-]*[A-Z0-9.'&\-])?))"
+              r"\s*(?:\([^)]*\)\s*)*\^?\s*")
+TEXT = ("text", r".*")
+
+
+def clean_name(name):
+    """Strip parentheticals such as (V.O.) or (CONT'D) from a speaker name."""
+    if "(" in name:
+        name = PARENTHETICAL.sub("", name).strip()
+    return name
+
+
+class ParserProfile:
+    """
+    A script format: precompiled line rules plus how speaker lines are
+    assembled from them.
+
+    With cue_blocks False, a "speaker" line carries the name and the text
+    ("NAME: text"). With cue_blocks True, a "cue" line names the speaker and
+    the following "text" lines are their dialogue, joined with spaces, until
+    a blank line, scene heading, transition or the next cue. Parenthetical
+    lines inside a block are dropped.
+
+    A cue only starts a block at the start of a page or after a blank line,
+    scene heading or transition. An all-caps line in the middle of a speech,
+    such as "OK." or "NO.", is dialogue.
+    """
+
+    # Line kinds after which a cue may start a new block
+    CUE_AFTER = frozenset(("blank", "scene", "transition"))
+
+    def __init__(self, name, label, rules, cue_blocks=False):
+        self.name = name
+        self.label = label
+        self.rules = rules
+        self.cue_blocks = cue_blocks
+        self.pattern = re.compile("|".join(f"(?P<{kind}>{regex})" for kind, regex in rules))
+
+    def iter_speaker_lines(self, lines):
+        """Yield (page_num, name, text) for the speaker lines in (page_num, line) pairs."""
+        if self.cue_blocks:
+            return ((first, name, text) for first, last, name, text in self._iter_cue_blocks(lines, True))
+        return self._iter_colon_lines(lines)
+
+    def iter_speaker_spans(self, lines):
+        """
+        Like iter_speaker_lines for the lines of a single page, but yield
+        (first_key, last_key, name, text) with the keys of the first and last
+        line each record was read from. The keys are whatever the pairs carry
+        in place of a page number, e.g. line positions on the page; a colon
+        line is both its first and last line.
+        """
+        if self.cue_blocks:
+            return self._iter_cue_blocks(lines, False)
+        return ((key, key, name, text) for key, name, text in self._iter_colon_lines(lines))
+
+    def _iter_colon_lines(self, lines):
+        fullmatch = self.pattern.fullmatch
+        for page_num, line in lines:
+            if ":" not in line:
+                continue  # Can't be a speaker line, no need to run the pattern
+            match = fullmatch(line)
+            if match.lastgroup == "speaker":
+                name = clean_name(match.group("speaker_name"))
+                if name:
+                    yield page_num, name, match.group("speaker_text")
+
+    def _iter_cue_blocks(self, lines, page_keys):
+        """
+        :param page_keys: Whether the keys are page numbers, so a change of key
+            is the start of a page; otherwise all the lines are one page
+        """
+        fullmatch = self.pattern.fullmatch
+        cue_after = self.CUE_AFTER
+        speaker = None
+        block_page = None
+        last_page = None
+        parts = []
+        previous_kind = None  # Kind of the previous line, None at the start of a page
+        previous_page = None
+        for page_num, line in lines:
+            match = fullmatch(line)
+            kind = match.lastgroup
+            if page_keys and page_num != previous_page:
+                previous_kind = None
+            previous_page = page_num
+            if kind == "cue" and previous_kind is not None and previous_kind not in cue_after:
+                kind = "text"  # All caps, but inside a speech or the action
+            previous_kind = kind
+            if kind == "text" and speaker is not None:
+                parts.append(line.strip())
+                last_page = page_num
+                continue
+            if kind == "parenthetical" and speaker is not None:
+                continue
+            # Anything else closes the current block
+            if speaker is not None and parts:
+                yield block_page, last_page, speaker, " ".join(parts)
+            speaker = None
+            parts = []
+            if kind == "cue":
+                speaker = match.group("cue_name") or match.group("forced_name")
+                block_page = page_num
+        if speaker is not None and parts:
+            yield block_page, last_page, speaker, " ".join(parts)
+
+
+PROFILES = {
+    "colon": ParserProfile("colon", "NAME: dialogue", [BLANK, COLON_SPEAKER, TEXT]),
+    "screenplay": ParserProfile(
+        "screenplay", "Screenplay (CUE, then dialogue)",
+        [BLANK, SCENE_HEADING, TRANSITION, PARENTHETICAL_LINE, CUE, TEXT], cue_blocks=True),
+}
+DEFAULT_PROFILE = "colon"
+
+
+def get_profile(name=None):
+    """Return the profile registered under name, or the default profile."""
+    return PROFILES[name or DEFAULT_PROFILE]
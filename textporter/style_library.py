@@ -0,0 +1,128 @@
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+
+from .speaker_parser import clean_name
+from .styles import save_styles
+
+
+# Styles saved without a project apply to every project
+GLOBAL_PROJECT = ""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS styles (
+    project TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    font TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    color TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project, name_key)
+);
+"""
+
+# Keep IN (...) lists under SQLite's default limit of 999 parameters
+LOOKUP_CHUNK = 500
+
+
+def normalize_name(name):
+    """
+    Return the key a speaker is stored under: parentheticals such as (V.O.)
+    dropped, whitespace collapsed and case folded, so "Bob", "BOB (CONT'D)"
+    and " bob " share one style.
+    """
+    return re.sub(r"\s+", " ", clean_name(name)).strip().casefold()
+
+
+class StyleLibrary:
+    """
+    SQLite store of character styles, one row per character and project.
+
+    Characters are looked up by normalized name (see normalize_name); a
+    style saved for a project overrides the one saved without a project.
+    Saving one character writes one row. Dialogue lines are not stored.
+
+    Each call opens its own short-lived connection, like ExtractionCache.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self.connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    @staticmethod
+    def row_for(name, style, project):
+        color = ",".join(str(int(c)) for c in style["color"])
+        return project, normalize_name(name), name, style["font"], int(style["size"]), color, time.time()
+
+    @staticmethod
+    def style_from(font, size, color):
+        return {"font": font, "size": size, "color": [int(c) for c in color.split(",")]}
+
+    def upsert(self, name, style, project=GLOBAL_PROJECT):
+        """Insert or replace the style of one character."""
+        self.upsert_many({name: style}, project)
+
+    def upsert_many(self, styles, project=GLOBAL_PROJECT):
+        """Insert or replace several characters in one transaction."""
+        rows = [self.row_for(name, style, project) for name, style in styles.items()]
+        with closing(self.connect()) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO styles (project, name_key, name, font, size, color, updated) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def lookup_many(self, names, project=GLOBAL_PROJECT):
+        """
+        Look up several characters at once.
+
+        :return: Dict of name -> style, for the names the library has a style for
+        """
+        keys = {}
+        for name in names:
+            keys.setdefault(normalize_name(name), []).append(name)
+        found = {}
+        key_list = list(keys)
+        with closing(self.connect()) as conn:
+            for start in range(0, len(key_list), LOOKUP_CHUNK):
+                chunk = key_list[start:start + LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                # Global rows first, so project rows override them
+                for name_key, font, size, color in conn.execute(
+                        f"SELECT name_key, font, size, color FROM styles "
+                        f"WHERE project IN (?, ?) AND name_key IN ({placeholders}) "
+                        f"ORDER BY project = ?", [GLOBAL_PROJECT, project] + chunk + [project]):
+                    for name in keys[name_key]:
+                        found[name] = self.style_from(font, size, color)
+        return found
+
+    def load(self, project=GLOBAL_PROJECT):
+        """Return every style visible in a project, as a style registry keyed by saved name."""
+        by_key = {}
+        with closing(self.connect()) as conn:
+            for name_key, name, font, size, color in conn.execute(
+                    "SELECT name_key, name, font, size, color FROM styles WHERE project IN (?, ?) "
+                    "ORDER BY project = ?, name_key", (GLOBAL_PROJECT, project, project)):
+                by_key[name_key] = name, self.style_from(font, size, color)
+        return dict(by_key.values())
+
+    def projects(self):
+        with closing(self.connect()) as conn:
+            return [row[0] for row in conn.execute(
+                "SELECT DISTINCT project FROM styles WHERE project != ? ORDER BY project", (GLOBAL_PROJECT,))]
+
+    def export_file(self, file_path, project=GLOBAL_PROJECT):
+        """Write the styles visible in a project as a settings .ini or a .json file."""
+        styles = self.load(project)
+        save_styles(file_path, styles)
+        return len(styles)
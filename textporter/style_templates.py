@@ -0,0 +1,90 @@
+from xml.sax.saxutils import quoteattr
+
+from .style_library import normalize_name
+
+
+def style_attributes(style):
+    """The SVG presentation attributes of a style, as they go into a <text> tag."""
+    color = style["color"]
+    return (f'font-size="{style["size"]}" font-family={quoteattr(style["font"])} '
+            f'fill="rgb({color[0]},{color[1]},{color[2]})"')
+
+
+class StyleTemplate:
+    """A speaker's style, resolved, with its SVG attributes formatted once."""
+    __slots__ = ("key", "name", "style", "attributes")
+
+    def __init__(self, key, name, style):
+        self.key = key  # normalize_name of the speaker it was resolved for
+        self.name = name  # registry entry it was resolved to
+        self.style = style
+        self.attributes = style_attributes(style)
+
+
+class StyleTemplates:
+    """
+    Resolves speakers to their style in a registry such as default_styles,
+    and keeps the result. A speaker without an entry of their own uses an
+    entry with the same normalized name (see normalize_name), so "BOB (V.O.)"
+    is styled like "Bob"; failing that, "default".
+
+    Each speaker is resolved once; an edit to the registry must be reported
+    with invalidate(name), which drops only the templates that entry can
+    affect, or with set_styles for a whole new registry.
+    """
+
+    def __init__(self, styles):
+        self.set_styles(styles)
+
+    def set_styles(self, styles):
+        self.styles = styles
+        self._templates = {}  # speaker -> StyleTemplate
+        self._names = None  # normalized name -> registry entry, built on first use
+
+    def registry_names(self):
+        if self._names is None:
+            self._names = {}
+            for name in self.styles:
+                if name != "default":
+                    self._names.setdefault(normalize_name(name), name)
+        return self._names
+
+    def resolve(self, name):
+        """Return the StyleTemplate of a speaker."""
+        template = self._templates.get(name)
+        if template is None:
+            key = normalize_name(name)
+            entry = name if name in self.styles else self.registry_names().get(key, "default")
+            template = self._templates[name] = StyleTemplate(key, entry, self.styles[entry])
+        return template
+
+    def prepare(self, names):
+        """Resolve several speakers up front, e.g. every speaker of an import."""
+        for name in names:
+            self.resolve(name)
+        return len(self._templates)
+
+    def invalidate(self, name):
+        """
+        Forget what an added, changed or removed registry entry affects: the
+        speakers that share its normalized name, or for "default" every
+        speaker that fell back to it.
+        """
+        if name == "default":
+            stale = [speaker for speaker, template in self._templates.items() if template.name == "default"]
+        else:
+            key = normalize_name(name)
+            stale = [speaker for speaker, template in self._templates.items() if template.key == key]
+            if self._names is not None:
+                # Point the normalized name at whichever entry now has it
+                self._names.pop(key, None)
+                for entry in self.styles:
+                    if entry != "default" and normalize_name(entry) == key:
+                        self._names[key] = entry
+                        break
+        for speaker in stale:
+            del self._templates[speaker]
+        return len(stale)
+
+    def __len__(self):
+        return len(self._templates)
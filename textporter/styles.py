@@ -0,0 +1,80 @@
+import configparser
+import json
+
+
+# Used when a style file has no [default] section
+DEFAULT_STYLE = {
+    "font": "Arial",
+    "size": 10,
+    "color": [0, 255, 0]
+}
+
+
+# Load default character styles from an .ini file
+def load_styles_from_ini(file_path):
+    config = configparser.ConfigParser()
+    config.read(file_path)
+    character_styles = {}
+    for section in config.sections():
+        # Read font and size values
+        font = config.get(section, "font", fallback="Arial")
+        size = config.getint(section, "size", fallback=20)
+
+        # Convert color to a list of integers
+        color_str = config.get(section, "color", fallback="0,0,0")
+        color = [int(c.strip()) for c in color_str.split(",")]
+
+        character_styles[section] = {
+            "font": font,
+            "size": size,
+            "color": color
+        }
+    # If "default" isn't in character_styles, add it with expected values
+    if "default" not in character_styles:
+        character_styles["default"] = dict(DEFAULT_STYLE)
+
+    return character_styles
+
+
+# Load character styles dictionary from JSON file
+def load_styles_from_json(file_path):
+    with open(file_path, "r") as file:
+        character_styles = json.load(file)
+    if "default" not in character_styles:
+        character_styles["default"] = dict(DEFAULT_STYLE)
+    return character_styles
+
+
+def load_styles(file_path):
+    """Load a style file, choosing the format from its extension (.json or .ini)."""
+    if file_path.lower().endswith(".json"):
+        return load_styles_from_json(file_path)
+    return load_styles_from_ini(file_path)
+
+
+# Save character styles to an .ini file, in the format load_styles_from_ini reads.
+# Dialogue lines have no place in the .ini format and are left out.
+def save_styles_to_ini(file_path, character_styles):
+    config = configparser.ConfigParser()
+    for name, style in character_styles.items():
+        config[name] = {
+            "font": style["font"],
+            "size": str(style["size"]),
+            "color": ",".join(str(c) for c in style["color"])
+        }
+    with open(file_path, "w") as file:
+        config.write(file)
+
+
+# Save character styles dictionary to a JSON file
+def save_styles_to_json(file_path, character_styles):
+    with open(file_path, "w") as file:
+        json.dump(character_styles, file, indent=4)
+
+
+def save_styles(file_path, character_styles):
+    """Save a style registry, choosing the format from the extension (.json or .ini)."""
+    if file_path.lower().endswith(".json"):
+        save_styles_to_json(file_path, character_styles)
+    else:
+        save_styles_to_ini(file_path, character_styles)
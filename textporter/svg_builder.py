@@ -0,0 +1,93 @@
+from io import StringIO
+from xml.sax.saxutils import escape, quoteattr
+
+from .style_templates import StyleTemplates
+
+
+# Line height as a multiple of the font size, when no TextWrapper measures the font
+LINE_SPACING = 1.2
+
+
+class SvgBuilder:
+    """
+    Collects the text elements of one layer and emits them as a single SVG
+    document, so the layer can be filled with one addShapesFromSvg call
+    instead of one call (and one SVG parse in Krita) per dialogue line.
+    """
+
+    def __init__(self, width=500, height=200):
+        self.width = width
+        self.height = height
+        self._elements = []
+
+    def add_styled_lines(self, lines, x_pos, y_pos, line_height, attributes, element_id=None):
+        """
+        Queue one <text> element holding one or more lines. Several lines get
+        a <tspan> each, every line line_height below the one before, and stay
+        a single shape in Krita.
+
+        :param attributes: The style's SVG attributes, see StyleTemplate
+        :param element_id: Optional id attribute; Krita uses it as the shape name
+        """
+        id_attr = f"id={quoteattr(element_id)} " if element_id else ""
+        if len(lines) == 1:
+            content = escape(lines[0])
+        else:
+            dy = round(line_height, 2)
+            content = f'<tspan x="{x_pos}">{escape(lines[0])}</tspan>' + "".join(
+                f'<tspan x="{x_pos}" dy="{dy}">{escape(line)}</tspan>' for line in lines[1:])
+        self._elements.append(f'<text {id_attr}x="{x_pos}" y="{y_pos}" {attributes}>{content}</text>')
+
+    def __len__(self):
+        return len(self._elements)
+
+    def to_svg(self):
+        """Return every queued element wrapped in one <svg> document."""
+        out = StringIO()
+        out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}">\n')
+        out.write("\n".join(self._elements))
+        out.write("\n</svg>\n")
+        return out.getvalue()
+
+
+def build_page_svg(dialogues, styles, width, height, x_pos=10, y_pos=50, id_prefix=None,
+                   mapping=None, wrapper=None, wrap_width=None, templates=None):
+    """
+    Lay out one page's dialogues, styled from a style registry.
+
+    Without a wrapper each dialogue is one line, LINE_SPACING times its
+    style's font size below the one before. With a TextWrapper, each dialogue is broken into lines of at most
+    wrap_width pixels for its style's font and size, and is followed by the
+    next at the height its lines actually take.
+
+    :param dialogues: Dialogue objects of the page
+    :param styles: Style registry such as default_styles; unknown speakers use "default"
+    :param id_prefix: If given, line i gets the id "<id_prefix>-<i>"
+    :param mapping: Optional PageMapping; dialogues read with their layout are then placed
+        where they were printed, the others are still stacked from x_pos, y_pos
+    :param wrapper: Optional TextWrapper, see text_wrap.py
+    :param wrap_width: Balloon width in pixels; None or 0 measures the lines without breaking them
+    :param templates: StyleTemplates over `styles` to reuse across pages; by default
+        the speakers are resolved for this page only
+    :return: An SvgBuilder holding the page's text elements
+    """
+    if templates is None:
+        templates = StyleTemplates(styles)
+    svg = SvgBuilder(width, height)
+    wrapped = wrapper.wrap_page(dialogues, templates, wrap_width) if wrapper is not None else None
+    for i, dialogue in enumerate(dialogues):
+        template = templates.resolve(dialogue.name)
+        element_id = f"{id_prefix}-{i}" if id_prefix else None
+        if wrapped is not None:
+            lines, line_height = wrapped[i]
+            step = len(lines) * line_height + line_height / 2  # Half a line between dialogues
+        else:
+            line_height = template.style["size"] * LINE_SPACING
+            lines, step = [dialogue.text], line_height
+        if mapping is not None and dialogue.origin is not None:
+            text_x, text_y = mapping.map_point(*dialogue.origin)
+        else:
+            text_x, text_y = x_pos, round(y_pos, 2)
+            y_pos += step  # Adjust Y position for the next dialogue
+        svg.add_styled_lines(lines, text_x, text_y, line_height, template.attributes, element_id)
+    return svg
@@ -0,0 +1,141 @@
+import re
+
+from .script_session import ScriptSession
+
+
+FORM_FEED = "\f"
+
+# Fountain syntax, see https://fountain.io/syntax
+FOUNTAIN_PAGE_BREAK = re.compile(r"\s*={3,}\s*")
+FOUNTAIN_SECTION = re.compile(r"\s*#")
+FOUNTAIN_SYNOPSIS = re.compile(r"\s*=(?!=)")
+FOUNTAIN_NOTE = re.compile(r"\[\[.*?\]\]")
+FOUNTAIN_TITLE_KEY = re.compile(r"(?i)(title|credit|authors?|source|draft date|date|contact|copyright|notes|revision)\s*:")
+
+
+def iter_text_pages(lines):
+    """
+    Split a stream of lines into pages at form feeds, yielding each page's
+    text as soon as it ends.
+    """
+    page = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        while FORM_FEED in line:
+            before, line = line.split(FORM_FEED, 1)
+            page.append(before)
+            yield "\n".join(page)
+            page = []
+        page.append(line)
+    yield "\n".join(page)
+
+
+def iter_fountain_lines(lines):
+    """
+    Turn Fountain source lines into the lines a printed script would show.
+
+    The title page, boneyard (/* */), notes ([[ ]]), sections (#) and
+    synopses (=) are dropped. Page breaks (===) become form feeds. Scene
+    headings and character cues, forced ones included, are kept as they
+    are, so the screenplay profile still sees them as scene markers and
+    cues.
+    """
+    lines = (line.rstrip("\r\n") for line in lines)
+    in_title_page = None
+    in_boneyard = False
+    in_note = False
+    for line in lines:
+        if in_title_page is None:
+            # A title page is a block of "Key: value" lines at the very top
+            if not line.strip():
+                continue
+            in_title_page = bool(FOUNTAIN_TITLE_KEY.match(line))
+        if in_title_page:
+            if not line.strip():
+                in_title_page = False
+            continue
+        source = line
+        if in_boneyard or "/*" in line:
+            line, in_boneyard = strip_span(line, "/*", "*/", in_boneyard)
+        if in_note or "[[" in line:
+            line, in_note = strip_span(FOUNTAIN_NOTE.sub("", line), "[[", "]]", in_note)
+        if source.strip() and not line.strip() and line != source:
+            continue  # Only markup on this line; don't let it read as a blank line
+        if FOUNTAIN_PAGE_BREAK.fullmatch(line):
+            yield FORM_FEED
+        elif FOUNTAIN_SECTION.match(line) or FOUNTAIN_SYNOPSIS.match(line):
+            continue
+        else:
+            yield line
+
+
+def strip_span(line, opener, closer, inside):
+    """
+    Remove the parts of a line between opener and closer, where a span may
+    run over several lines.
+
+    :param inside: Whether the line starts inside a span
+    :return: (what is left of the line, whether the line ends inside a span)
+    """
+    kept = []
+    while line:
+        if inside:
+            end = line.find(closer)
+            if end < 0:
+                return "".join(kept), True
+            line = line[end + len(closer):]
+            inside = False
+        else:
+            start = line.find(opener)
+            if start < 0:
+                kept.append(line)
+                break
+            kept.append(line[:start])
+            line = line[start + len(opener):]
+            inside = True
+    return "".join(kept), inside
+
+
+class TextSession(ScriptSession):
+    """
+    A ScriptSession over a plain-text script. The file is read once, as a
+    stream of lines split into pages at form feeds, with no rendering step.
+    Scripts without form feeds are a single page.
+    """
+
+    def __init__(self, pdf_file, cache=None, profile=None, trace=None):
+        self._pages = None
+        super().__init__(pdf_file, cache, profile, trace)
+
+    def iter_source_pages(self, text_file):
+        return iter_text_pages(text_file)
+
+    @property
+    def pages(self):
+        """The text of every page, read from the file on first use."""
+        if self._pages is None:
+            self.check_open()
+            with self.trace.stage("read_text"):
+                with open(self.pdf_file, "r", encoding="utf-8-sig", errors="replace") as text_file:
+                    self._pages = list(self.iter_source_pages(text_file))
+        return self._pages
+
+    def read_page_count(self):
+        return len(self.pages)
+
+    def read_page_text(self, page_num):
+        return self.pages[page_num]
+
+    def close(self):
+        self._pages = None
+        super().close()
+
+
+class FountainSession(TextSession):
+    """
+    A ScriptSession over a Fountain script. Explicit page breaks (===) split
+    the pages; the markup that doesn't print is dropped, see iter_fountain_lines.
+    """
+
+    def iter_source_pages(self, text_file):
+        return iter_text_pages(iter_fountain_lines(text_file))
@@ -0,0 +1,139 @@
+from PyQt5.QtGui import QFont, QFontMetricsF
+
+
+class FontAdvances:
+    """
+    Advance widths of one font at one pixel size, measured with QFontMetricsF
+    once per character and kept. A word's width is the sum of its characters'
+    advances, so kerning is ignored; that is close enough to pick line breaks.
+    Scripts reuse a small vocabulary, so word widths are kept as well.
+    """
+    __slots__ = ("metrics", "advances", "words", "line_height", "space")
+
+    def __init__(self, font_name, size):
+        font = QFont(font_name)
+        font.setPixelSize(max(1, round(size)))
+        self.metrics = QFontMetricsF(font)
+        self.advances = {}
+        self.words = {}
+        self.line_height = self.metrics.lineSpacing()
+        self.space = self.advance(" ")
+
+    def advance(self, char):
+        width = self.advances.get(char)
+        if width is None:
+            width = self.advances[char] = self.metrics.horizontalAdvance(char)
+        return width
+
+    def width(self, text):
+        advances = self.advances
+        total = 0.0
+        for char in text:
+            width = advances.get(char)
+            if width is None:
+                width = self.advance(char)
+            total += width
+        return total
+
+    def word_width(self, word):
+        width = self.words.get(word)
+        if width is None:
+            width = self.words[word] = self.width(word)
+        return width
+
+
+class TextWrapper:
+    """
+    Breaks dialogue into lines that fit a balloon width, for the font and
+    size of each speaker's style. Measurements are cached per (font, size)
+    for the life of the wrapper, so wrapping a long script measures each
+    character of each style once.
+
+    Needs a QGuiApplication, as any use of QFontMetricsF does.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+
+    def font(self, font_name, size):
+        """Return the FontAdvances for a font and size, measuring them on first use."""
+        key = (font_name, size)
+        advances = self._fonts.get(key)
+        if advances is None:
+            advances = self._fonts[key] = FontAdvances(font_name, size)
+        return advances
+
+    def wrap(self, text, font_name, size, max_width):
+        """
+        Greedily break text into lines no wider than max_width. Words wider
+        than max_width on their own are split between characters.
+
+        :param max_width: Width in pixels, or None to keep the text on one line
+        :return: (lines, line_height)
+        """
+        advances = self.font(font_name, size)
+        return wrap_text(text, advances, max_width), advances.line_height
+
+    def wrap_page(self, dialogues, templates, max_width):
+        """
+        Wrap every dialogue of a page, resolving each speaker's style and font
+        measurements once for the page rather than once per line.
+
+        :param templates: StyleTemplates that speakers are resolved with
+        :return: A list of (lines, line_height), in the order of dialogues
+        """
+        fonts = {}
+        wrapped = []
+        for dialogue in dialogues:
+            advances = fonts.get(dialogue.name)
+            if advances is None:
+                style = templates.resolve(dialogue.name).style
+                advances = fonts[dialogue.name] = self.font(style["font"], style["size"])
+            wrapped.append((wrap_text(dialogue.text, advances, max_width), advances.line_height))
+        return wrapped
+
+
+def wrap_text(text, advances, max_width):
+    if not max_width:
+        return [text]
+    return wrap_words(text.split(), advances, max_width)
+
+
+def wrap_words(words, advances, max_width):
+    lines = []
+    line = []
+    line_width = 0.0
+    for word in words:
+        word_width = advances.word_width(word)
+        if line and line_width + advances.space + word_width <= max_width:
+            line.append(word)
+            line_width += advances.space + word_width
+            continue
+        if line:
+            lines.append(" ".join(line))
+        if word_width > max_width:
+            # Too long for any line: split it, keeping the last piece to continue on
+            pieces = split_word(word, advances, max_width)
+            lines.extend(pieces[:-1])
+            word = pieces[-1]
+            word_width = advances.width(word)
+        line = [word]
+        line_width = word_width
+    if line:
+        lines.append(" ".join(line))
+    return lines or [""]
+
+
+def split_word(word, advances, max_width):
+    pieces = []
+    piece = ""
+    piece_width = 0.0
+    for char in word:
+        char_width = advances.advance(char)
+        if piece and piece_width + char_width > max_width:
+            pieces.append(piece)
+            piece, piece_width = "", 0.0
+        piece += char
+        piece_width += char_width
+    pieces.append(piece)
+    return pieces
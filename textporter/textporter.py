@@ -1,18 +1,47 @@
 #BBD's Krita Script Starter Feb 2018
 import os
 from krita import Krita, DockWidgetFactory, DockWidgetFactoryBase, DockWidget
-from PyQt5.QtWidgets import QPushButton, QWidget, QColorDialog, QVBoxLayout, QFontComboBox, QSpinBox,QFileDialog,QApplication, QListView, QMainWindow
-from PyQt5 import uic
+from PyQt5.QtWidgets import QPushButton, QWidget, QColorDialog, QVBoxLayout, QFontComboBox, QSpinBox,QFileDialog,QApplication, QListView, QListWidgetItem, QMainWindow
+from PyQt5.QtCore import QPoint, QStandardPaths, QThreadPool, QTimer, Qt
 from PyQt5.QtGui import QColor, QIcon, QPixmap, QFont,QStandardItemModel, QStandardItem
 from PyQt5.QtWidgets import QMessageBox
 import configparser
 import json
-import fitz  # PyMuPDF for PDF handling
-import re
+import sqlite3
+from functools import partial
+from .document_batch import (NEW_DOCUMENT_RESOLUTION, REPORT_FILE, DocumentBatchImport, document_targets,
+                             save_report, summary_text)
+from .extraction_cache import ExtractionCache
+from .pdf_session import parallel_context
+from .import_trace import ImportTrace
+from .importer import load_script
+from .layer_scheduler import LayerInsertionScheduler
+from .layer_tracker import LayerTracker
+from .page_layout import PageMapping
+from .script_parser import Dialogue, build_dialogue_index, format_page_ranges, parse_page_ranges, parser_cache_version
+from .script_watcher import ScriptWatcher
+from .sources import open_dialog_filter
+from .speaker_model import NAME_ROLE, SpeakerListModel, make_filter_proxy
+from .speaker_parser import DEFAULT_PROFILE, PROFILES, get_profile
+from .style_library import GLOBAL_PROJECT, StyleLibrary
+from .styles import load_styles, load_styles_from_ini
+from .style_templates import StyleTemplates
+from .svg_builder import build_page_svg
+from .text_wrap import TextWrapper
+from .thumbnails import ThumbnailRenderer
+from .workers import ImportWorker
+
+try:
+    # Generated from Textporter.ui with: pyuic5 Textporter.ui -o ui_textporter.py
+    from .ui_textporter import Ui_Form
+except ImportError:
+    Ui_Form = None
 
 
 DOCKER_NAME = 'Textporter'
 DOCKER_ID = 'pykrita_textporter'
+# Search results listed at most; a common word can match thousands of lines
+SEARCH_LIMIT = 200
 
 
 
@@ -48,129 +77,265 @@ class ColorSwatchButton(QPushButton):
             self.current_color = color
             self.update_icon()
 
-# Dialogue class to represent each dialogue entry
-class Dialogue:
-    def __init__(self, name, dialog_type, text, color):
-        self.name = name
-        self.dialog_type = dialog_type
-        self.text = text
-        self.color = color
+def load_ui(widget, ui_file):
+    """
+    Build the docker UI into widget. The compiled ui_textporter module is
+    used when present; otherwise the .ui file is parsed with uic.
+    """
+    if Ui_Form is not None:
+        ui = Ui_Form()
+        ui.setupUi(widget)
+        # Expose the child widgets as attributes, as uic.loadUi does
+        widget.__dict__.update(vars(ui))
+    else:
+        from PyQt5 import uic
+        uic.loadUi(ui_file, widget)
 
 class Textporter(DockWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle(DOCKER_NAME)
-        # Load the UI file and set up layout
-        ui_file_path = os.path.join(os.path.dirname(__file__), "Textporter.ui")
-        self.widget = PluginUIWidget(ui_file_path)
-        # Set the widget to the Docker container
-        self.setWidget(self.widget)
+        # The docker contents are built on first show, so Krita sessions that
+        # never open the docker don't pay for the UI, fonts or styles
+        self.widget = None
         # Set the size of the docker to ensure it displays properly
         self.setMinimumWidth(400)
         self.setMinimumHeight(300)
 
+    def showEvent(self, event):
+        if self.widget is None:
+            # Load the UI file and set up layout
+            ui_file_path = os.path.join(os.path.dirname(__file__), "Textporter.ui")
+            self.widget = PluginUIWidget(ui_file_path)
+            # Set the widget to the Docker container
+            self.setWidget(self.widget)
+        super().showEvent(event)
+
     def canvasChanged(self, canvas):
         pass
 
 class PluginUIWidget(QWidget):
-    def parse_dialogues_from_text(self,text):
-        """
-        Process text to extract individual dialogues. Replace this logic
-        with your specific parsing rules for dialogue.
-
-        :param text: The text to parse
-        :return: A list of dialogue objects or dictionaries
-        """
-        lines = text.split("\n")
-        dialogues = []
-        for line in lines:
-            if line.strip():  # Filter out empty lines
-                dialogues.append({"name": "Character", "content": line.strip()})
-        return dialogues
-
-    def load_dialogues_from_pdf(self,pdf_file):
-        """
-        Extract dialogues from a PDF file. Assumes each page contains text
-        representing dialogue and returns a list of dialogue objects.
-
-        :param pdf_file: Path to the PDF file
-        :return: List of dialogue objects or dictionaries
-        """
-        pdf_document = fitz.open(pdf_file)
-        dialogues = []
-
-        for page_num in range(len(pdf_document)):
-            page = pdf_document.load_page(page_num)
-            text = page.get_text("text")  # Extract plain text
-            dialogues.extend(self.parse_dialogues_from_text(text))
-
-        return dialogues
+    def close_session(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
 
     # Add dialogues as vector layers in Krita
     def add_dialogue_to_krita(self):
         """
         Add dialogue extracted from the PDF file as text items to Krita.
-        The pages parameter can be 
-        A tuple: (1, 5) → [1, 2, 3, 4, 5]
-        A list: [1, 3, 5] → [1, 3, 5]
-        A single integer: 5 → [5]
-        A string range: "1-5" → [1, 2, 3, 4, 5]
-        A string list: "1,3,5" → [1, 3, 5]
+        Each page selected in lineEdit gets its own vector layer holding only
+        that page's dialogue; see parse_page_ranges for the accepted formats.
+        The pages are extracted on a worker thread and the layers are created
+        by insert_dialogue_layers once it finishes. With "Place at script
+        positions" checked, PDF pages are read with their layout and each
+        line is placed where it was printed.
         """
         # Load the Krita document
         doc = Krita.instance().activeDocument()
-        root = doc.rootNode()
-        if  self.pdfFile: 
-            dialogues = self.load_dialogues_from_pdf(self.pdfFile)
-            if self.num_pages != 0: 
-                # Flatten page_ranges into a list of individual pages
-                page_list = []
-                page_ranges = self.lineEdit.text()
-                if isinstance(page_ranges, str):  # Handle string-based input
-                    if '-' in page_ranges:  # Example: "1-5"
-                        start, end = map(int, page_ranges.split('-'))
-                        page_list.extend(range(start, end + 1))
-                    elif ',' in page_ranges:  # Example: "1,3,5"
-                        page_list.extend(map(int, page_ranges.split(',')))
-                    else:
-                        raise ValueError(f"Invalid string format for page_ranges: {page_ranges}")
-                elif isinstance(page_ranges, tuple):  # Handle tuple (start, end)
-                    start, end = page_ranges
-                    page_list.extend(range(start, end + 1))
-                elif isinstance(page_ranges, list):  # Handle list of individual pages
-                    page_list.extend(page_ranges)
-                elif isinstance(page_ranges, int):  # Handle single page
-                    page_list.append(page_ranges)
-                else:
-                    raise TypeError(f"Unsupported type for page_ranges: {type(page_ranges)}")
-
-                # Ensure page_list is sorted and contains unique pages (optional but useful)
-                page_list = sorted(set(page_list))
-
-                page_number = 1
-                for page_num in page_list:
-                    # Load the specific page from the PDF
-                    pdf_document = fitz.open(self.pdfFile)
-                    page = pdf_document.load_page(page_num - 1)  # Page numbers in PyMuPDF are 0-indexed
-
-                    # Create a new vector layer for this page
-                    vector_layer = doc.createVectorLayer(f'Page {page_number}')
-                    y_pos = 50 + (page_number * 100)  # Adjust the Y position for each new page
-
-                    # Add the dialogues to the vector layer
-                    for dialogue in dialogues:
-                        #failing l 163 think characer styles need to be default_styles instead
-                        style = character_styles.get(dialogue.name, character_styles["default"])["style"]
-                        svg_text = create_svg(dialogue, 10, y_pos, font_size=style["size"], font_name=style["font"])
-                        vector_layer.addShapesFromSvg(svg_text)
-                        y_pos += 20  # Adjust Y position for the next dialogue
-
-                    # Add the vector layer to the Krita document
-                    root.addChildNode(vector_layer, None)
-                    doc.setActiveNode(vector_layer)
-                    page_number += 1
+        if doc is not None and self.session is not None and self.num_pages != 0: 
+            # Flatten page_ranges into a list of individual pages
+            try:
+                page_list = parse_page_ranges(self.lineEdit.text())
+            except ValueError as e:
+                self.show_message(str(e))
+                return
+            page_list = [page for page in page_list if 1 <= page <= self.num_pages]
+            if not page_list:
+                self.show_message(f"No pages in range: the script has {self.num_pages} page(s)")
+                return
+            layout = self.checkBox_2.isChecked() and self.session.HAS_LAYOUT
+            job = partial(build_dialogue_index, workers=self.spinBox_2.value(), layout=layout)
+            self.start_worker(job, partial(self.insert_dialogue_layers, doc, layout), self.session, page_list)
+
+    def insert_dialogue_layers(self, doc, layout, dialogues_by_page):
+        """
+        Queue one vector layer per extracted page. The layers are created in
+        small batches by a LayerInsertionScheduler, under one group layer, so
+        Krita stays responsive while a long page range is inserted.
+        """
+        scheduler = LayerInsertionScheduler(doc, f'Pages {self.lineEdit.text()}', trace=self.trace, parent=self)
+        self.prepare_styles(dialogues_by_page)
+        page_number = 1
+        for page_num, dialogues in dialogues_by_page.items():
+            # Adjust the Y position for each new page; None places the lines at their script positions
+            y_pos = None if layout else 50 + (page_number * 100)
+            # Gather this page's dialogues into one SVG document; styles are
+            # read when the layer is built
+            records = tuple((dialogue.name, dialogue.text) for dialogue in dialogues)
+            scheduler.enqueue(f'Page {page_num}', partial(self.page_svg_text, doc, dialogues, y_pos, page_num),
+                              key=(page_num, records, y_pos))
+            page_number += 1
+
+        # Remember which layer holds which page, so watch mode can patch them
+        if self.layer_tracker is None or self.layer_tracker.doc != doc:
+            self.layer_tracker = LayerTracker(doc)
+        scheduler.layer_added.connect(self.layer_tracker.track)
+        scheduler.progress.connect(self.update_progress)
+        scheduler.finished.connect(self.scheduler_stopped)
+        scheduler.cancelled.connect(self.scheduler_stopped)
+        self.scheduler = scheduler
+        self.set_busy(True)
+        scheduler.start()
+
+    def prepare_styles(self, dialogues_by_page):
+        """Resolve the style of every speaker of an import before its layers are built."""
+        with self.trace.stage("resolve_styles") as span:
+            names = {dialogue.name for dialogues in dialogues_by_page.values() for dialogue in dialogues}
+            span["speakers"] = len(names)
+            self.style_templates.prepare(names)
+
+    def import_to_documents(self):
+        """
+        Letter each selected page into a .kra file of its own, e.g. script
+        page 7 into issue12_p07.kra. lineEdit_4 holds the file name pattern,
+        where a run of # stands for the zero-padded page number. Files that
+        exist are opened and saved in place; the others are created at the
+        size of the script page. The pages are extracted on a worker thread,
+        then the documents are handled one at a time by import_documents.
+        """
+        if self.session is None or self.num_pages == 0:
+            return
+        try:
+            page_list = parse_page_ranges(self.lineEdit.text())
+        except ValueError as e:
+            self.show_message(str(e))
+            return
+        page_list = [page for page in page_list if 1 <= page <= self.num_pages]
+        if not page_list:
+            self.show_message(f"No pages in range: the script has {self.num_pages} page(s)")
+            return
+        folder = QFileDialog.getExistingDirectory(self, "Folder of Page Documents",
+                                                  os.path.dirname(self.pdfFile or ""))
+        if not folder:
+            return
+        try:
+            targets = document_targets(folder, self.lineEdit_4.text() or self.lineEdit_4.placeholderText(),
+                                       page_list)
+        except (ValueError, KeyError, IndexError) as e:
+            self.show_message(f"Invalid document name pattern: {e}")
+            return
+        layout = self.checkBox_2.isChecked() and self.session.HAS_LAYOUT
+        job = partial(build_dialogue_index, workers=self.spinBox_2.value(), layout=layout)
+        self.start_worker(job, partial(self.import_documents, folder, targets, layout), self.session, page_list)
+
+    def import_documents(self, folder, targets, layout, dialogues_by_page):
+        self.prepare_styles(dialogues_by_page)
+        batch = DocumentBatchImport(Krita.instance(), targets, dialogues_by_page,
+                                    partial(self.document_svg_text, layout), self.new_document_size,
+                                    trace=self.trace, parent=self)
+        batch.progress.connect(self.update_progress)
+        batch.finished.connect(partial(self.documents_imported, folder))
+        batch.cancelled.connect(partial(self.documents_imported, folder))
+        # Held as the scheduler, so the buttons stay locked and Cancel stops it
+        self.scheduler = batch
+        self.set_busy(True)
+        batch.start()
+
+    def document_svg_text(self, layout, doc, page_num, dialogues):
+        return self.page_svg_text(doc, dialogues, None if layout else 50, page_num)
+
+    def new_document_size(self, page_num):
+        """Pixel size of a new page document: the script page at NEW_DOCUMENT_RESOLUTION."""
+        width, height = self.session.page_size(page_num - 1)
+        scale = NEW_DOCUMENT_RESOLUTION / 72
+        return round(width * scale), round(height * scale)
+
+    def documents_imported(self, folder, results):
+        self.scheduler_stopped()
+        report_file = os.path.join(folder, REPORT_FILE)
+        message = summary_text(results)
+        try:
+            save_report(results, report_file)
+            message += f"\n\nReport saved to {report_file}"
+        except OSError as e:
+            message += f"\n\nCould not save the report: {e}"
+        self.show_message(message)
+
+    def page_svg_text(self, doc, dialogues, y_pos, page_num):
+        with self.trace.stage("create_svg", lines=len(dialogues)) as span:
+            mapping = None
+            if y_pos is None:
+                mapping = PageMapping(*self.session.page_size(page_num - 1), doc.width(), doc.height())
+            # The ids become shape names, which is how watch mode finds the shapes again
+            svg = build_page_svg(dialogues, self.default_styles, doc.width(), doc.height(), y_pos=y_pos or 50,
+                                 id_prefix=f"textporter-p{page_num}", mapping=mapping,
+                                 wrapper=self.text_wrapper, wrap_width=self.spinBox_4.value(),
+                                 templates=self.style_templates)
+            svg_text = svg.to_svg() if len(svg) else ""
+            span["bytes"] = len(svg_text)
+        return svg_text
+
+    def reset_style_templates(self):
+        self.style_templates.set_styles(self.speaker_model.styles)
+
+    def scheduler_stopped(self, *args):
+        self.scheduler = None
+        self.set_busy(False)
+        self.update_timing_summary()
+
+    def update_timing_summary(self):
+        self.plainTextEdit.setPlainText(self.trace.summary_text())
+
+    def toggle_timing(self, expanded):
+        """Collapse the IMPORT TIMING group down to its title bar, or expand it again."""
+        self.verticalLayoutWidget_4.setVisible(expanded)
+        self.groupBox_3.resize(self.groupBox_3.width(), 201 if expanded else 22)
+
+    def save_trace(self):
+        """Write the current import's stage timings as a Chrome trace, for chrome://tracing or Perfetto."""
+        trace_file, _ = QFileDialog.getSaveFileName(self, "Save Trace", "textporter_trace.json",
+                                                    "Chrome Trace (*.json)")
+        if trace_file:
+            try:
+                self.trace.save(trace_file)
+            except OSError as e:
+                self.show_message(f"Could not save the trace: {e}")
 
-                doc.refreshProjection()
+    def start_worker(self, job, on_finished, *args):
+        """
+        Run job(*args) on the global QThreadPool. Progress drives progressBar,
+        pushButton_5 cancels, and on_finished receives the result on the GUI thread.
+        Only one job runs at a time since the jobs share the open session.
+        """
+        if self.worker is not None or self.scheduler is not None:
+            return False
+        worker = ImportWorker(job, *args)
+        worker.signals.progress.connect(self.update_progress)
+        # Release the worker before on_finished runs, so a follow-up step
+        # (such as layer insertion) can keep the buttons locked
+        worker.signals.finished.connect(self.worker_stopped)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(self.show_message)
+        worker.signals.failed.connect(self.worker_stopped)
+        worker.signals.cancelled.connect(self.worker_stopped)
+        self.worker = worker
+        self.set_busy(True)
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def cancel_worker(self):
+        if self.worker is not None:
+            self.worker.cancel()
+        elif self.scheduler is not None:
+            self.scheduler.cancel()
+
+    def worker_stopped(self, *args):
+        self.worker = None
+        self.set_busy(False)
+
+    def update_progress(self, done, total):
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(done)
+
+    def set_busy(self, busy):
+        """Lock the import buttons while a worker or the layer scheduler is running."""
+        self.pushButton.setEnabled(not busy)
+        self.pushButton_4.setEnabled(not busy)
+        self.pushButton_11.setEnabled(not busy)
+        self.pushButton_5.setEnabled(busy)
+        if busy:
+            self.progressBar.setValue(0)
     
     def show_message(self,message):
         msg = QMessageBox()
@@ -181,69 +346,276 @@ class PluginUIWidget(QWidget):
         msg.exec_()  # Show the message box
     
     def parse_character_styles_from_pdf(self):
-        # Load the PDF file
+        # Load the script file (PDF, Fountain or plain text)
         options = QFileDialog.Options()
-        pdf_file, _ = QFileDialog.getOpenFileName(self, "Open PDF File", "", "PDF Files (*.pdf);;All Files (*)", options=options)
+        pdf_file, _ = QFileDialog.getOpenFileName(self, "Open Script", "", open_dialog_filter(), options=options)
         if pdf_file:
-            self.pdfFile = pdf_file
-            self.label_24.setText(pdf_file) 
-            pdf_document = fitz.open(pdf_file)
-            # Get the number of pages
-            self.num_pages = pdf_document.page_count
-            self.label_5.setText(str(self.num_pages ))
-            # Copy default styles to prevent modifying the original
-            # Get the number of pages
-            self.updatePageCount()
-            # Loop through each page of the PDF
-            for page_num in range(pdf_document.page_count):
-                page_text = pdf_document.load_page(page_num).get_text()
-                
-                for line in page_text.split("\n"):
-                    match = re.match(r"([^:]+):\s*(.*)", line.strip())
-                    if match:
-                        name = re.sub(r"\(.*?\)", "", match.group(1)).strip()  # Remove parentheses in names
-                        dialogue_text = match.group(2).strip()
-                        
-                        if name not in self.default_styles:
-                            # Initialize a new entry for the character with the default style settings
-                            self.default_styles[name] = self.default_styles["default"].copy()
-                        
-                        if "dialogues" not in self.default_styles[name]:
-                            self.default_styles[name]["dialogues"] = []
-                        
-                        # Append the dialogue text to the character's dialogues
-                        self.default_styles[name]["dialogues"].append(dialogue_text)
-            # Update the list widget with the modified default_styles dictionary
-            self.update_list_widget_from_dict(self.default_styles)
-            return self.default_styles
+            # The previous script's session is replaced once the new one has loaded; only a
+            # reload of the same script is compared against it
+            previous = self.revision if pdf_file == self.pdfFile else None
+            job = partial(load_script, workers=self.spinBox_2.value(), cache=self.extraction_cache,
+                          previous=previous, profile=get_profile(self.comboBox.currentData()),
+                          trace=ImportTrace())
+            self.start_worker(job, self.apply_loaded_script, pdf_file)
+
+    def apply_loaded_script(self, result):
+        """Install a session opened by load_script and merge its speakers. Runs on the GUI thread."""
+        previous_file = self.pdfFile
+        diff = self.install_script(result)
+        if previous_file != self.pdfFile:
+            # Inserted layers belong to the old script; don't patch them from this one
+            self.layer_tracker = None
+        if self.checkBox.isChecked():
+            self.script_watcher.watch(self.pdfFile)
+        if diff is not None:
+            self.show_message(f"Script revision: {diff.summary()}")
+        return self.default_styles
+
+    def install_script(self, result):
+        """
+        Make a loaded script the current one: session, page count and speakers.
+
+        :return: The RevisionDiff against the earlier revision of the same script, or None
+            if this is the first load of the script or it was loaded with another profile
+        """
+        session, revision, diff = result
+        # A reload with another profile parses every page afresh; that isn't a revision
+        previous = self.revision if session.pdf_file == self.pdfFile else None
+        if previous is not None and previous.profile is not revision.profile:
+            previous = None
+        self.close_session()
+        self.session = session
+        # Timings of this load; inserting its pages adds to the same trace
+        self.trace = session.trace
+        self.pdfFile = session.pdf_file
+        self.label_24.setText(self.pdfFile) 
+        # Get the number of pages
+        self.num_pages = session.page_count
+        self.label_5.setText(str(self.num_pages ))
+        self.updatePageCount()
+        self.populate_page_strip(session)
+        # Only PDFs know where their lines are printed
+        self.checkBox_2.setEnabled(session.HAS_LAYOUT)
+        # Dialogue lines live in revision.store; the registry only needs entries for new speakers
+        for name in diff.speakers:
+            if name in self.default_styles:
+                # Lines from an earlier import or JSON file are superseded by the store
+                self.default_styles[name].pop("dialogues", None)
+        # Initialize an entry for each new character from the style library,
+        # or with the default style settings if the library doesn't know them
+        new_names = [name for name in revision.store.names()
+                     if name in diff.speakers and name not in self.default_styles]
+        library_styles = self.library_lookup(new_names)
+        self.speaker_model.add_speakers({name: library_styles.get(name) or self.default_styles["default"].copy()
+                                         for name in new_names})
+        self.revision = revision
+        self.speaker_model.set_store(revision.store)
+        self.search_dialogue(self.lineEdit_3.text())
+        self.update_timing_summary()
+        return diff if previous is not None else None
+
+    def populate_page_strip(self, session):
+        """Fill the page strip with one item per page; PDF pages get their thumbnail once it's rendered."""
+        self.thumbnail_renderer.set_document(session.pdf_file if session.RENDERS_PAGES else None)
+        width, height = session.page_size(0) if session.page_count else session.DEFAULT_PAGE_SIZE
+        icon_size = self.listWidget.iconSize()
+        placeholder = QPixmap(icon_size.width(), min(icon_size.height(), round(icon_size.width() * height / width)))
+        placeholder.fill(Qt.white)
+        self.page_placeholder = QIcon(placeholder)
+        self.listWidget.blockSignals(True)
+        self.listWidget.clear()
+        for page_num in range(session.page_count):
+            item = QListWidgetItem(self.page_placeholder, str(page_num + 1))
+            item.setTextAlignment(Qt.AlignHCenter)
+            self.listWidget.addItem(item)
+        self.listWidget.blockSignals(False)
+        self.select_pages_from_text()
+        self.schedule_thumbnails()
+
+    def schedule_thumbnails(self, *args):
+        # Scrolling and resizing restart the timer, so only where the strip settles is rendered
+        self.thumbnail_timer.start()
+
+    def request_visible_thumbnails(self):
+        """Ask for the thumbnails in view first, then a view's worth either side of it."""
+        count = self.listWidget.count()
+        if count == 0:
+            return
+        viewport = self.listWidget.viewport()
+        middle = viewport.height() // 2
+        first = self.listWidget.indexAt(QPoint(1, middle)).row()
+        last = self.listWidget.indexAt(QPoint(viewport.width() - 2, middle)).row()
+        first = max(first, 0)
+        if last < first:
+            # The strip ends inside the viewport, or is hidden away
+            last = count - 1 if viewport.width() > 1 else first
+        span = last - first + 1
+        visible = range(first, last + 1)
+        ahead = range(last + 1, min(count, last + 1 + span))
+        behind = range(first - 1, max(-1, first - 1 - span), -1)
+        self.thumbnail_renderer.request([*visible, *ahead, *behind])
+
+    def show_thumbnail(self, page_num):
+        item = self.listWidget.item(page_num)
+        pixmap = self.thumbnail_renderer.pixmap(page_num)
+        if item is not None and pixmap is not None:
+            item.setIcon(QIcon(pixmap))
+
+    def drop_thumbnail(self, page_num):
+        item = self.listWidget.item(page_num)
+        if item is not None:
+            item.setIcon(self.page_placeholder)
+
+    def page_selection_changed(self):
+        """Write the pages selected in the strip into the page field, e.g. "1-5,8"."""
+        pages = [self.listWidget.row(item) + 1 for item in self.listWidget.selectedItems()]
+        if pages:
+            self.lineEdit.setText(format_page_ranges(pages))
+
+    def select_pages_from_text(self):
+        """Select the pages typed into the page field in the strip."""
+        try:
+            pages = parse_page_ranges(self.lineEdit.text())
+        except (TypeError, ValueError):
+            pages = []
+        self.listWidget.blockSignals(True)
+        self.listWidget.clearSelection()
+        for page in pages:
+            item = self.listWidget.item(page - 1)
+            if item is not None:
+                item.setSelected(True)
+        self.listWidget.blockSignals(False)
+        if pages and self.listWidget.item(pages[0] - 1) is not None:
+            self.listWidget.scrollToItem(self.listWidget.item(pages[0] - 1))
+
+    def search_dialogue(self, query):
+        """List the lines matching the search box; the last word matches as a prefix while it's typed."""
+        self.listWidget_2.clear()
+        if self.revision is None or not query.strip():
+            self.label_34.setText("")
+            return
+        results = self.revision.index.results(query, limit=SEARCH_LIMIT + 1)
+        for line_index, name, text, page_num in results[:SEARCH_LIMIT]:
+            item = QListWidgetItem(f"p{page_num + 1}  {name}: {text}")
+            item.setData(Qt.UserRole, page_num + 1)
+            item.setToolTip(text)
+            self.listWidget_2.addItem(item)
+        more = "+" if len(results) > SEARCH_LIMIT else ""
+        self.label_34.setText(f"{min(len(results), SEARCH_LIMIT)}{more} lines")
+
+    def go_to_result(self, *args):
+        """
+        Select the page of the chosen search result, then make its layer the
+        active one, or import just that page if it hasn't been inserted yet.
+        """
+        item = self.listWidget_2.currentItem()
+        if item is None:
+            return
+        page = item.data(Qt.UserRole)
+        self.lineEdit.setText(str(page))
+        self.select_pages_from_text()
+        doc = Krita.instance().activeDocument()
+        if doc is None:
+            return
+        layer = None
+        if self.layer_tracker is not None and self.layer_tracker.doc == doc:
+            layer = self.layer_tracker.page_layer(page)
+        if layer is not None:
+            doc.setActiveNode(layer)
+        else:
+            self.add_dialogue_to_krita()
+
+    def toggle_watch(self, checked):
+        """Start or stop watching the loaded script for changes."""
+        if checked and self.pdfFile:
+            self.script_watcher.watch(self.pdfFile)
+            self.label_32.setText("Watching")
+        else:
+            self.script_watcher.stop()
+            self.label_32.setText("")
+
+    def reload_watched_script(self, pdf_file):
+        """Re-extract the watched script after it changed on disk, reusing unchanged pages."""
+        if pdf_file != self.pdfFile or self.revision is None:
+            return
+        # Pages placed at their script positions are read again with their layout by the worker
+        layout_pages = self.layer_tracker.positioned_pages() if self.layer_tracker is not None else None
+        job = partial(load_script, workers=self.spinBox_2.value(), cache=self.extraction_cache,
+                      previous=self.revision, profile=self.revision.profile, trace=ImportTrace(),
+                      layout_pages=layout_pages)
+        if not self.start_worker(job, self.apply_watched_script, pdf_file):
+            # An import or insertion is running; try again once it's had time to finish
+            self.script_watcher.retry()
+
+    def apply_watched_script(self, result):
+        """Install the reloaded script and patch the pages whose inserted dialogue changed."""
+        self.install_script(result)
+        patched = self.patch_inserted_layers()
+        if patched:
+            self.label_32.setText(f"Updated page(s) {', '.join(map(str, patched))}")
+        else:
+            self.label_32.setText("No inserted page changed")
+
+    def patch_inserted_layers(self):
+        """
+        Compare each inserted page with the current revision and rewrite the
+        text shapes of the layers that differ, in place. Other layers and the
+        rest of the document are left alone.
+
+        :return: The 1-indexed pages that were updated
+        """
+        tracker = self.layer_tracker
+        if tracker is None:
+            return []
+        doc = tracker.doc
+
+        def page_records(page):
+            return self.revision.page_records(page - 1)
+
+        patched = []
+        for page in tracker.changed_pages(page_records):
+            records = tuple(page_records(page))
+            tracked = tracker.pages[page]
+            dialogues = None
+            if tracked.y_pos is None:
+                # The page was placed at its script positions, read again by load_script
+                dialogues = self.revision.layouts.get(page - 1)
+            if dialogues is None:
+                dialogues = [Dialogue(name, "dialogue", text, None, page) for name, text in records]
+            svg_text = self.page_svg_text(doc, dialogues, tracked.y_pos, page)
+            with self.trace.stage("patch_layer", lines=len(records)):
+                if tracker.patch(page, records, svg_text):
+                    patched.append(page)
+        if patched:
+            with self.trace.stage("refreshProjection"):
+                doc.refreshProjection()
+        self.update_timing_summary()
+        return patched
 
         
     def update_list_widget_from_dict(self, dict_data):
-        """Update the QListWidget with dictionary keys."""
-        self.listWidget.clear()  # Clear any existing items
-        for key in dict_data.keys():
-            if key!="default":
-                self.listWidget.addItem(key)  # Add each key as an item
+        """Show a whole new style registry in the character list."""
+        self.speaker_model.set_styles(dict_data)
 
     def add_item(self, dict,model,key, value):
         """Add an item to the dictionary and update the model."""
-        dict[key] = value
-        self.update_list_widget_from_dict(self.default_styles)
+        model.set_style(key, value)
+
+    def selected_speaker(self):
+        """Return the name selected in the character list, or None."""
+        index = self.listView.currentIndex()
+        if not self.listView.selectionModel().isSelected(index):
+            return None
+        return index.data(NAME_ROLE)
 
     def remove_item(self):
         """Remove an item from the dictionary and update the model."""
-        selected_items = self.listWidget.selectedItems()
+        selected_text = self.selected_speaker()
         # Check if any item is selected
-        if selected_items:
-            # Get the text of the first selected item (assuming single selection mode)
-            selected_text = selected_items[0].text()
-            # Check if the text exists as a key in the dictionary
-            if selected_text in self.default_styles.keys():
-                # Delete the key from the dictionary
-                del self.default_styles[selected_text]
-                print(f"Deleted '{selected_text}' from the dictionary.")
-            # Update the QListWidget to reflect the changes in the dictionary
-            self.update_list_widget_from_dict(self.default_styles)
+        if selected_text is not None:
+            # Delete the key from the dictionary; only its row leaves the list
+            self.speaker_model.remove_speaker(selected_text)
+            print(f"Deleted '{selected_text}' from the dictionary.")
         else:
             print("No item selected.")
             
@@ -259,11 +631,10 @@ class PluginUIWidget(QWidget):
         Fetch the selected item from QListWidget, get its corresponding values from the dictionary,
         and update the UI elements.
         """
-        selected_items = self.listWidget.selectedItems()
-        if not selected_items:
+        selected_key = self.selected_speaker()
+        if selected_key is None:
             QMessageBox.warning(self, "Selection Error", "No item selected!")
             return
-        selected_key = selected_items[0].text()  # Get the selected item's text
         if selected_key in self.default_styles:
             # Fetch the dictionary values for the selected key
             values = self.default_styles[selected_key]
@@ -285,36 +656,69 @@ class PluginUIWidget(QWidget):
         """
         Collect data from UI elements and update the dictionary with the selected item's key.
         """
-        selected_items = self.listWidget.selectedItems()
-        if not selected_items:
+        selected_key = self.selected_speaker()
+        if selected_key is None:
             QMessageBox.warning(self, "Selection Error", "No item selected!")
             return
-        selected_key = selected_items[0].text()  # Get the selected item's text
         # Collect values from UI elements
         font = self.fontComboBox_2.currentFont().family()
         size = self.spinBox_3.value()
         color = self.colorButton_2.current_color  # Assuming a method `getRGB()` in the color button
         # Convert to RGB list
         rgb_list = [color.red(), color.green(), color.blue()]
-        # Update the dictionary
-        self.default_styles[selected_key] = {
+        # Update the dictionary and the speaker's row
+        style = {
             "font": font,
             "size": size,
             "color": rgb_list,
         }
+        self.speaker_model.set_style(selected_key, style)
+        # Only this character's row is written to the style library
+        if self.style_library is not None:
+            self.library_call(self.style_library.upsert, selected_key, style, self.style_project())
 
 
 
 
     def __init__(self, ui_file):
         super().__init__()
-        uic.loadUi(ui_file, self)  # This loads the .ui file into the widget
+        load_ui(self, ui_file)  # This loads the compiled UI, or the .ui file, into the widget
         # Set initial default values
         self.setWindowTitle("My Custom Plugin with UI")
         self.default_styles = self.load_default_styles_from_ini(os.path.dirname(__file__)+"/settings.ini")
         layout_2 = self.horizontalLayout_2
         layout_4 = self.horizontalLayout_4
         self.pdfFile = None
+        self.session = None
+        self.revision = None
+        self.worker = None
+        self.scheduler = None
+        self.trace = ImportTrace()
+        self.layer_tracker = None
+        self.script_watcher = ScriptWatcher(parent=self)
+        self.script_watcher.changed.connect(self.reload_watched_script)
+        self.extraction_cache = self.open_extraction_cache()
+        self.style_library = self.open_style_library()
+        self.applied_project = None  # Project whose library styles were last applied
+        # Font measurements for wrapping are kept for the life of the docker
+        self.text_wrapper = TextWrapper()
+        # Page thumbnails render in the background; the strip asks for the ones in view once scrolling settles
+        self.thumbnail_renderer = ThumbnailRenderer(self.listWidget.iconSize().width(), parent=self)
+        self.thumbnail_renderer.rendered.connect(self.show_thumbnail)
+        self.thumbnail_renderer.evicted.connect(self.drop_thumbnail)
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setSingleShot(True)
+        self.thumbnail_timer.setInterval(50)
+        self.thumbnail_timer.timeout.connect(self.request_visible_thumbnails)
+        self.page_placeholder = QIcon()
+        # The character list is a view on default_styles; the proxy filters it as you type
+        self.speaker_model = SpeakerListModel(self.default_styles, self)
+        self.speaker_proxy = make_filter_proxy(self.speaker_model, self)
+        self.listView.setModel(self.speaker_proxy)
+        # SVG style attributes per speaker, kept until the model reports an edit to their entry
+        self.style_templates = StyleTemplates(self.default_styles)
+        self.speaker_model.style_changed.connect(self.style_templates.invalidate)
+        self.speaker_model.modelReset.connect(self.reset_style_templates)
         # Create two separate instances of ColorSwatchButton
         self.colorButton_1 = ColorSwatchButton(color= self.default_styles ['default']['color'])  # Red swatch
         self.colorButton_2 = ColorSwatchButton(color= self.default_styles ['default']['color'])  # Blue swatch
@@ -327,16 +731,109 @@ class PluginUIWidget(QWidget):
         self.spinBox.setValue(self.default_styles ['default']['size'])
         self.num_pages = 0
         self.updatePageCount()
+        # Pages are split across this many processes on long scripts. Extraction
+        # stays serial unless the user asks for more, and only Linux can fork Krita safely
+        self.spinBox_2.setValue(1)
+        self.spinBox_2.setEnabled(parallel_context() is not None)
+        for profile in PROFILES.values():
+            self.comboBox.addItem(profile.label, profile.name)
+        self.comboBox.setCurrentIndex(self.comboBox.findData(DEFAULT_PROFILE))
+        self.comboBox_2.addItem(GLOBAL_PROJECT)
+        if self.style_library is not None:
+            self.comboBox_2.addItems(self.library_call(self.style_library.projects) or [])
+        self.comboBox_2.lineEdit().setPlaceholderText("Series-wide")
 
         #connect buttons to functions
         self.pushButton.clicked.connect(self.parse_character_styles_from_pdf)
         self.pushButton_2.clicked.connect(self.remove_item)
         self.pushButton_3.clicked.connect(self.update_dict_from_ui)
         self.pushButton_4.clicked.connect(self.add_dialogue_to_krita)
+        self.pushButton_5.clicked.connect(self.cancel_worker)
         self.pushButton_6.clicked.connect(self.save_character_styles_to_json)
         self.pushButton_7.clicked.connect(self.load_character_styles_from_json)
-        self.listWidget.itemClicked.connect(self.populate_ui_from_dict)
+        self.pushButton_8.clicked.connect(self.save_trace)
+        self.groupBox_3.toggled.connect(self.toggle_timing)
+        self.checkBox.toggled.connect(self.toggle_watch)
+        self.pushButton_9.clicked.connect(self.export_style_library)
+        self.comboBox_2.activated.connect(self.apply_library_styles)
+        self.comboBox_2.lineEdit().editingFinished.connect(self.apply_typed_library_styles)
+        self.toggle_timing(self.groupBox_3.isChecked())
+        self.listView.clicked.connect(self.populate_ui_from_dict)
+        self.lineEdit_2.textChanged.connect(self.speaker_proxy.setFilterFixedString)
+        self.listWidget.itemSelectionChanged.connect(self.page_selection_changed)
+        self.listWidget.horizontalScrollBar().valueChanged.connect(self.schedule_thumbnails)
+        self.listWidget.horizontalScrollBar().rangeChanged.connect(self.schedule_thumbnails)
+        self.lineEdit.editingFinished.connect(self.select_pages_from_text)
+        self.lineEdit_3.textChanged.connect(self.search_dialogue)
+        self.listWidget_2.itemActivated.connect(self.go_to_result)
+        self.pushButton_10.clicked.connect(self.go_to_result)
+        self.pushButton_11.clicked.connect(self.import_to_documents)
+
+
+    def open_extraction_cache(self):
+        """Open the page text cache in Krita's user data folder, or return None if it can't be created."""
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        try:
+            return ExtractionCache(os.path.join(data_dir, "textporter", "extraction_cache.sqlite"),
+                                   parser_cache_version(get_profile()))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Extraction cache disabled: {e}")
+            return None
+
+    def open_style_library(self):
+        """Open the style library in Krita's user data folder, or return None if it can't be created."""
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        try:
+            return StyleLibrary(os.path.join(data_dir, "textporter", "style_library.sqlite"))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Style library disabled: {e}")
+            return None
+
+    def library_call(self, method, *args):
+        """Call a StyleLibrary method, reporting database errors instead of raising them."""
+        try:
+            return method(*args)
+        except (OSError, sqlite3.Error) as e:
+            self.show_message(f"Style library error: {e}")
+            return None
+
+    def style_project(self):
+        """The project styles are saved to and looked up in; empty for series-wide styles."""
+        return self.comboBox_2.currentText().strip() or GLOBAL_PROJECT
+
+    def library_lookup(self, names):
+        """Return the library styles of the given speakers in the current project, by name."""
+        if self.style_library is None or not names:
+            return {}
+        return self.library_call(self.style_library.lookup_many, names, self.style_project()) or {}
+
+    def apply_library_styles(self):
+        """Restyle the listed speakers the library knows, e.g. after switching project."""
+        self.applied_project = self.style_project()
+        for name, style in self.library_lookup(self.speaker_model.names).items():
+            self.speaker_model.set_style(name, style)
+
+    def apply_typed_library_styles(self):
+        """
+        Apply the library styles of a project name typed into comboBox_2.
+        Choosing a project from the list, or pressing Enter, has already
+        applied it through activated, and the line edit finishes editing too.
+        """
+        if self.style_project() != self.applied_project:
+            self.apply_library_styles()
 
+    def export_style_library(self):
+        """Write the styles of the current project, series-wide ones included, to an .ini or .json file."""
+        if self.style_library is None:
+            return
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Style Library", "", "JSON Files (*.json);;Settings INI (*.ini)")
+        if file_path:
+            if not file_path.lower().endswith((".json", ".ini")):
+                file_path += ".ini" if "ini" in selected_filter else ".json"
+            count = self.library_call(self.style_library.export_file, file_path, self.style_project())
+            if count is not None:
+                print(f"Exported {count} styles to {file_path}")
 
     def replace_button(self, old_button, new_button):
         """Replace the old button with a new button in the layout."""
@@ -356,35 +853,8 @@ class PluginUIWidget(QWidget):
             print("No layout found for the parent widget!")
 
     # Load default character styles from an .ini file
-    def load_default_styles_from_ini(seelf,file_path):
-        config = configparser.ConfigParser()
-        config.read(file_path)
-        character_styles = {}
-        #QMessageBox.information(QWidget(),"popup example", str(config.sections()))
-        for section in config.sections():
-            #QMessageBox.information(QWidget(),"popup example", str(character_styles))          
-            # Read font and size values
-            font = config.get(section, "font", fallback="Arial")
-            size = config.getint(section, "size", fallback=20)
-
-            # Convert color to a list of integers
-            color_str = config.get(section, "color", fallback="0,0,0")
-            color = [int(c.strip()) for c in color_str.split(",")]
-
-            character_styles[section] = {
-                "font": font,
-                "size": size,
-                "color": color
-            }
-        # If "default" isn't in character_styles, add it with expected values
-        if "default" not in character_styles:
-            character_styles["default"] = {
-                "font": "Arial",
-                "size": 10,
-                "color": [0, 255, 0]
-            }
-
-        return character_styles
+    def load_default_styles_from_ini(self, file_path):
+        return load_styles_from_ini(file_path)
 
     # Save character styles dictionary to JSON file
     def save_character_styles_to_json(self,character_styles, json_file_path="character_styles.json"):
@@ -411,12 +881,23 @@ class PluginUIWidget(QWidget):
         if json_file_path:
             try:
                 with open(json_file_path, "w") as json_file:
-                    json.dump(self.default_styles, json_file, indent=4)
+                    json.dump(self.styles_with_dialogues(), json_file, indent=4)
                 print(f"Character styles successfully saved to {json_file_path}")
             except Exception as e:
                 print(f"Error saving character styles to {json_file_path}: {e}")
 
-    # Load character styles dictionary from JSON file
+    def styles_with_dialogues(self):
+        """Return default_styles with each speaker's lines from the loaded script filled back in for export."""
+        if self.revision is None:
+            return self.default_styles
+        texts = self.revision.store.texts_by_speaker()
+        styles = {}
+        for name, style in self.default_styles.items():
+            dialogue_texts = texts.get(name)
+            styles[name] = dict(style, dialogues=dialogue_texts) if dialogue_texts else style
+        return styles
+
+    # Load character styles dictionary from a JSON or settings INI file
     def load_character_styles_from_json(self):
         # Open file dialog and get selected file path
         options = QFileDialog.Options()
@@ -424,14 +905,20 @@ class PluginUIWidget(QWidget):
             self, 
             "Open File",                     # Dialog title
             "",                              # Starting directory (empty for default)
-            "JSON Files (*.json)",  # File types filter
+            "Style Files (*.json *.ini);;JSON Files (*.json);;Settings INI (*.ini)",  # File types filter
             options=options
         )
         # Display the selected file path in the label
         if file_path:
-            with open(file_path, "r") as file:
-                self.default_styles =  json.load(file)
-                self.update_list_widget_from_dict(self.default_styles)
+            try:
+                self.default_styles = load_styles(file_path)
+            except (OSError, ValueError, configparser.Error, KeyError) as e:
+                self.show_message(f"Could not read the style file {file_path}: {e}")
+                return
+            self.update_list_widget_from_dict(self.default_styles)
+            # Import the styles into the library, so later scripts pick them up
+            if self.style_library is not None:
+                self.library_call(self.style_library.upsert_many, self.default_styles, self.style_project())
 
 instance = Krita.instance()
 dock_widget_factory = DockWidgetFactory(DOCKER_ID,
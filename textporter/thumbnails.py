@@ -0,0 +1,185 @@
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from .pdf_session import FITZ_LOCK, load_fitz
+
+
+# Memory the rendered thumbnails may take before the least recently used are dropped
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """LRU cache of page pixmaps, bounded by their approximate size in bytes."""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._pixmaps = OrderedDict()
+
+    @staticmethod
+    def cost(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def __contains__(self, page_num):
+        return page_num in self._pixmaps
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    def get(self, page_num):
+        pixmap = self._pixmaps.get(page_num)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(page_num)
+        return pixmap
+
+    def put(self, page_num, pixmap):
+        """
+        Add a pixmap, dropping the least recently used ones over the budget.
+
+        :return: The page numbers that were dropped
+        """
+        old = self._pixmaps.pop(page_num, None)
+        if old is not None:
+            self.total_bytes -= self.cost(old)
+        self._pixmaps[page_num] = pixmap
+        self.total_bytes += self.cost(pixmap)
+        evicted = []
+        while self.total_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            evicted_page, evicted_pixmap = self._pixmaps.popitem(last=False)
+            self.total_bytes -= self.cost(evicted_pixmap)
+            evicted.append(evicted_page)
+        return evicted
+
+    def clear(self):
+        self._pixmaps.clear()
+        self.total_bytes = 0
+
+
+def render_page_image(document, page_num, width):
+    """Render one page with PyMuPDF, scaled to `width` pixels, as a QImage that owns its pixels."""
+    page = document.load_page(page_num)
+    zoom = width / page.rect.width
+    fitz = load_fitz()
+    pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    image = QImage(pixmap.samples, pixmap.width, pixmap.height, pixmap.stride, QImage.Format_RGB888)
+    return image.copy()  # pixmap.samples goes away with the fitz pixmap
+
+
+class ThumbnailSignals(QObject):
+    rendered = pyqtSignal(int, int, QImage)  # generation, page_num, image
+    failed = pyqtSignal(int, str)  # generation, message
+
+
+class ThumbnailJob(QRunnable):
+    """
+    Renders the pages a ThumbnailRenderer asks for, one at a time and most
+    wanted first, until it has none left. PyMuPDF can't be used from two
+    threads at once, even on separate documents, so each page is rendered
+    under FITZ_LOCK; an import running at the same time takes turns with it
+    page by page.
+    """
+
+    def __init__(self, renderer, pdf_file, generation):
+        super().__init__()
+        self.renderer = renderer
+        self.pdf_file = pdf_file
+        self.generation = generation
+        self.signals = ThumbnailSignals()
+
+    def run(self):
+        document = None
+        try:
+            with FITZ_LOCK:
+                document = load_fitz().open(self.pdf_file)
+            while True:
+                page_num = self.renderer.next_request(self.generation)
+                if page_num is None:
+                    break
+                with FITZ_LOCK:
+                    image = render_page_image(document, page_num, self.renderer.width)
+                self.signals.rendered.emit(self.generation, page_num, image)
+        except Exception as e:
+            self.renderer.job_stopped(self.generation)
+            self.signals.failed.emit(self.generation, str(e))
+        finally:
+            if document is not None:
+                with FITZ_LOCK:
+                    document.close()
+
+
+class ThumbnailRenderer(QObject):
+    """
+    Page thumbnails for one PDF, rendered on the global QThreadPool on demand.
+
+    request() replaces the list of wanted pages, so pages scrolled past are
+    dropped and the ones in view are rendered first. Finished thumbnails
+    are kept in a ThumbnailCache and announced with `rendered`; views should
+    let go of the pixmaps announced with `evicted`, or the cache's budget
+    means nothing.
+    """
+    rendered = pyqtSignal(int)  # page_num
+    evicted = pyqtSignal(int)  # page_num
+
+    def __init__(self, width=72, max_bytes=DEFAULT_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.width = width
+        self.cache = ThumbnailCache(max_bytes)
+        self.pdf_file = None
+        self.generation = 0  # Bumped per document, so late results from an old one are ignored
+        self._lock = threading.Lock()
+        self._wanted = []
+        self._running = False
+
+    def set_document(self, pdf_file):
+        """Switch to another PDF, or to none with None."""
+        with self._lock:
+            self.generation += 1
+            self.pdf_file = pdf_file
+            self._wanted = []
+            self._running = False
+        self.cache.clear()
+
+    def pixmap(self, page_num):
+        return self.cache.get(page_num)
+
+    def request(self, page_nums):
+        """Render the given 0-indexed pages that aren't cached yet, in the given order."""
+        if self.pdf_file is None:
+            return
+        with self._lock:
+            self._wanted = [page_num for page_num in page_nums if page_num not in self.cache]
+            if not self._wanted or self._running:
+                return
+            self._running = True
+            generation = self.generation
+        job = ThumbnailJob(self, self.pdf_file, generation)
+        job.signals.rendered.connect(self.image_rendered)
+        job.signals.failed.connect(self.render_failed)
+        QThreadPool.globalInstance().start(job)
+
+    def next_request(self, generation):
+        """Called from the job: the next page to render, or None to stop."""
+        with self._lock:
+            if generation != self.generation or not self._wanted:
+                if generation == self.generation:
+                    self._running = False
+                return None
+            return self._wanted.pop(0)
+
+    def job_stopped(self, generation):
+        with self._lock:
+            if generation == self.generation:
+                self._running = False
+
+    def image_rendered(self, generation, page_num, image):
+        if generation == self.generation:
+            for evicted_page in self.cache.put(page_num, QPixmap.fromImage(image)):
+                self.evicted.emit(evicted_page)
+            self.rendered.emit(page_num)
+
+    def render_failed(self, generation, message):
+        if generation == self.generation:
+            print(f"Thumbnail rendering stopped: {message}")
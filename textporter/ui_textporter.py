@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'Textporter.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(411, 1780)
+        self.groupBox_6 = QtWidgets.QGroupBox(Form)
+        self.groupBox_6.setGeometry(QtCore.QRect(10, 1450, 391, 111))
+        self.groupBox_6.setObjectName("groupBox_6")
+        self.verticalLayoutWidget_8 = QtWidgets.QWidget(self.groupBox_6)
+        self.verticalLayoutWidget_8.setGeometry(QtCore.QRect(12, 20, 371, 111))
+        self.verticalLayoutWidget_8.setObjectName("verticalLayoutWidget_8")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_8)
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_22 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        self.label_22.setText("")
+        self.label_22.setObjectName("label_22")
+        self.horizontalLayout_5.addWidget(self.label_22)
+        self.label_9 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_5.addWidget(self.label_9)
+        self.label_11 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_5.addWidget(self.label_11)
+        self.label_12 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Times New Roman")
+        font.setPointSize(16)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_5.addWidget(self.label_12)
+        self.label_13 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        self.label_13.setObjectName("label_13")
+        self.horizontalLayout_5.addWidget(self.label_13)
+        self.label_14 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Arial")
+        font.setPointSize(14)
+        self.label_14.setFont(font)
+        self.label_14.setObjectName("label_14")
+        self.horizontalLayout_5.addWidget(self.label_14)
+        self.label_15 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.label_15.setFont(font)
+        self.label_15.setObjectName("label_15")
+        self.horizontalLayout_5.addWidget(self.label_15)
+        self.label_16 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Times New Roman")
+        font.setPointSize(14)
+        self.label_16.setFont(font)
+        self.label_16.setObjectName("label_16")
+        self.horizontalLayout_5.addWidget(self.label_16)
+        self.label_17 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Arial Black")
+        font.setPointSize(18)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.horizontalLayout_5.addWidget(self.label_17)
+        self.label_18 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Fixedsys")
+        font.setPointSize(20)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.horizontalLayout_5.addWidget(self.label_18)
+        self.label_19 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        font = QtGui.QFont()
+        font.setFamily("Times New Roman")
+        font.setPointSize(36)
+        self.label_19.setFont(font)
+        self.label_19.setObjectName("label_19")
+        self.horizontalLayout_5.addWidget(self.label_19)
+        self.horizontalLayout_6.addLayout(self.horizontalLayout_5)
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.label_8 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_7.addWidget(self.label_8)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_7.addItem(spacerItem)
+        self.horizontalLayout_6.addLayout(self.verticalLayout_7)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_6)
+        self.label_10 = QtWidgets.QLabel(self.verticalLayoutWidget_8)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_8.addWidget(self.label_10)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_8.addItem(spacerItem1)
+        self.groupBox_4 = QtWidgets.QGroupBox(Form)
+        self.groupBox_4.setGeometry(QtCore.QRect(10, 550, 391, 151))
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.verticalLayoutWidget_3 = QtWidgets.QWidget(self.groupBox_4)
+        self.verticalLayoutWidget_3.setGeometry(QtCore.QRect(10, 20, 371, 124))
+        self.verticalLayoutWidget_3.setObjectName("verticalLayoutWidget_3")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_3)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_17 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_17.setObjectName("horizontalLayout_17")
+        self.label_33 = QtWidgets.QLabel(self.verticalLayoutWidget_3)
+        self.label_33.setObjectName("label_33")
+        self.horizontalLayout_17.addWidget(self.label_33)
+        self.comboBox_2 = QtWidgets.QComboBox(self.verticalLayoutWidget_3)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBox_2.sizePolicy().hasHeightForWidth())
+        self.comboBox_2.setSizePolicy(sizePolicy)
+        self.comboBox_2.setEditable(True)
+        self.comboBox_2.setObjectName("comboBox_2")
+        self.horizontalLayout_17.addWidget(self.comboBox_2)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_17)
+        self.pushButton_6 = QtWidgets.QPushButton(self.verticalLayoutWidget_3)
+        self.pushButton_6.setObjectName("pushButton_6")
+        self.verticalLayout_3.addWidget(self.pushButton_6)
+        self.pushButton_7 = QtWidgets.QPushButton(self.verticalLayoutWidget_3)
+        self.pushButton_7.setObjectName("pushButton_7")
+        self.verticalLayout_3.addWidget(self.pushButton_7)
+        self.pushButton_9 = QtWidgets.QPushButton(self.verticalLayoutWidget_3)
+        self.pushButton_9.setObjectName("pushButton_9")
+        self.verticalLayout_3.addWidget(self.pushButton_9)
+        self.groupBox = QtWidgets.QGroupBox(Form)
+        self.groupBox.setGeometry(QtCore.QRect(10, 0, 387, 121))
+        self.groupBox.setObjectName("groupBox")
+        self.verticalLayoutWidget = QtWidgets.QWidget(self.groupBox)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(10, 20, 371, 91))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.fontComboBox = QtWidgets.QFontComboBox(self.verticalLayoutWidget)
+        self.fontComboBox.setObjectName("fontComboBox")
+        self.verticalLayout.addWidget(self.fontComboBox)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_2 = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout.addWidget(self.label_2)
+        self.spinBox = QtWidgets.QSpinBox(self.verticalLayoutWidget)
+        self.spinBox.setObjectName("spinBox")
+        self.horizontalLayout.addWidget(self.spinBox)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_3 = QtWidgets.QLabel(self.verticalLayoutWidget)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_2.addWidget(self.label_3)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.groupBox_5 = QtWidgets.QGroupBox(Form)
+        self.groupBox_5.setGeometry(QtCore.QRect(10, 120, 389, 421))
+        self.groupBox_5.setObjectName("groupBox_5")
+        self.horizontalLayoutWidget_4 = QtWidgets.QWidget(self.groupBox_5)
+        self.horizontalLayoutWidget_4.setGeometry(QtCore.QRect(10, 20, 371, 390))
+        self.horizontalLayoutWidget_4.setObjectName("horizontalLayoutWidget_4")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.horizontalLayoutWidget_4)
+        self.horizontalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        self.label_31 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_31.setObjectName("label_31")
+        self.horizontalLayout_15.addWidget(self.label_31)
+        self.comboBox = QtWidgets.QComboBox(self.horizontalLayoutWidget_4)
+        self.comboBox.setObjectName("comboBox")
+        self.horizontalLayout_15.addWidget(self.comboBox)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_15)
+        self.pushButton = QtWidgets.QPushButton(self.horizontalLayoutWidget_4)
+        self.pushButton.setObjectName("pushButton")
+        self.verticalLayout_2.addWidget(self.pushButton)
+        self.label = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label.setObjectName("label")
+        self.verticalLayout_2.addWidget(self.label)
+        self.lineEdit_2 = QtWidgets.QLineEdit(self.horizontalLayoutWidget_4)
+        self.lineEdit_2.setClearButtonEnabled(True)
+        self.lineEdit_2.setObjectName("lineEdit_2")
+        self.verticalLayout_2.addWidget(self.lineEdit_2)
+        self.listView = QtWidgets.QListView(self.horizontalLayoutWidget_4)
+        self.listView.setObjectName("listView")
+        self.verticalLayout_2.addWidget(self.listView)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_10.addItem(spacerItem2)
+        self.pushButton_2 = QtWidgets.QPushButton(self.horizontalLayoutWidget_4)
+        self.pushButton_2.setObjectName("pushButton_2")
+        self.horizontalLayout_10.addWidget(self.pushButton_2)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_10)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.label_25 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_25.setObjectName("label_25")
+        self.horizontalLayout_11.addWidget(self.label_25)
+        self.label_24 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_24.setObjectName("label_24")
+        self.horizontalLayout_11.addWidget(self.label_24)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_11)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_6 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_7.addWidget(self.label_6)
+        self.label_5 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_7.addWidget(self.label_5)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_7)
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_20 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_20.setObjectName("label_20")
+        self.horizontalLayout_8.addWidget(self.label_20)
+        self.label_21 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_21.setObjectName("label_21")
+        self.horizontalLayout_8.addWidget(self.label_21)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_8)
+        self.fontComboBox_2 = QtWidgets.QFontComboBox(self.horizontalLayoutWidget_4)
+        self.fontComboBox_2.setObjectName("fontComboBox_2")
+        self.verticalLayout_5.addWidget(self.fontComboBox_2)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_4 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_3.addWidget(self.label_4)
+        self.spinBox_3 = QtWidgets.QSpinBox(self.horizontalLayoutWidget_4)
+        self.spinBox_3.setObjectName("spinBox_3")
+        self.horizontalLayout_3.addWidget(self.spinBox_3)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_7 = QtWidgets.QLabel(self.horizontalLayoutWidget_4)
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout_4.addWidget(self.label_7)
+        self.verticalLayout_5.addLayout(self.horizontalLayout_4)
+        self.pushButton_3 = QtWidgets.QPushButton(self.horizontalLayoutWidget_4)
+        self.pushButton_3.setObjectName("pushButton_3")
+        self.verticalLayout_5.addWidget(self.pushButton_3)
+        self.verticalLayout_2.addLayout(self.verticalLayout_5)
+        self.horizontalLayout_9.addLayout(self.verticalLayout_2)
+        self.groupBox_2 = QtWidgets.QGroupBox(Form)
+        self.groupBox_2.setGeometry(QtCore.QRect(10, 710, 391, 531))
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayoutWidget_2 = QtWidgets.QWidget(self.groupBox_2)
+        self.verticalLayoutWidget_2.setGeometry(QtCore.QRect(10, 30, 371, 501))
+        self.verticalLayoutWidget_2.setObjectName("verticalLayoutWidget_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_2)
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.label_27 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_27.setObjectName("label_27")
+        self.verticalLayout_6.addWidget(self.label_27)
+        self.label_28 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_28.setObjectName("label_28")
+        self.verticalLayout_6.addWidget(self.label_28)
+        self.label_29 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_29.setObjectName("label_29")
+        self.verticalLayout_6.addWidget(self.label_29)
+        self.label_30 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_30.setObjectName("label_30")
+        self.verticalLayout_6.addWidget(self.label_30)
+        self.verticalLayout_4.addLayout(self.verticalLayout_6)
+        self.listWidget = QtWidgets.QListWidget(self.verticalLayoutWidget_2)
+        self.listWidget.setMinimumSize(QtCore.QSize(0, 150))
+        self.listWidget.setMaximumSize(QtCore.QSize(16777215, 150))
+        self.listWidget.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.listWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.listWidget.setIconSize(QtCore.QSize(72, 94))
+        self.listWidget.setViewMode(QtWidgets.QListView.IconMode)
+        self.listWidget.setMovement(QtWidgets.QListView.Static)
+        self.listWidget.setFlow(QtWidgets.QListView.LeftToRight)
+        self.listWidget.setProperty("isWrapping", False)
+        self.listWidget.setUniformItemSizes(True)
+        self.listWidget.setGridSize(QtCore.QSize(80, 116))
+        self.listWidget.setObjectName("listWidget")
+        self.verticalLayout_4.addWidget(self.listWidget)
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.label_23 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_23.setObjectName("label_23")
+        self.horizontalLayout_12.addWidget(self.label_23)
+        self.lineEdit = QtWidgets.QLineEdit(self.verticalLayoutWidget_2)
+        self.lineEdit.setObjectName("lineEdit")
+        self.horizontalLayout_12.addWidget(self.lineEdit)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_12)
+        self.horizontalLayout_14 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_14.setObjectName("horizontalLayout_14")
+        self.label_26 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_26.setObjectName("label_26")
+        self.horizontalLayout_14.addWidget(self.label_26)
+        self.spinBox_2 = QtWidgets.QSpinBox(self.verticalLayoutWidget_2)
+        self.spinBox_2.setMinimum(1)
+        self.spinBox_2.setMaximum(64)
+        self.spinBox_2.setObjectName("spinBox_2")
+        self.horizontalLayout_14.addWidget(self.spinBox_2)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_14)
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        self.checkBox = QtWidgets.QCheckBox(self.verticalLayoutWidget_2)
+        self.checkBox.setObjectName("checkBox")
+        self.horizontalLayout_16.addWidget(self.checkBox)
+        self.label_32 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_32.setText("")
+        self.label_32.setObjectName("label_32")
+        self.horizontalLayout_16.addWidget(self.label_32)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_16)
+        self.checkBox_2 = QtWidgets.QCheckBox(self.verticalLayoutWidget_2)
+        self.checkBox_2.setObjectName("checkBox_2")
+        self.verticalLayout_4.addWidget(self.checkBox_2)
+        self.horizontalLayout_19 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_19.setObjectName("horizontalLayout_19")
+        self.label_35 = QtWidgets.QLabel(self.verticalLayoutWidget_2)
+        self.label_35.setObjectName("label_35")
+        self.horizontalLayout_19.addWidget(self.label_35)
+        self.spinBox_4 = QtWidgets.QSpinBox(self.verticalLayoutWidget_2)
+        self.spinBox_4.setMaximum(10000)
+        self.spinBox_4.setSingleStep(10)
+        self.spinBox_4.setProperty("value", 400)
+        self.spinBox_4.setObjectName("spinBox_4")
+        self.horizontalLayout_19.addWidget(self.spinBox_4)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_19)
+        self.pushButton_4 = QtWidgets.QPushButton(self.verticalLayoutWidget_2)
+        self.pushButton_4.setObjectName("pushButton_4")
+        self.verticalLayout_4.addWidget(self.pushButton_4)
+        self.horizontalLayout_20 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_20.setObjectName("horizontalLayout_20")
+        self.lineEdit_4 = QtWidgets.QLineEdit(self.verticalLayoutWidget_2)
+        self.lineEdit_4.setObjectName("lineEdit_4")
+        self.horizontalLayout_20.addWidget(self.lineEdit_4)
+        self.pushButton_11 = QtWidgets.QPushButton(self.verticalLayoutWidget_2)
+        self.pushButton_11.setObjectName("pushButton_11")
+        self.horizontalLayout_20.addWidget(self.pushButton_11)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_20)
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.progressBar = QtWidgets.QProgressBar(self.verticalLayoutWidget_2)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setObjectName("progressBar")
+        self.horizontalLayout_13.addWidget(self.progressBar)
+        self.pushButton_5 = QtWidgets.QPushButton(self.verticalLayoutWidget_2)
+        self.pushButton_5.setEnabled(False)
+        self.pushButton_5.setObjectName("pushButton_5")
+        self.horizontalLayout_13.addWidget(self.pushButton_5)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_13)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_4.addItem(spacerItem3)
+        self.groupBox_7 = QtWidgets.QGroupBox(Form)
+        self.groupBox_7.setGeometry(QtCore.QRect(10, 1240, 391, 201))
+        self.groupBox_7.setObjectName("groupBox_7")
+        self.verticalLayoutWidget_5 = QtWidgets.QWidget(self.groupBox_7)
+        self.verticalLayoutWidget_5.setGeometry(QtCore.QRect(10, 20, 371, 171))
+        self.verticalLayoutWidget_5.setObjectName("verticalLayoutWidget_5")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_5)
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.horizontalLayout_18 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_18.setObjectName("horizontalLayout_18")
+        self.lineEdit_3 = QtWidgets.QLineEdit(self.verticalLayoutWidget_5)
+        self.lineEdit_3.setClearButtonEnabled(True)
+        self.lineEdit_3.setObjectName("lineEdit_3")
+        self.horizontalLayout_18.addWidget(self.lineEdit_3)
+        self.label_34 = QtWidgets.QLabel(self.verticalLayoutWidget_5)
+        self.label_34.setText("")
+        self.label_34.setObjectName("label_34")
+        self.horizontalLayout_18.addWidget(self.label_34)
+        self.verticalLayout_10.addLayout(self.horizontalLayout_18)
+        self.listWidget_2 = QtWidgets.QListWidget(self.verticalLayoutWidget_5)
+        self.listWidget_2.setUniformItemSizes(True)
+        self.listWidget_2.setObjectName("listWidget_2")
+        self.verticalLayout_10.addWidget(self.listWidget_2)
+        self.pushButton_10 = QtWidgets.QPushButton(self.verticalLayoutWidget_5)
+        self.pushButton_10.setObjectName("pushButton_10")
+        self.verticalLayout_10.addWidget(self.pushButton_10)
+        self.groupBox_3 = QtWidgets.QGroupBox(Form)
+        self.groupBox_3.setGeometry(QtCore.QRect(10, 1570, 391, 201))
+        self.groupBox_3.setCheckable(True)
+        self.groupBox_3.setChecked(False)
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.verticalLayoutWidget_4 = QtWidgets.QWidget(self.groupBox_3)
+        self.verticalLayoutWidget_4.setGeometry(QtCore.QRect(10, 20, 371, 171))
+        self.verticalLayoutWidget_4.setObjectName("verticalLayoutWidget_4")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_4)
+        self.verticalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.plainTextEdit = QtWidgets.QPlainTextEdit(self.verticalLayoutWidget_4)
+        self.plainTextEdit.setReadOnly(True)
+        self.plainTextEdit.setObjectName("plainTextEdit")
+        self.verticalLayout_9.addWidget(self.plainTextEdit)
+        self.pushButton_8 = QtWidgets.QPushButton(self.verticalLayoutWidget_4)
+        self.pushButton_8.setObjectName("pushButton_8")
+        self.verticalLayout_9.addWidget(self.pushButton_8)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.groupBox_6.setTitle(_translate("Form", "ABOUT"))
+        self.label_9.setText(_translate("Form", "T"))
+        self.label_11.setText(_translate("Form", "E"))
+        self.label_12.setText(_translate("Form", "X"))
+        self.label_13.setText(_translate("Form", "T"))
+        self.label_14.setText(_translate("Form", "p"))
+        self.label_15.setText(_translate("Form", "O"))
+        self.label_16.setText(_translate("Form", "R"))
+        self.label_17.setText(_translate("Form", "T"))
+        self.label_18.setText(_translate("Form", "e"))
+        self.label_19.setText(_translate("Form", "R"))
+        self.label_8.setText(_translate("Form", "V1.0"))
+        self.label_10.setText(_translate("Form", "Comic script automation Tool"))
+        self.groupBox_4.setTitle(_translate("Form", "FILE"))
+        self.label_33.setText(_translate("Form", "Style project"))
+        self.comboBox_2.setToolTip(_translate("Form", "Styles saved under a project override the series-wide ones"))
+        self.pushButton_6.setText(_translate("Form", "Save text info"))
+        self.pushButton_7.setText(_translate("Form", "Load text info"))
+        self.pushButton_9.setText(_translate("Form", "Export style library"))
+        self.groupBox.setTitle(_translate("Form", "Defaut Text Settings:"))
+        self.label_2.setText(_translate("Form", "Font SIze"))
+        self.label_3.setText(_translate("Form", "Font colour"))
+        self.groupBox_5.setTitle(_translate("Form", "Analyse Script"))
+        self.label_31.setText(_translate("Form", "Script format"))
+        self.pushButton.setText(_translate("Form", "Get Names from script"))
+        self.label.setText(_translate("Form", "Characters in Script:"))
+        self.lineEdit_2.setPlaceholderText(_translate("Form", "Filter characters"))
+        self.pushButton_2.setText(_translate("Form", "Delete Names"))
+        self.label_25.setText(_translate("Form", "SCRIPT NAME:"))
+        self.label_24.setText(_translate("Form", "TextLabel"))
+        self.label_6.setText(_translate("Form", "Number of pages:"))
+        self.label_5.setText(_translate("Form", "TextLabel"))
+        self.label_20.setText(_translate("Form", "Selected Character:"))
+        self.label_21.setText(_translate("Form", "TextLabel"))
+        self.label_4.setText(_translate("Form", "Font SIze"))
+        self.label_7.setText(_translate("Form", "Font colour"))
+        self.pushButton_3.setText(_translate("Form", "Set Font"))
+        self.groupBox_2.setTitle(_translate("Form", "PROCESS FILE"))
+        self.label_27.setText(_translate("Form", "Specify:"))
+        self.label_28.setText(_translate("Form", " A single page: 5 "))
+        self.label_29.setText(_translate("Form", "A page range:  1-5"))
+        self.label_30.setText(_translate("Form", "A list of pages: 1,3,5"))
+        self.label_23.setText(_translate("Form", "Pages"))
+        self.label_26.setText(_translate("Form", "Extraction processes"))
+        self.checkBox.setToolTip(_translate("Form", "Re-read the script when it changes on disk and update the page layers already inserted"))
+        self.checkBox.setText(_translate("Form", "Watch script"))
+        self.checkBox_2.setToolTip(_translate("Form", "Put each line where it is printed on the PDF page, scaled to the canvas"))
+        self.checkBox_2.setText(_translate("Form", "Place at script positions"))
+        self.label_35.setText(_translate("Form", "Balloon width"))
+        self.spinBox_4.setToolTip(_translate("Form", "Wrap each line of dialogue to this width, measured with the speaker\'s font and size"))
+        self.spinBox_4.setSpecialValueText(_translate("Form", "No wrapping"))
+        self.spinBox_4.setSuffix(_translate("Form", " px"))
+        self.pushButton_4.setText(_translate("Form", "process Script"))
+        self.lineEdit_4.setToolTip(_translate("Form", "Document for each page; # is the page number, padded to as many digits as there are #"))
+        self.lineEdit_4.setPlaceholderText(_translate("Form", "page_##.kra"))
+        self.pushButton_11.setText(_translate("Form", "Import to Documents..."))
+        self.pushButton_5.setText(_translate("Form", "Cancel"))
+        self.groupBox_7.setTitle(_translate("Form", "SEARCH DIALOGUE"))
+        self.lineEdit_3.setPlaceholderText(_translate("Form", "Find a line, e.g. bob pizza"))
+        self.listWidget_2.setToolTip(_translate("Form", "Double-click a line to go to its page\'s layer, or import the page if it has none yet"))
+        self.pushButton_10.setText(_translate("Form", "Go to Page"))
+        self.groupBox_3.setTitle(_translate("Form", "IMPORT TIMING"))
+        self.plainTextEdit.setPlainText(_translate("Form", "Nothing recorded yet."))
+        self.pushButton_8.setText(_translate("Form", "Save Trace"))
@@ -0,0 +1,58 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+
+class ImportCancelled(Exception):
+    """Raised inside a running job when the user has pressed Cancel."""
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by an ImportWorker. They are delivered to slots on the
+    GUI thread, which is where every Krita and widget call must happen.
+    """
+    progress = pyqtSignal(int, int)  # pages done, pages total
+    finished = pyqtSignal(object)  # the job's return value
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class ImportWorker(QRunnable):
+    """
+    Runs a PDF extraction/parsing job on a QThreadPool thread.
+
+    The job is called as ``job(*args, progress=worker.report_progress)``.
+    It must not touch Krita or any widget; its result is handed back through
+    the ``finished`` signal so the GUI thread can apply it.
+    """
+
+    def __init__(self, job, *args):
+        super().__init__()
+        self.job = job
+        self.args = args
+        self.signals = WorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """Ask the job to stop at its next progress report."""
+        self._cancelled = True
+
+    @property
+    def is_cancelled(self):
+        return self._cancelled
+
+    def report_progress(self, done, total):
+        """Progress callback handed to the job; raises once cancelled."""
+        if self._cancelled:
+            raise ImportCancelled()
+        self.signals.progress.emit(done, total)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.job(*self.args, progress=self.report_progress)
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)